@@ -18,6 +18,8 @@ class TestConvertCommand:
     convertmodule = convert
     defaultoptions = {"progress": "none"}
     expected_options = []
+    # Whether the command offers --jobs
+    jobs_option = True
 
     def setup_method(self, method) -> None:
         """Creates a clean test directory for the given method."""
@@ -142,7 +144,10 @@ class TestConvertCommand:
             "-x EXCLUDE, --exclude=EXCLUDE",
             "-o OUTPUT, --output=OUTPUT",
             "-S, --timestamp",
+            "--manifest=MANIFEST",
         ]
+        if self.jobs_option:
+            base_options.append("--jobs=JOBS")
         for expected in chain(base_options, self.expected_options):
             start = len(options)
             options = [option for option in options if not option.startswith(expected)]
@@ -203,6 +208,87 @@ class TestArchiveConvertOptionParser:
         assert FakeArchive.instances[0].closed is True
         assert (outputdir / "nested" / "file.po").read_bytes() == b"content"
 
+    def test_archives_are_not_processed_in_parallel(self) -> None:
+        parser = convert.ArchiveConvertOptionParser(
+            {"txt": ("po", convert.copyinput)}, archiveformats={}
+        )
+        options = SimpleNamespace(recursiveoutput=True, jobs=2, multifilestyle="single")
+        assert parser.canprocessinparallel(options)
+        parser.outputarchive = BytesIO()
+        assert not parser.canprocessinparallel(options)
+        del parser.outputarchive
+        options.multifilestyle = "onefile"
+        assert not parser.canprocessinparallel(options)
+
+
+class TestConvertManifest:
+    @staticmethod
+    def get_parser(processed):
+        def processor(inputfile, outputfile, templatefile, upper=False):
+            processed.append(os.path.basename(inputfile.name))
+            with templatefile:
+                content = inputfile.read() + templatefile.read()
+            outputfile.write(content.upper() if upper else content)
+            return True
+
+        parser = convert.ConvertOptionParser(
+            {("txt", "txt"): ("po", processor)}, usetemplates=True
+        )
+        parser.add_option("--upper", dest="upper", action="store_true")
+        parser.passthrough.append("upper")
+        return parser
+
+    def run(self, tmp_path, *extra):
+        processed = []
+        parser = self.get_parser(processed)
+        options, _args = parser.parse_args(
+            [
+                "--progress=none",
+                f"--manifest={tmp_path / 'manifest.json'}",
+                str(tmp_path / "input"),
+                str(tmp_path / "output"),
+                "-t",
+                str(tmp_path / "template"),
+                *extra,
+            ]
+        )
+        parser.recursiveprocess(options)
+        return sorted(processed)
+
+    def test_skips_unchanged_files(self, tmp_path) -> None:
+        for name in ("input", "template"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "one.txt").write_text(f"{name} one\n")
+            (tmp_path / name / "two.txt").write_text(f"{name} two\n")
+
+        assert self.run(tmp_path) == ["one.txt", "two.txt"]
+        assert self.run(tmp_path) == []
+        assert (tmp_path / "output" / "one.po").read_text() == (
+            "input one\ntemplate one\n"
+        )
+
+        (tmp_path / "input" / "one.txt").write_text("input changed\n")
+        assert self.run(tmp_path) == ["one.txt"]
+        (tmp_path / "template" / "two.txt").write_text("template changed\n")
+        assert self.run(tmp_path) == ["two.txt"]
+        (tmp_path / "output" / "one.po").unlink()
+        assert self.run(tmp_path) == ["one.txt"]
+        assert self.run(tmp_path, "--upper") == ["one.txt", "two.txt"]
+        assert (tmp_path / "output" / "two.po").read_text() == (
+            "INPUT TWO\nTEMPLATE CHANGED\n"
+        )
+        assert self.run(tmp_path, "--upper") == []
+
+    def test_broken_manifest_is_ignored(self, tmp_path) -> None:
+        (tmp_path / "input").mkdir()
+        (tmp_path / "template").mkdir()
+        (tmp_path / "input" / "one.txt").write_text("input\n")
+        (tmp_path / "template" / "one.txt").write_text("template\n")
+        (tmp_path / "manifest.json").write_text("{broken")
+
+        assert self.run(tmp_path) == ["one.txt"]
+        assert self.run(tmp_path) == []
+
 
 class TestShouldOutputStore:
     @staticmethod
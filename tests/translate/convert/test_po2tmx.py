@@ -198,6 +198,8 @@ class TestPO2TMXCommand(test_convert.TestConvertCommand, TestPO2TMX):
     """Tests running actual po2tmx commands on files."""
 
     convertmodule = po2tmx
+    # All the files go to one TMX file
+    jobs_option = False
 
     expected_options = [
         "-l LANG, --language=LANG",
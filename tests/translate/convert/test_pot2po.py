@@ -4,6 +4,7 @@ from pytest import mark
 
 from translate.convert import pot2po
 from translate.storage import po
+from translate.tools import pretranslate
 
 from . import test_convert
 
@@ -938,7 +939,37 @@ class TestPOT2POCommand(test_convert.TestConvertCommand, TestPOT2PO):
         "-t TEMPLATE, --template=TEMPLATE",
         "-P, --pot",
         "-m MAXLENGTH, --maxlinelength=MAXLENGTH",
-        "--tm",
+        "--tm=TM",
+        "--tm-index=INDEX",
+        "--tm-cache=CACHE",
         "-s MIN_SIMILARITY, --similarity=MIN_SIMILARITY",
         "--nofuzzymatching",
+        "--fuzzy-jobs=JOBS",
     ]
+
+    def test_manifest_tm(self, monkeypatch) -> None:
+        """Test that --manifest converts the files again when the TM changes."""
+        self.create_testfile("pot/one.pot", 'msgid "Hello!"\nmsgstr ""\n')
+        self.create_testfile("tp/one.po", "")
+        self.create_testfile("tm.po", 'msgid "Hello"\nmsgstr "Hallo!"\n')
+
+        def run(*options) -> str:
+            monkeypatch.setattr(pretranslate, "tmmatcher", None)
+            self.run_command(
+                "pot",
+                "po",
+                "-t",
+                "tp",
+                "--manifest=m.json",
+                "--tm=tm.po",
+                "--progress=none",
+                *options,
+            )
+            return self.read_testfile("po/one.po").decode()
+
+        assert 'msgstr "Hallo!"' in run()
+        self.create_testfile("tm.po", 'msgid "Hello"\nmsgstr "Servus!"\n')
+        assert 'msgstr "Servus!"' in run()
+        # Options which do not change the output do not convert again
+        self.create_testfile("po/one.po", "unchanged")
+        assert run("--fuzzy-jobs=2") == "unchanged"
@@ -1,3 +1,5 @@
+import pickle  # ruff:ignore[suspicious-pickle-import]
+
 from pytest import mark
 
 from translate.filters import checks, spelling
@@ -77,6 +79,13 @@ def test_defaults() -> None:
     assert stdchecker.config.varmatches == []
 
 
+def test_pickle() -> None:
+    """Tests that the checkers can be sent to other processes."""
+    stdchecker = checks.StandardChecker()
+    checker = pickle.loads(pickle.dumps(stdchecker))  # ruff:ignore[suspicious-pickle-usage]
+    assert checker.getfilters().keys() == stdchecker.getfilters().keys()
+
+
 def test_construct() -> None:
     """Tests that the checkers can be constructed."""
     checks.StandardChecker()
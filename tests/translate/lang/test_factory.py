@@ -1,3 +1,4 @@
+import pickle  # ruff:ignore[suspicious-pickle-import]
 import pkgutil
 
 import translate.lang as package
@@ -42,6 +43,13 @@ def test_getlanguage() -> None:
     assert language.nplurals == 2
 
 
+def test_pickle() -> None:
+    """Tests that unpickled languages are the language objects."""
+    for code in ("km", "fy", "de_AT"):
+        language = factory.getlanguage(code)
+        assert pickle.loads(pickle.dumps(language)) is language  # ruff:ignore[suspicious-pickle-usage]
+
+
 def test_get_all_languages() -> None:
     """Tests that a basic call to get_all_languages() works."""
 
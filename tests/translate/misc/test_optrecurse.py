@@ -15,6 +15,14 @@ def _noop_processor(inputfile, outputfile, templatefile):
     return True
 
 
+def _upper_processor(inputfile, outputfile, templatefile):
+    content = inputfile.read()
+    if content == b"fail":
+        raise ValueError(content)
+    outputfile.write(content.upper())
+    return True
+
+
 def _make_exc_info(exc):
     """Create an exc_info tuple for testing warning methods."""
     result = None
@@ -1177,3 +1185,76 @@ class TestRecursiveProcess:
         with caplog.at_level(logging.WARNING):
             parser.recursiveprocess(options)
         assert "Error processing" in caplog.text
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_processes_in_parallel(self, tmp_path, monkeypatch, caplog, jobs) -> None:
+        reported = []
+
+        def report_progress(self, filename, success) -> None:
+            errors = [record for record in caplog.records if "Error" in record.msg]
+            reported.append((filename, success, len(errors)))
+
+        monkeypatch.setattr(optrecurse.ProgressBar, "report_progress", report_progress)
+        parser = optrecurse.RecursiveOptionParser({"txt": ("po", _upper_processor)})
+        inputdir = tmp_path / "input"
+        (inputdir / "sub").mkdir(parents=True)
+        (inputdir / "b.txt").write_bytes(b"bee")
+        (inputdir / "sub" / "a.txt").write_bytes(b"ay")
+        (inputdir / "fail.txt").write_bytes(b"fail")
+        options = SimpleNamespace(
+            input=str(inputdir),
+            output=str(tmp_path / "output"),
+            template=None,
+            progress="none",
+            errorlevel="message",
+            exclude=[],
+            jobs=jobs,
+        )
+
+        with caplog.at_level(logging.WARNING):
+            parser.recursiveprocess(options)
+
+        # The warnings of the workers come with the progress of their file
+        assert reported == [
+            ("b.txt", True, 0),
+            ("fail.txt", False, 1),
+            (os.path.join("sub", "a.txt"), True, 1),
+        ]
+        assert "fail.txt" in caplog.records[-1].getMessage()
+        assert (tmp_path / "output" / "b.po").read_bytes() == b"BEE"
+        assert (tmp_path / "output" / "sub" / "a.po").read_bytes() == b"AY"
+
+    def test_parallel_fallback(self, tmp_path, caplog) -> None:
+        parser = optrecurse.RecursiveOptionParser(
+            {"txt": ("po", lambda inputfile, outputfile, templatefile: True)}
+        )
+        inputdir = tmp_path / "input"
+        inputdir.mkdir()
+        (inputdir / "a.txt").write_bytes(b"ay")
+        (inputdir / "b.txt").write_bytes(b"bee")
+        options = SimpleNamespace(
+            input=str(inputdir),
+            output=str(tmp_path / "output"),
+            template=None,
+            progress="none",
+            errorlevel="message",
+            exclude=[],
+            jobs=2,
+        )
+        with caplog.at_level(logging.WARNING):
+            parser.recursiveprocess(options)
+        assert "ignoring --jobs" in caplog.text
+        assert (tmp_path / "output" / "b.po").exists()
+
+    def test_parallel_needs_output_dir_and_pickling(self) -> None:
+        parser = optrecurse.RecursiveOptionParser({"txt": ("po", _upper_processor)})
+        options = SimpleNamespace(recursiveoutput=True, jobs=2)
+        assert parser.canprocessinparallel(options)
+        options.recursiveoutput = False
+        assert not parser.canprocessinparallel(options)
+
+        parser = optrecurse.RecursiveOptionParser(
+            {"txt": ("po", lambda inputfile, outputfile, templatefile: True)}
+        )
+        options.recursiveoutput = True
+        assert not parser.canprocessinparallel(options)
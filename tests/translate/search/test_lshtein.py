@@ -13,6 +13,30 @@ class TestLevenshtein:
         assert lshtein.distance("words", "word") == 1
         assert lshtein.distance("word", "woord") == 1
 
+    def test_python_distance(self) -> None:
+        """Tests the pure Python distance calculation."""
+        distance = lshtein.python_distance
+        assert distance("word", "word") == 0
+        assert distance("word", "") == 4
+        assert distance("", "word") == 4
+        assert distance("word", "word 2") == 2
+        assert distance("words", "word") == 1
+        assert distance("word", "woord") == 1
+        assert distance("kitten", "sitting") == 3
+        assert distance("abcdef", "x") == 6
+        assert distance(["open", "the", "file"], ["open", "a", "file"]) == 1
+        long_a = "A long, dreary sentence about a cow that never new his mother." * 2
+        long_b = long_a.replace("cow", "horse")
+        assert distance(long_a, long_b) == 8
+
+    def test_python_distance_stopvalue(self) -> None:
+        """Tests that the calculation gives up beyond the stopvalue."""
+        distance = lshtein.python_distance
+        assert distance("kitten", "sitting", 3) == 3
+        assert distance("kitten", "sitting", 2) > 2
+        assert distance("abcdefgh", "hgfedcba", 1) > 1
+        assert distance("word", "a much longer text", 2) > 2
+
     def test_basic_similarity(self) -> None:
         """Tests similarity correctness with a few basic values."""
         levenshtein = lshtein.LevenshteinComparer()
@@ -32,3 +56,44 @@ class TestLevenshtein:
         # since the sentence is long it might be chopped and report higher.
         assert levenshtein.similarity(sentence, sentence[0:62], 0) > 25
         assert levenshtein.similarity(sentence, sentence[0:62], 0) < 50
+
+    def test_similarity_many(self) -> None:
+        """Tests that bulk scoring agrees with scoring single strings."""
+        sentence = "A long, dreary sentence about a cow that never new his mother. Actually it didn't known its father either."
+        candidates = [
+            "word",
+            "words",
+            "wood",
+            "",
+            "bbb",
+            sentence,
+            sentence[0:62],
+            sentence[:-1] + "!",
+        ]
+        levenshtein = lshtein.LevenshteinComparer(max_len=70)
+        for text in ("word", sentence):
+            for stoppercentage in (0, 40, 75):
+                expected = [
+                    (
+                        index,
+                        levenshtein.similarity_real(text, candidate, stoppercentage),
+                    )
+                    for index, candidate in enumerate(candidates)
+                ]
+                assert levenshtein.similarity_many(
+                    text, candidates, stoppercentage
+                ) == [
+                    (index, similarity)
+                    for index, similarity in expected
+                    if similarity >= stoppercentage
+                ]
+        assert levenshtein.similarity_many("word", [], 40) == []
+
+    def test_similarity_many_fallback(self, monkeypatch) -> None:
+        """Tests bulk scoring without RapidFuzz."""
+        monkeypatch.setattr(lshtein, "process", None)
+        levenshtein = lshtein.LevenshteinComparer()
+        assert levenshtein.similarity_many("word", ["wood", "bbb", "word"], 75) == [
+            (0, 75),
+            (2, 100),
+        ]
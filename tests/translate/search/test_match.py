@@ -1,5 +1,5 @@
 from translate.search import match
-from translate.storage import csvl10n
+from translate.storage import csvl10n, po
 
 
 class TestMatch:
@@ -131,3 +131,183 @@ class TestMatch:
         assert candidates == ["preorder"]
         candidates = self.candidatestrings(matcher.matches("You can pre order"))
         assert candidates == ["pre order"]
+
+    def test_ngram_index(self) -> None:
+        """Test that the n-gram index does not change the results."""
+        sources = [
+            "Open file",
+            "Open the file",
+            "Open the files",
+            "Open a file...",
+            "Close the file",
+            "Close the window",
+            "Save the file as",
+            "Remove all bookmarks",
+            "hand",
+            "pond",
+        ]
+        csvfile = self.buildcsv(sources)
+        plain = match.matcher(csvfile, max_candidates=1, min_similarity=50)
+        indexed = match.matcher(
+            csvfile, max_candidates=1, min_similarity=50, ngram_size=3
+        )
+        assert indexed.ngramindex is not None
+        assert len(indexed.ngramindex) == len(sources)
+        for text in [*sources, "Open the filez", "hond", "Save file as"]:
+            assert self.candidatestrings(
+                indexed.matches(text)
+            ) == self.candidatestrings(plain.matches(text))
+
+        indexed.extendtm(self.buildcsv(["Open file..."]).units)
+        assert self.candidatestrings(indexed.matches("Open file..."))[0] == (
+            "Open file..."
+        )
+
+    def test_matches_many(self) -> None:
+        csvfile = self.buildcsv(
+            ["Open file", "Open the file", "Close the file", "hand", "pond"]
+        )
+        matcher = match.matcher(csvfile)
+        texts = ["Open files", "hond", "Open files", "Nothing alike"]
+        expected = [self.candidatestrings(matcher.matches(text)) for text in texts]
+        for processes in (1, 2):
+            results = matcher.matches_many(texts, processes=processes)
+            assert [self.candidatestrings(units) for units in results] == expected
+        # Every text gets its own units
+        results = matcher.matches_many(texts)
+        assert results[0][0] is not results[2][0]
+
+    def test_terminology_extendtm(self) -> None:
+        """Tests that terms added after creation are found."""
+        csvfile = self.buildcsv(["file", "computer"])
+        matcher = match.terminologymatcher(csvfile)
+        text = "Copy the files from your computer folder"
+        assert sorted(self.candidatestrings(matcher.matches(text))) == [
+            "computer",
+            "file",
+        ]
+        assert matcher.match_info["computer"] == {"pos": 25}
+        matcher.extendtm(self.buildcsv(["folder"]).units)
+        assert sorted(self.candidatestrings(matcher.matches(text))) == [
+            "computer",
+            "file",
+            "folder",
+        ]
+
+    def test_candidate_store(self) -> None:
+        """Tests the compact storage of candidates."""
+        csvfile = self.buildcsv(["Open the file", "hand", "Close", "hand"])
+        matcher = match.matcher(csvfile)
+        candidates = matcher.candidates
+        assert len(candidates) == 3
+        assert all(isinstance(unit, match.Candidate) for unit in candidates.units)
+        assert [unit.source for unit in candidates.units] == [
+            "hand",
+            "Close",
+            "Open the file",
+        ]
+        assert list(candidates.lengths) == [4, 5, 13]
+        matcher.extendtm(self.buildcsv(["Save"]).units)
+        assert list(candidates.lengths) == [4, 4, 5, 13]
+
+    def test_incremental_extendtm(self) -> None:
+        """Tests that units added to a TM are inserted at their place."""
+        sources = ["Open the file", "hand", "Close", "Save the file", "pond"]
+        matcher = match.matcher(self.buildcsv(sources[:3]), ngram_size=3)
+        for source in sources[3:]:
+            matcher.extendtm(self.buildcsv([source]).units)
+        sorted_matcher = match.matcher(self.buildcsv(sources))
+        assert [unit.source for unit in matcher.candidates.units] == [
+            unit.source for unit in sorted_matcher.candidates.units
+        ]
+        assert list(matcher.candidates.lengths) == [4, 4, 5, 13, 13]
+
+    def test_replace_tm(self) -> None:
+        """Tests replacing and removing TM entries."""
+        matcher = match.matcher(
+            self.buildcsv(["Open file", "Close file"], ["Maak oop", "Maak toe"]),
+            ngram_size=3,
+        )
+        fingerprint = matcher.fingerprint()
+        matcher.extendtm(
+            self.buildcsv(["Open file"], ["Open lêer"]).units, replace=True
+        )
+        assert fingerprint != matcher.fingerprint()
+        assert [unit.target for unit in matcher.matches("Open file")] == ["Open lêer"]
+        assert len(matcher.candidates) == len(matcher.ngramindex) == 2
+        # Without replace, the translations are alternatives
+        matcher.extendtm(self.buildcsv(["Open file"], ["Maak oop"]).units)
+        assert sorted(unit.target for unit in matcher.matches("Open file")) == [
+            "Maak oop",
+            "Open lêer",
+        ]
+        matcher.removetm("Open file")
+        assert matcher.matches("Open file") == []
+        assert "Open file" not in matcher.existingunits
+        assert list(matcher.candidates.lengths) == [10]
+        assert len(matcher.ngramindex) == 1
+
+    def test_plural_candidates(self) -> None:
+        """Tests that plural forms survive in the built units."""
+        pofile = po.pofile(
+            """msgid "%d file"
+msgid_plural "%d files"
+msgstr[0] "%d lêer"
+msgstr[1] "%d lêers"
+""".encode()
+        )
+        matcher = match.matcher(pofile)
+        for _ in range(2):
+            units = matcher.matches("%d file")
+            assert units[0].source.strings == ["%d file", "%d files"]
+            assert units[0].target.strings == ["%d lêer", "%d lêers"]
+        # The stored candidate keeps the plain string
+        assert type(matcher.candidates.units[0].source) is str
+
+    def test_match_cache(self, tmp_path) -> None:
+        """Tests caching of matching results."""
+        cache = match.MatchCache()
+        csvfile = self.buildcsv(["hand", "asdf", "fdas", "haas", "pond"])
+        matcher = match.matcher(csvfile, cache=cache)
+        assert sorted(self.candidatestrings(matcher.matches("hond"))) == [
+            "hand",
+            "pond",
+        ]
+        assert cache.stats() == {"hits": 0, "misses": 1, "size": 1}
+        assert sorted(self.candidatestrings(matcher.matches("hond"))) == [
+            "hand",
+            "pond",
+        ]
+        matcher.matches_many(["hond", "hand"])
+        assert cache.stats() == {"hits": 2, "misses": 2, "size": 2}
+
+        # Another matcher with the same TM shares the results
+        other = match.matcher(self.buildcsv(["hand", "asdf", "fdas", "haas", "pond"]))
+        assert other.fingerprint() == matcher.fingerprint()
+
+        # Changing the TM changes the key
+        fingerprint = matcher.fingerprint()
+        matcher.extendtm(self.buildcsv(["honds"]).units)
+        assert matcher.fingerprint() != fingerprint
+        assert "honds" in self.candidatestrings(matcher.matches("hond"))
+        assert cache.misses == 3
+
+        # Persisting the cache
+        cache.filename = tmp_path / "cache"
+        cache.save()
+        loaded = match.MatchCache(filename=tmp_path / "cache")
+        assert len(loaded) == 3
+        matcher.cache = loaded
+        assert "honds" in self.candidatestrings(matcher.matches("hond"))
+        assert loaded.hits == 1
+
+    def test_match_cache_size(self) -> None:
+        cache = match.MatchCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        # "b" was the least recently used
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
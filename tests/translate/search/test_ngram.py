@@ -0,0 +1,58 @@
+from translate.search import ngram
+from translate.storage import base
+
+
+def buildunits(sources):
+    return [base.TranslationUnit(source) for source in sources]
+
+
+class TestNgramIndex:
+    def test_grams(self) -> None:
+        index = ngram.NgramIndex(3)
+        assert index.grams("abcab") == {"abc": 1, "bca": 1, "cab": 1}
+        assert index.grams("aaaa") == {"aaa": 2}
+        assert index.grams("ab") == {}
+
+    def test_shortlist(self) -> None:
+        units = buildunits(
+            [
+                "Open the file",
+                "Open the files",
+                "Close the window",
+                "Remove all bookmarks",
+                "xyzzy plugh grault",
+            ]
+        )
+        index = ngram.NgramIndex(3)
+        for unit in units:
+            index.add(unit)
+        assert len(index) == 5
+        shortlist = index.shortlist("Open the file", 75, 1, 100)
+        # "Close the window" shares enough trigrams to survive the filter
+        assert [unit.source for unit in shortlist] == [
+            "Open the file",
+            "Open the files",
+            "Close the window",
+        ]
+        # Length window is respected
+        assert index.shortlist("Open the file", 75, 14, 15) == [units[1]]
+
+    def test_short_strings_are_kept(self) -> None:
+        """Count filtering can not prune very short strings."""
+        units = buildunits(["hand", "pond", "xyzw"])
+        index = ngram.NgramIndex(3)
+        for unit in units:
+            index.add(unit)
+        assert index.shortlist("hond", 75, 1, 10) == units
+
+    def test_remove(self) -> None:
+        units = buildunits(["Open the file", "Open the files"])
+        index = ngram.NgramIndex(3)
+        for unit in units:
+            index.add(unit)
+        index.remove(units[0])
+        assert len(index) == 1
+        assert index.shortlist("Open the file", 75, 1, 100) == [units[1]]
+        index.remove(units[1])
+        assert not index.postings
+        assert not index.lengths
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from translate.search import match, server, tmindex
+from translate.storage import csvl10n
+
+
+def buildcsv(sources, targets):
+    csvfile = csvl10n.csvfile()
+    for source, target in zip(sources, targets, strict=True):
+        unit = csvfile.addsourceunit(source)
+        unit.target = target
+    return csvfile
+
+
+def buildserver(**kwargs):
+    tmmatcher = match.matcher(
+        buildcsv(
+            ["Open the file", "Close the file", "hand"],
+            ["Maak die lêer oop", "Maak die lêer toe", "hand"],
+        )
+    )
+    termmatcher = match.terminologymatcher(
+        buildcsv(["file", "computer"], ["lêer", "rekenaar"])
+    )
+    return server.TMServer(tmmatcher, termmatcher, **kwargs)
+
+
+class TestTMServer:
+    def test_batching(self) -> None:
+        """Tests that concurrent lookups are handled in a single batch."""
+
+        async def lookup():
+            tmserver = buildserver(batch_delay=0.1)
+            await tmserver.start(port=0)
+            try:
+                return tmserver, await asyncio.gather(
+                    tmserver.lookup("matches", "Open the files"),
+                    tmserver.lookup("matches", "hond"),
+                    tmserver.lookup("matches", "Nothing alike"),
+                    tmserver.lookup("terminology", "Copy the file"),
+                )
+            finally:
+                await tmserver.close()
+
+        tmserver, (opened, hond, nothing, terms) = asyncio.run(lookup())
+        assert [unit["target"] for unit in opened] == ["Maak die lêer oop"]
+        assert opened[0]["quality"] == "92"
+        assert [unit["source"] for unit in hond] == ["hand"]
+        assert nothing == []
+        assert [unit["target"] for unit in terms] == ["lêer"]
+        stats = tmserver.stats()
+        assert stats["requests"] == 4
+        assert stats["batches"] == 2
+        assert stats["average_batch"] == 2
+        assert stats["max_latency"] >= stats["average_latency"] > 0
+
+    def test_client(self, tmp_path) -> None:
+        """Tests lookups over a Unix socket."""
+        path = str(tmp_path / "tm.sock")
+
+        def lookup():
+            with server.TMClient(path, timeout=10) as client:
+                matches = client.matches("Close the file")
+                terms = client.terminology("My computer")
+                with pytest.raises(ValueError, match="Unsupported"):
+                    client.request("translate", "file")
+                return matches, terms, client.stats()
+
+        async def run():
+            tmserver = buildserver()
+            await tmserver.start(path)
+            try:
+                return await asyncio.to_thread(lookup)
+            finally:
+                await tmserver.close()
+
+        matches, terms, stats = asyncio.run(run())
+        assert matches[0]["target"] == "Maak die lêer toe"
+        assert terms[0]["target"] == "rekenaar"
+        assert stats["requests"] == 2
+        assert stats["errors"] == 1
+
+    def test_main_keeps_index(self, tmp_path, monkeypatch) -> None:
+        """Tests that starting with only an index does not empty it."""
+        tmfile = tmp_path / "tm.csv"
+        tmfile.write_bytes(bytes(buildcsv(["Open the file"], ["Maak die lêer oop"])))
+        indexfile = str(tmp_path / "tm.sqlite")
+        with tmindex.TMIndex(indexfile) as index:
+            index.update([tmfile])
+        served = []
+
+        async def serve(tmserver, *args) -> None:
+            served.append(tmserver)
+            await tmserver.close()
+
+        monkeypatch.setattr(server, "serve", serve)
+        server.main(["--tm-index", indexfile])
+        with tmindex.TMIndex(indexfile) as index:
+            assert len(index) == 1
+        matches = served[0].matchers["matches"].matches("Open the files")
+        assert [unit.target for unit in matches] == ["Maak die lêer oop"]
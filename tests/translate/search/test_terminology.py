@@ -8,3 +8,11 @@ class TestTerminology:
         """Tests basic functionality."""
         termmatcher = terminology.TerminologyComparer()
         assert termmatcher.similarity("Open the file", "file") > 75
+
+    def test_automaton(self) -> None:
+        """Tests finding many terms in a single pass."""
+        automaton = terminology.TermAutomaton(["he", "she", "his", "hers", "file"])
+        assert automaton.find("ushers") == {"she": 1, "he": 2, "hers": 2}
+        assert automaton.find("he said his file") == {"he": 0, "his": 8, "file": 12}
+        assert automaton.find("nothing") == {}
+        assert terminology.TermAutomaton([]).find("text") == {}
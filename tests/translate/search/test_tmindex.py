@@ -0,0 +1,101 @@
+import os
+
+from translate.search import match, tmindex
+
+PO_SOURCE = """
+# A translator comment
+msgid "Open the file"
+msgstr "Maak die lêer oop"
+
+#, fuzzy
+msgid "Close the file"
+msgstr "Maak die lêer toe"
+
+msgid "Untranslated"
+msgstr ""
+
+msgid "%d file"
+msgid_plural "%d files"
+msgstr[0] "%d lêer"
+msgstr[1] "%d lêers"
+"""
+
+
+def write_tm(path, content=PO_SOURCE, mtime=None) -> None:
+    path.write_text(content, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+class TestTMIndex:
+    def test_index(self, tmp_path) -> None:
+        tmfile = tmp_path / "tm.po"
+        write_tm(tmfile)
+        with tmindex.TMIndex(tmp_path / "tm.db") as index:
+            assert index.update([tmfile])
+            units = list(index.units)
+        assert [str(unit.source) for unit in units] == [
+            "Open the file",
+            "Close the file",
+            "%d file",
+        ]
+        assert units[0].getnotes() == "A translator comment"
+        assert not units[0].isfuzzy()
+        assert units[1].isfuzzy()
+        assert units[2].source.strings == ["%d file", "%d files"]
+        assert units[2].target.strings == ["%d lêer", "%d lêers"]
+
+    def test_update(self, tmp_path) -> None:
+        tmfile = tmp_path / "tm.po"
+        otherfile = tmp_path / "other.po"
+        write_tm(tmfile, mtime=1_000_000_000)
+        write_tm(otherfile, 'msgid "Save"\nmsgstr "Stoor"\n')
+        dbfile = tmp_path / "tm.db"
+        with tmindex.TMIndex(dbfile) as index:
+            assert index.update([tmfile, otherfile])
+            assert len(index) == 4
+        with tmindex.TMIndex(dbfile) as index:
+            # Unchanged files are not parsed again
+            assert not index.update([tmfile, otherfile])
+            assert len(index) == 4
+            write_tm(tmfile, 'msgid "Open"\nmsgstr "Oop"\n', mtime=2_000_000_000)
+            assert index.update([tmfile, otherfile])
+            assert [unit.source for unit in index.units] == ["Open", "Save"]
+            # Files not listed any more are dropped
+            assert index.update(str(otherfile))
+            assert [unit.source for unit in index.units] == ["Save"]
+
+    def test_matcher(self, tmp_path) -> None:
+        tmfile = tmp_path / "tm.po"
+        write_tm(tmfile)
+        with tmindex.TMIndex(tmp_path / "tm.db") as index:
+            index.update([tmfile])
+            matcher = match.matcher(index)
+        candidates = matcher.matches("Open the files")
+        assert [unit.source for unit in candidates] == ["Open the file"]
+        assert candidates[0].target == "Maak die lêer oop"
+        # Fuzzy units are not used by default
+        assert matcher.matches("Close the files") == []
+
+    def test_matcher_cached(self, tmp_path, monkeypatch) -> None:
+        tmfile = tmp_path / "tm.po"
+        dbfile = tmp_path / "tm.db"
+        write_tm(tmfile, mtime=1_000_000_000)
+        with tmindex.TMIndex(dbfile) as index:
+            index.update([tmfile])
+            matcher = match.matcher(index, ngram_size=3)
+        with tmindex.TMIndex(dbfile) as index, monkeypatch.context() as patch:
+            assert not index.update([tmfile])
+            # The candidates are loaded from the index, not rebuilt
+            patch.setattr(tmindex.TMIndex, "units", ())
+            cached = match.matcher(index, ngram_size=3)
+        assert cached.fingerprint() == matcher.fingerprint()
+        assert [unit.source for unit in cached.matches("Open the files")] == [
+            "Open the file"
+        ]
+        with tmindex.TMIndex(dbfile) as index:
+            write_tm(tmfile, 'msgid "Open"\nmsgstr "Oop"\n', mtime=2_000_000_000)
+            assert index.update([tmfile])
+            rebuilt = match.matcher(index, ngram_size=3)
+        assert rebuilt.fingerprint() != matcher.fingerprint()
+        assert rebuilt.matches("Open the files") == []
@@ -479,6 +479,27 @@ certificate.">
         dtdregen = self.dtdregen(dtdsource)
         assert dtdsource == dtdregen
 
+    def test_passthrough(self) -> None:
+        """Test that only changed units are normalized in passthrough mode."""
+        dtdsource = """<!-- Comment -->
+<!ENTITY one   "One">
+<!ENTITY two "Two" >
+
+<!ENTITY % brand
+ SYSTEM "chrome://brand.dtd">
+%brand;
+"""
+        dtdfile = dtd.dtdfile(BytesIO(dtdsource.encode()), passthrough=True)
+        assert bytes(dtdfile).decode() == dtdsource
+        # Normalized by default
+        assert "% brand SYSTEM" in bytes(self.dtdparse(dtdsource)).decode()
+        dtdfile.units[1].target = "Twee"
+        dtdfile.units[3].addlocation("realBrand")
+        assert bytes(dtdfile).decode() == dtdsource.replace("Two", "Twee").replace(
+            '% brand\n SYSTEM "chrome://brand.dtd"',
+            '% realBrand SYSTEM "chrome://brand.dtd"',
+        )
+
 
 class TestAndroidDTD(test_monolingual.TestMonolingualStore):
     StoreClass = dtd.dtdfile
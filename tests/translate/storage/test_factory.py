@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 from bz2 import BZ2File
 from gzip import GzipFile
 from io import BytesIO
@@ -23,27 +25,12 @@ def givefile(filename, content):
 
 class BaseTestFactory:
     def setup_method(self, method) -> None:
-        """Sets up a test directory."""
-        self.testdir = f"{self.__class__.__name__}_testdir"
-        self.cleardir(self.testdir)
-        os.mkdir(self.testdir)
+        """Sets up a test directory, separate for tests running in parallel."""
+        self.testdir = tempfile.mkdtemp(prefix=f"{self.__class__.__name__}_")
 
     def teardown_method(self, method) -> None:
         """Removes the attributes set up by setup_method."""
-        self.cleardir(self.testdir)
-
-    @staticmethod
-    def cleardir(dirname) -> None:
-        """Removes the given directory."""
-        if os.path.exists(dirname):
-            for dirpath, subdirs, filenames in os.walk(dirname, topdown=False):
-                for name in filenames:
-                    os.remove(os.path.join(dirpath, name))
-                for name in subdirs:
-                    os.rmdir(os.path.join(dirpath, name))
-        if os.path.exists(dirname):
-            os.rmdir(dirname)
-        assert not os.path.exists(dirname)
+        shutil.rmtree(self.testdir)
 
     def test_getclass(self) -> None:
         assert classname("file.po") == "pofile"
@@ -119,6 +106,23 @@ class BaseTestFactory:
         store = factory.getobject(filename)
         assert isinstance(store, self.expected_instance)  # ty:ignore[unresolved-attribute]
 
+    def test_cache(self) -> None:
+        """Test that unchanged files are loaded from the cache."""
+        filename = os.path.join(self.testdir, self.filename)  # ty:ignore[unresolved-attribute]
+        with open(filename, "wb") as handle:
+            handle.write(self.file_content)  # ty:ignore[unresolved-attribute]
+        cachedir = os.path.join(self.testdir, "cache")
+        store = factory.getobject(filename, cache=cachedir)
+        cached = factory.getobject(filename, cache=cachedir)
+        assert isinstance(cached, self.expected_instance)  # ty:ignore[unresolved-attribute]
+        assert bytes(cached) == bytes(store)
+        # Changed files are parsed again
+        with open(filename, "wb") as handle:
+            handle.write(self.file_content.replace(b"rest", b"best"))  # ty:ignore[unresolved-attribute]
+        os.utime(filename, ns=(0, 0))
+        changed = factory.getobject(filename, cache=cachedir)
+        assert bytes(changed) == bytes(factory.getobject(filename))
+
     def test_directory(self) -> None:
         """Test that a directory is correctly detected."""
         with pytest.raises(ValueError):
@@ -130,6 +134,37 @@ class TestPOFactory(BaseTestFactory):
     filename = "dummy.po"
     file_content = b"""#: test.c\nmsgid "test"\nmsgstr "rest"\n"""
 
+    def test_cache_eviction(self, monkeypatch) -> None:
+        """Test that the cache is kept below its size."""
+        filename = os.path.join(self.testdir, self.filename)
+        with open(filename, "wb") as handle:
+            handle.write(self.file_content)
+        cachedir = os.path.join(self.testdir, "cache")
+        factory.getobject(filename, cache=cachedir)
+        assert len(os.listdir(cachedir)) == 1
+        monkeypatch.setattr(factory, "cachesize", 0)
+        os.utime(filename, ns=(0, 0))
+        factory.getobject(filename, cache=cachedir)
+        assert os.listdir(cachedir) == []
+
+    def test_cache_unreadable(self) -> None:
+        """Test that cache entries failing to load are parsed again."""
+        filename = os.path.join(self.testdir, self.filename)
+        with open(filename, "wb") as handle:
+            handle.write(self.file_content)
+        cachedir = os.path.join(self.testdir, "cache")
+        factory.getobject(filename, cache=cachedir)
+        (entry,) = os.listdir(cachedir)
+        cachefile = os.path.join(cachedir, entry)
+        # Unpickling calls int("broken"), which raises ValueError
+        with open(cachefile, "wb") as handle:
+            handle.write(b"cbuiltins\nint\n(Vbroken\ntR.")
+        store = factory.getobject(filename, cache=cachedir)
+        assert store.units[0].target == "rest"
+        assert os.listdir(cachedir) == [entry]
+        with open(cachefile, "rb") as handle:
+            assert not handle.read().startswith(b"cbuiltins")
+
 
 class TestXliffFactory(BaseTestFactory):
     expected_instance = xliff.Xliff1File
@@ -3,7 +3,10 @@ import subprocess
 import sys
 from io import BytesIO
 
-from translate.storage import factory, mo
+from pytest import raises
+
+from translate.misc.multistring import multistring
+from translate.storage import base, factory, mo
 from translate.tools import pocompile
 
 from . import test_base
@@ -12,6 +15,13 @@ MO_BIG_ENDIAN = b"\x95\x04\x12\xde\x00\x00\x00\x2a\x00\x00\x00\x02\x00\x00\x00\x
 MO_LITTLE_ENDIAN = b"\xde\x12\x04\x95\x2a\x00\x00\x00\x02\x00\x00\x00\x1c\x00\x00\x00,\x00\x00\x00\x05\x00\x00\x00<\x00\x00\x00\x06\x00\x00\x00P\x00\x00\x00\x07\x00\x00\x00W\x00\x00\x00\x03\x00\x00\x00_\x00\x00\x00\x06\x00\x00\x00c\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00simple\x00unicode\x00Een\x00\xe2\x80\xa0wee\x00"
 
 
+def test_hashpjw() -> None:
+    assert mo.hashpjw(b"simple") == 127944485
+    assert mo.hashpjw(b"a long message to overflow the hash word") == 207494708
+    # Plural messages are hashed by their singular source
+    assert mo.hashpjw(b"file\0files") == mo.hashpjw(b"file")
+
+
 class TestMOUnit(test_base.TestTranslationUnit):
     UnitClass = mo.mounit
 
@@ -583,3 +593,100 @@ class TestMOFile(test_base.TestTranslationStore):
         store_big = self.StoreClass(MO_BIG_ENDIAN)
         store_little = self.StoreClass(MO_LITTLE_ENDIAN)
         assert store_big.units == store_little.units
+
+    def test_lazy_units(self, monkeypatch, tmp_path) -> None:
+        store = self.StoreClass()
+        for source, target in (("one", "een"), ("two", "twee"), ("", "")):
+            unit = self.StoreClass.UnitClass(source)
+            unit.target = target
+            store.addunit(unit)
+        store.units[-1].target = "Content-Type: text/plain; charset=UTF-8\n"
+        unit = self.StoreClass.UnitClass(multistring(["file", "files"]))
+        unit.target = multistring(["lêer", "lêers"])
+        store.addunit(unit)
+        moname = tmp_path / "test.mo"
+        moname.write_bytes(bytes(store))
+
+        monkeypatch.setattr(self.StoreClass, "lazy_units", True)
+        for lazystore in (
+            self.StoreClass.parsestring(bytes(store)),
+            self.StoreClass.mapfile(str(moname)),
+        ):
+            assert lazystore._content is not None
+            assert lazystore.translate("two") == "twee"
+            assert lazystore.translate("file") == "lêer"
+            assert lazystore.findunit("three") is None
+            assert lazystore.findunit("") is None
+            # Only the messages looked up are decoded
+            assert len(lazystore._lazycache) == 2
+            unit = lazystore.findunit("two")
+            assert lazystore.units[-1] is unit
+            assert lazystore._content is None
+            assert lazystore.units == self.StoreClass.parsestring(bytes(store)).units
+
+    def test_lazy_context(self, monkeypatch) -> None:
+        store = self.StoreClass()
+        unit = self.StoreClass.UnitClass("source")
+        unit.target = "target"
+        unit.setcontext("context")
+        store.addunit(unit)
+
+        monkeypatch.setattr(self.StoreClass, "lazy_units", True)
+        newstore = self.StoreClass.parsestring(bytes(store))
+        assert newstore._ambiguous
+        # Only found in the index of all the units
+        assert newstore.translate("source") == "target"
+        assert newstore._content is None
+
+    def test_lazy_no_hashtable(self, monkeypatch, tmp_path) -> None:
+        store = self.StoreClass()
+        unit = self.StoreClass.UnitClass("source")
+        unit.target = "target"
+        store.addunit(unit)
+        # Like the files of msgfmt.py and Babel, with a hash table size of 0
+        content = bytearray(bytes(store))
+        content[20:24] = bytes(4)
+        moname = tmp_path / "test.mo"
+        moname.write_bytes(content)
+
+        monkeypatch.setattr(self.StoreClass, "lazy_units", True)
+        for lazystore in (
+            self.StoreClass.parsestring(bytes(content)),
+            self.StoreClass.mapfile(str(moname)),
+        ):
+            assert lazystore.translate("source") == "target"
+            assert lazystore.findunit("missing") is None
+
+    def test_mixed_context(self, monkeypatch) -> None:
+        store = self.StoreClass()
+        for context, target in (("context", "with"), (None, "without")):
+            unit = self.StoreClass.UnitClass("source")
+            unit.target = target
+            if context:
+                unit.setcontext(context)
+            store.addunit(unit)
+        content = bytes(store)
+
+        for lazy in (False, True):
+            monkeypatch.setattr(self.StoreClass, "lazy_units", lazy)
+            newstore = self.StoreClass.parsestring(content)
+            assert newstore.translate("source") == "without"
+            # Also once all the units are created
+            newstore.units  # ruff:ignore[useless-expression]
+            assert newstore.translate("source") == "without"
+
+    def test_empty_roundtrip(self, monkeypatch) -> None:
+        content = bytes(self.StoreClass())
+        for lazy in (False, True):
+            monkeypatch.setattr(self.StoreClass, "lazy_units", lazy)
+            store = self.StoreClass.parsestring(content)
+            assert store.findunit("missing") is None
+            assert store.units == []
+
+    def test_truncated(self) -> None:
+        store = self.StoreClass()
+        unit = self.StoreClass.UnitClass("source")
+        unit.target = "target"
+        store.addunit(unit)
+        with raises(base.ParseError):
+            self.StoreClass.parsestring(bytes(store)[:32])
@@ -1343,6 +1343,30 @@ key=value
         assert len(propfile.units) == 1
         assert bytes(propfile).decode() == propsource
 
+    def test_passthrough(self) -> None:
+        """Test that only changed units are normalized in passthrough mode."""
+        propsource = "# Comment\nkey1 = Value one\nkey2 :  Value two\nkey3=Three \\\n    lines\nlast = no newline"
+        propfile = properties.propfile(
+            BytesIO(propsource.encode()), "java", passthrough=True
+        )
+        # Normalized by default
+        assert b"key1=Value one\n" in bytes(self.propparse(propsource))
+        assert bytes(propfile).decode() == (
+            "# Comment\nkey1 = Value one\nkey2 :  Value two\nkey3=Three \\\n    lines\nlast=no newline\n"
+        )
+        propfile.units[2].target = "Drie"
+        propfile.units[0].addnote("Note")
+        assert bytes(propfile).decode() == (
+            "# Comment\n// Note\nkey1=Value one\nkey2 :  Value two\nkey3=Drie\nlast=no newline\n"
+        )
+        # A different encoding writes all the units again
+        propfile.encoding = "utf-8"
+        assert (
+            bytes(propfile)
+            .decode()
+            .startswith("# Comment\n// Note\nkey1=Value one\nkey2:Value two\n")
+        )
+
 
 class TestXWiki(test_monolingual.TestMonolingualStore):
     StoreClass = properties.xwikifile
@@ -1,3 +1,4 @@
+import pickle  # ruff:ignore[suspicious-pickle-import]
 from copy import copy
 from io import BytesIO
 from typing import SupportsIndex
@@ -6,7 +7,7 @@ from pytest import mark, raises
 
 from translate.__version__ import sver
 from translate.misc.multistring import multistring
-from translate.storage import pypo
+from translate.storage import poparser, pypo
 
 from . import test_po
 
@@ -75,6 +76,24 @@ class TestHelpers:
             '"obhucabhuca ukudibanisa kwakho.</b>"',
         ]
 
+    def test_quoteforpo_cache(self) -> None:
+        """Test that cached quoted lines are not shared between callers."""
+        text = (
+            "A very long sentence. A very long sentence. A very long sentence. A very"
+        )
+        lines = pypo.quoteforpo(text)
+        lines.append('"changed"')
+        assert pypo.quoteforpo(text) == lines[:-1]
+        assert pypo.quoteforpo(text, pypo.PoWrapper(40)) == [
+            '""',
+            '"A very long sentence. A very long "',
+            '"sentence. A very long sentence. A very"',
+        ]
+        # Short strings are only quoted on one line when they fit the width
+        assert pypo.quoteforpo("Short", pypo.PoWrapper(10)) == ['""', '"Short"']
+        assert pypo.quoteforpo("Short", pypo.PoWrapper(11)) == ['"Short"']
+        assert pypo.quoteforpo("") == []
+
     def test_quoteforpo_escaped_quotes(self) -> None:
         r"""
         Ensure that we don't break \" in two when wrapping.
@@ -1192,3 +1211,424 @@ msgstr "Monde"
 
         # Obsolete unit should start at line 11
         assert pofile.units[2].line_number == 11
+
+    def test_iterparse(self) -> None:
+        """Test that units can be parsed and written one at a time."""
+        posource = """msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+# Translator comment
+#: location.c:123
+msgid "café"
+msgstr "kafee"
+
+#, fuzzy
+msgid "%d file"
+msgid_plural "%d files"
+msgstr[0] "%d leer"
+msgstr[1] "%d leers"
+
+#~ msgid "Obsolete"
+#~ msgstr "Verouderd"
+""".replace("\n", "\r\n").encode()
+        pofile = self.poparse(posource)
+        units = list(pypo.iterparse(BytesIO(posource)))
+        assert [unit.source for unit in units] == [unit.source for unit in pofile.units]
+        assert [unit.line_number for unit in units] == [1, 5, 10, 16]
+        assert units[2].isfuzzy()
+        assert units[3].isobsolete()
+        store = units[0]._store
+        assert store.units == [units[0]]
+        assert store.encoding == "UTF-8"
+        assert store.newline == "\r\n"
+
+        out = BytesIO()
+        pypo.writeunits(pypo.iterparse(BytesIO(posource)), out)
+        assert out.getvalue() == bytes(pofile) == posource
+
+    def test_iterparse_error(self) -> None:
+        """Test that syntax errors are raised while iterating."""
+        units = pypo.iterparse(BytesIO(b'msgid "one"\nmsgstr "een"\n\nmsgid "two\n'))
+        assert next(units).source == "one"
+        with raises(ValueError, match="line 4"):
+            next(units)
+
+    def test_iterlines(self) -> None:
+        """Test that lines are split like in memory while reading."""
+        for newline in (b"\n", b"\r\n", b"\r"):
+            posource = newline.join(
+                [b"# comment", b'msgid "a"', b'msgstr "b"', b"", b'msgid "c"', b""]
+            )
+            for chunksize in (1, 2, 5, 1000):
+                lines, detected = pypo.iterlines(BytesIO(posource), chunksize)
+                assert (list(lines), detected) == pypo.splitlines(posource)
+
+    def test_legacy_charset(self) -> None:
+        """Test that files are decoded with the charset of their header."""
+        posource = """msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=ISO-8859-1\\n"
+
+msgid "café"
+msgstr "kafée"
+""".encode("ISO-8859-1")
+        for units in (
+            self.poparse(posource).units,
+            list(pypo.iterparse(BytesIO(posource))),
+        ):
+            assert units[1].source == "café"
+            assert units[1].target == "kafée"
+            assert units[1].line_number == 5
+        newline = pypo.detect_newline(posource)
+        lines, charset = pypo.decodelines(posource, newline)
+        assert charset == "ISO-8859-1"
+        assert lines[4] == 'msgid "café"\n'
+
+    def test_decodelines_fallback(self) -> None:
+        """Test that undecodable files are parsed line by line."""
+        posource = b'msgid "caf\xe9"\nmsgstr "k\xe9"\n'
+        assert pypo.decodelines(posource, b"\n") is None
+        with raises(UnicodeDecodeError):
+            self.poparse(posource)
+        posource = b'msgid ""\nmsgstr "Content-Type: text/plain; charset=BOGUS\\n"\n'
+        assert pypo.decodelines(posource, b"\n") is None
+        with raises(ValueError, match="Unsupported charset: BOGUS"):
+            self.poparse(posource)
+
+    def test_fast_parser(self) -> None:
+        """Test that the fast tokenizer gives the same units as the parser."""
+
+        class ClassicPOFile(pypo.pofile):
+            fast_parser = False
+
+        posource = b"""# Translator comment
+#. Automatic comment
+#: location.c:123
+#= c-format
+msgctxt "context"
+msgid "Hello"
+msgstr ""
+"Bonjour"
+
+msgid "%d file"
+msgid_plural "%d files"
+msgstr[0] "%d leer"
+msgstr[1] "%d leers"
+
+msgid "Indented"
+msgstr "Ingekeep"
+  "continued"
+
+#| msgid "Previous"
+msgid "Current"
+msgstr "Huidig"
+
+#~ msgid "Obsolete"
+#~ msgstr "Verouderd"
+"""
+        fast = self.poparse(posource)
+        classic = ClassicPOFile(posource)
+        assert len(fast.units) == 5
+        for fastunit, classicunit in zip(fast.units, classic.units, strict=True):
+            assert fastunit.line_number == classicunit.line_number
+            assert str(fastunit) == str(classicunit)
+            assert fastunit.msgstr == classicunit.msgstr
+        assert fast.units[2].target == "Ingekeepcontinued"
+        assert fast.units[3].prev_source == "Previous"
+        assert bytes(fast) == bytes(classic)
+
+    def test_fast_parser_errors(self) -> None:
+        """Test that the fast tokenizer reports errors like the parser."""
+        posource = b'msgid "one"\nmsgstr "een"\n\nmsgid "two"\n"\nmsgstr "twee"\n'
+        with raises(ValueError, match="end-of-line within string on line 5"):
+            self.poparse(posource)
+        posource = b'msgid "one"\nmsgstr "een"\n\nmsgid "two"\nmsgstr[0] "twee"\n'
+        with raises(ValueError, match="Syntax error on line 5"):
+            self.poparse(posource)
+
+    def test_tokenize(self) -> None:
+        tokens = poparser.tokenize(
+            ["#, fuzzy\n", "\n", 'msgid "a"\n', '"b" \n', 'msgstr[1] "c"\n', "x\n"]
+        )
+        assert tokens == [
+            (1, poparser.TOKEN_TYPE, "#, fuzzy\n", 0),
+            (3, poparser.TOKEN_MSGID, '"a"', 0),
+            (4, poparser.TOKEN_QUOTED, '"b"', 0),
+            (5, poparser.TOKEN_MSGSTR_ARRAY, '"c"', 1),
+            (6, poparser.TOKEN_UNKNOWN, "x\n", 0),
+        ]
+
+    def test_lazy_units(self) -> None:
+        """Test that units parsed in lazy mode read their fields on demand."""
+
+        class LazyPOFile(pypo.pofile):
+            lazy_units = True
+
+        posource = b"""msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+# Translator comment
+#: location.c:123
+#, fuzzy, c-format
+msgid "Hello"
+msgstr "Hallo"
+
+#, fuzzy
+msgid "%d file"
+msgid_plural "%d files"
+msgstr[0] ""
+msgstr[1] ""
+
+msgid "Untranslated"
+msgstr ""
+"""
+        eager = self.poparse(posource)
+        lazy = LazyPOFile(posource)
+        unit = lazy.units[1]
+        assert unit._raw is not None
+        assert unit.isfuzzy()
+        assert unit.get_state_n() == eager.units[1].get_state_n()
+        assert unit.source == "Hello"
+        assert unit.target == "Hallo"
+        assert unit.getlocations() == ["location.c:123"]
+        assert unit.line_number == 5
+        for lazyunit, eagerunit in zip(lazy.units, eager.units, strict=True):
+            assert lazyunit.get_state_n() == eagerunit.get_state_n()
+            assert lazyunit.isfuzzy() == eagerunit.isfuzzy()
+        assert lazy.units[2].target.strings == ["", ""]
+        assert bytes(lazy) == bytes(eager)
+
+        # Fields set before the first access are kept
+        lazy = LazyPOFile(posource)
+        lazy.units[3].target = "Onvertaal"
+        assert lazy.units[3].source == "Untranslated"
+        assert lazy.units[3].target == "Onvertaal"
+        store = pypo.pofile(noheader=True)
+        store.lazy_units = True
+        store.parse(posource)
+        unpickled = pickle.loads(pickle.dumps(store))  # ruff:ignore[suspicious-pickle-usage]
+        assert unpickled.units[1]._raw is not None
+        assert bytes(unpickled) == bytes(eager)
+        copied = lazy.units[1].copy()
+        assert copied.getnotes() == "Translator comment"
+        assert str(copied) == str(eager.units[1])
+        with raises(AttributeError):
+            lazy.units[1].missing  # ruff:ignore[useless-expression]
+
+    def test_lazy_units_set_fields(self) -> None:
+        """Test that fields set before the first access of a lazy unit are kept."""
+
+        class LazyPOFile(pypo.pofile):
+            lazy_units = True
+
+        posource = b"""# Translator comment
+msgid "Earth"
+msgstr "Wereld"
+
+msgid "World"
+msgstr "Wereld"
+"""
+        store = LazyPOFile(posource)
+        unit = store.units[0]
+        unit.target = "Aarde"
+        assert unit.getnotes() == "Translator comment"
+        assert unit.target == "Aarde"
+        store.units[1].msgstr = ['"Werelden"']
+        assert (
+            bytes(store)
+            == b"""# Translator comment
+msgid "Earth"
+msgstr "Aarde"
+
+msgid "World"
+msgstr "Werelden"
+"""
+        )
+
+    def test_compact_units(self) -> None:
+        """Test that parsed units leave out their empty fields and still change."""
+        posource = b"""msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "Hello"
+msgstr "Hallo"
+
+#: old.c:1
+msgid "World"
+msgstr "Wereld"
+"""
+        pofile = self.poparse(posource)
+        unit = pofile.units[1]
+        assert unit._othercomments is None
+        # The fields are in slots, and writing does not add them
+        bytes(pofile)
+        assert unit._othercomments is None
+        assert unit._extraattributes() is None
+        assert unit.othercomments == []
+        assert unit.othercomments is not pofile.units[2].othercomments
+        unit.addnote("Translator comment")
+        unit.addlocation("hello.c:12")
+        assert unit.getnotes() == "Translator comment"
+        assert unit.getlocations() == ["hello.c:12"]
+        assert pofile.units[2].othercomments == []
+        other = pofile.units[2]
+        other.merge(unit, comments=True, authoritative=False)
+        assert other.getlocations() == ["old.c:1", "hello.c:12"]
+        assert other.getnotes() == "Translator comment"
+        assert unit.sourcecomments == ["#: hello.c:12\n"]
+        # Other attributes can still be set
+        unit.reused = True
+        assert unit._extraattributes() == {"reused": True}
+        assert unit.copy().source == "Hello"
+        unpickled = pickle.loads(pickle.dumps(unit))  # ruff:ignore[suspicious-pickle-usage]
+        assert unpickled.target == "Hallo"
+        assert unpickled.reused
+
+    @mark.parametrize("lazy", [False, True])
+    def test_change_fields_in_place(self, lazy) -> None:
+        """Test that the fields of parsed units can be changed in place."""
+
+        class LazyPOFile(pypo.pofile):
+            lazy_units = lazy
+
+        posource = b"""msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "Hello"
+msgstr "Hallo"
+"""
+        pofile = LazyPOFile(posource)
+        unit = pofile.units[1]
+        unit.othercomments.append("# Translator comment\n")
+        unit.automaticcomments.append("#. Developer comment\n")
+        unit.sourcecomments.append("#: hello.c:12\n")
+        unit.msgctxt.append('"greeting"')
+        assert unit.getnotes() == "Translator comment\nDeveloper comment"
+        assert unit.getlocations() == ["hello.c:12"]
+        assert unit.getcontext() == "greeting"
+        assert bytes(pofile).endswith(b"""
+# Translator comment
+#. Developer comment
+#: hello.c:12
+msgctxt "greeting"
+msgid "Hello"
+msgstr "Hallo"
+""")
+
+    def test_unitboundary(self) -> None:
+        text = b'msgid "a"\nmsgstr "b"\n"c"\n\n\n#: x\nmsgid "d"\n\nmsgstr "e"\n\nmsgid "f"\n'
+        assert pypo.unitboundary(text, b"\n", 0) == text.index(b"#: x")
+        # Blank lines within a unit are not boundaries
+        assert pypo.unitboundary(text, b"\n", 30) == text.index(b'msgid "f"')
+        assert pypo.unitboundary(text, b"\n", 60) == -1
+        crlf = text.replace(b"\n", b"\r\n")
+        assert pypo.unitboundary(crlf, b"\r\n", 0) == crlf.index(b"#: x")
+
+    def test_parallel_parse(self, monkeypatch) -> None:
+        """Test that parsing in several processes gives the same units."""
+        monkeypatch.setattr(pypo, "PARALLEL_CHUNK_SIZE", 200)
+        body = "".join(
+            f'#: file.c:{i}\nmsgid "message {i}"\nmsgstr ""\n"bericht {i}"\n\n'
+            for i in range(20)
+        )
+        posource = (
+            'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=ISO-8859-1\\n"\n\n'
+            f'{body}#~ msgid "café"\n#~ msgstr "kafee"\n\n{body}'
+        ).encode("latin-1")
+        serial = self.poparse(posource)
+        parallel = pypo.pofile()
+        parallel.parse_jobs = 3
+        parallel.parse(posource)
+        assert bytes(parallel) == bytes(serial)
+        assert parallel.getheaderplural() == serial.getheaderplural()
+        assert parallel._encoding == "ISO-8859-1"
+        assert [
+            (unit.line_number, unit.isobsolete(), unit.get_state_n())
+            for unit in parallel.units
+        ] == [
+            (unit.line_number, unit.isobsolete(), unit.get_state_n())
+            for unit in serial.units
+        ]
+        assert parallel.units[21].source == "café"
+
+        # Errors are the same as when parsing at once
+        posource = posource.replace(b"#~ msgstr", b"msgstr[0]")
+        parallel = pypo.pofile()
+        parallel.parse_jobs = 3
+        with raises(ValueError, match="Syntax error on line 106"):
+            parallel.parse(posource)
+
+    def test_passthrough(self) -> None:
+        """Test that unchanged units are written as they were parsed."""
+
+        class LazyPOFile(pypo.pofile):
+            lazy_units = True
+
+        posource = b"""msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+#= c-format
+msgid    "Hello"
+msgstr "Hallo"
+
+msgid "A long message which does not get wrapped like the wrapper would wrap it"
+msgstr ""
+"Een lang bericht"
+
+#, fuzzy
+msgid "Untouched"
+
+msgstr "Onaangeraak"
+"""
+        for storeclass in (pypo.pofile, LazyPOFile):
+            pofile = storeclass(posource, passthrough=True)
+            assert bytes(pofile) == posource
+            pofile.units[2].target = "Een ander bericht"
+            pofile.units[3].markfuzzy(False)
+            output = bytes(pofile).decode()
+            assert 'msgid    "Hello"\n' in output
+            assert 'msgstr "Een ander bericht"\n' in output
+            assert "#, fuzzy" not in output
+            assert 'msgid "Untouched"\nmsgstr "Onaangeraak"\n' in output
+
+        # Units which are not written as they are get rewritten
+        pofile = pypo.pofile(
+            posource + b'\n# blank\nmsgid ""\nmsgstr ""\n', passthrough=True
+        )
+        assert bytes(pofile) == posource + b"\n# blank\n"
+        pofile = pypo.pofile(posource.replace(b"\n", b"\r\n"), passthrough=True)
+        pofile.newline = "\n"
+        assert b'msgid "Hello"\n' in bytes(pofile)
+        pofile = pypo.pofile(posource, passthrough=True)
+        pofile.units[1].makeobsolete()
+        assert b'#~ msgid "Hello"\n' in bytes(pofile)
+        pofile = pypo.pofile(posource, passthrough=True)
+        pofile.updateheader(add=True, Content_Type="text/plain; charset=ISO-8859-1")
+        pofile.encoding = "ISO-8859-1"
+        assert b'msgid "Hello"\n' in bytes(pofile)
+
+        # Normalized by default
+        pofile = self.poparse(posource)
+        assert b'msgid "Hello"\n' in bytes(pofile)
+        assert all(unit._rawsource is None for unit in pofile.units)
+
+        # Units repaired while parsing are written as they are repaired, and
+        # dropped lines are not written with the preceding unit
+        rewritten = posource.replace(b'"Untouched"\n\n', b'"Untouched"\n')
+        for malformed, expected in (
+            (b"#: hello.c:1\n", posource + b'\n#: hello.c:1\nmsgid ""\nmsgstr ""\n'),
+            (b'msgctxt "Missing"\n', rewritten),
+            (b'msgid "Missing"\n', rewritten),
+            (b'#~ msgid "Missing"\n', rewritten),
+        ):
+            for storeclass in (pypo.pofile, LazyPOFile):
+                for fast_parser in (True, False):
+                    pofile = storeclass(passthrough=True)
+                    pofile.fast_parser = fast_parser
+                    pofile.parse(posource + b"\n" + malformed)
+                    assert bytes(pofile) == expected
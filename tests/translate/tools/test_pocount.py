@@ -169,6 +169,16 @@ msgstr ""
         stats = pocount.calcstats(pofile)
         assert stats["totalsourcewords"] == 6
 
+    def test_streamed_file(self, tmp_path) -> None:
+        pofile = tmp_path / "test.po"
+        pofile.write_bytes(self.inputdata)
+        stats = pocount.calcstats(str(pofile))
+        assert stats == pocount.calcstats(BytesIO(self.inputdata)) | {
+            "filename": str(pofile)
+        }
+        pofile.write_bytes(b'msgid "broken\n')
+        assert pocount.calcstats(str(pofile)) == {}
+
 
 @mark.parametrize("style", ["csv", "full", "short-strings", "short-words"])
 @mark.parametrize("incomplete", [True, False], ids=lambda v: f"incomplete={v}")
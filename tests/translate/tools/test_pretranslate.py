@@ -336,7 +336,10 @@ class TestPretranslateCommand(test_convert.TestConvertCommand, TestPretranslate)
     convertmodule = pretranslate
     expected_options = [
         "-t TEMPLATE, --template=TEMPLATE",
-        "--tm",
+        "--tm=TM",
+        "--tm-index=INDEX",
+        "--tm-cache=CACHE",
         "-s MIN_SIMILARITY, --similarity=MIN_SIMILARITY",
         "--nofuzzymatching",
+        "--fuzzy-jobs=JOBS",
     ]
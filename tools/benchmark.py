@@ -22,9 +22,12 @@ import os
 import pstats
 import random
 import sys
+import time
+import tracemalloc
 from importlib import import_module
 
-from translate.storage import factory, placeables
+from translate.storage import factory, placeables, pypo
+from translate.tools import pocompile
 
 
 class TranslateBenchmarker:
@@ -103,6 +106,27 @@ class TranslateBenchmarker:
                 self.parsedfiles.append(parsedfile)
         print(f"counted {count} units")
 
+    def serialize_files(self) -> None:
+        """Serializes the parsed files, after setting all targets again."""
+        count = 0
+        for parsedfile in self.parsedfiles:
+            for unit in parsedfile.units:
+                unit.target = unit.target
+            bytes(parsedfile)
+            count += len(parsedfile.units)
+        print(f"counted {count} units")
+
+    def compile_files(self) -> None:
+        """Compiles the parsed files to MO files, like pocompile."""
+        count = 0
+        start = time.perf_counter()
+        for parsedfile in self.parsedfiles:
+            pocompile.POCompile.convertstore(parsedfile)
+            count += len(parsedfile.units)
+        elapsed = time.perf_counter() - start
+        print(f"counted {count} units")
+        print(f"compiled {len(self.parsedfiles) / elapsed:.1f} catalogs/second")
+
     def parse_placeables(self) -> None:
         """Parses placeables."""
         count = 0
@@ -137,13 +161,38 @@ if __name__ == "__main__":
         action="store_true",
         help="benchmark parsing files",
     )
+    parser.add_argument(
+        "--check-serializing",
+        dest="check_serializing",
+        action="store_true",
+        help="benchmark serializing the parsed files",
+    )
+    parser.add_argument(
+        "--check-compiling",
+        dest="check_compiling",
+        action="store_true",
+        help="benchmark compiling the parsed files to MO files",
+    )
     parser.add_argument(
         "--check-placeables",
         dest="check_placeables",
         action="store_true",
         help="benchmark placeables",
     )
+    parser.add_argument(
+        "--classic-po-parser",
+        dest="classic_po_parser",
+        action="store_true",
+        help="parse PO files without the fast tokenizer",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        dest="trace_memory",
+        action="store_true",
+        help="report the memory allocated by every benchmark",
+    )
     args = parser.parse_args()
+    pypo.pofile.fast_parser = not args.classic_po_parser
 
     storetype = args.storetype
 
@@ -177,6 +226,9 @@ if __name__ == "__main__":
         # (100, 2, 140, 3, 3),  # OpenOffice.org approximate ratios
     ]
 
+    if args.trace_memory:
+        tracemalloc.start()
+
     for sample_file_sizes in sample_files:
         benchmarker = TranslateBenchmarker("BenchmarkDir", storeclass)
         benchmarker.clear_test_dir()
@@ -187,6 +239,16 @@ if __name__ == "__main__":
         if args.check_parsing:
             methods.append(("parse_files", repr(args.podir)))
 
+        if args.check_serializing:
+            if not args.check_parsing:
+                methods.append(("parse_files", repr(args.podir)))
+            methods.append(("serialize_files", ""))
+
+        if args.check_compiling:
+            if not (args.check_parsing or args.check_serializing):
+                methods.append(("parse_files", repr(args.podir)))
+            methods.append(("compile_files", ""))
+
         if args.check_placeables:
             methods.append(("parse_placeables", ""))
 
@@ -196,5 +258,14 @@ if __name__ == "__main__":
             cProfile.run(f"benchmarker.{methodname}({methodparam})", statsfile)
             stats = pstats.Stats(statsfile)
             stats.sort_stats("time").print_stats(20)
+            if args.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                print(f"memory: {current / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB")
+                units = sum(len(parsed.units) for parsed in benchmarker.parsedfiles)
+                if units:
+                    print(f"memory per unit: {current / units:.0f} bytes")
+                tracemalloc.reset_peak()
+                if storeclass is pypo.pofile:
+                    print(f"quote cache: {pypo._quotelines.cache_info()}")
             print("_______________________________________________________")
         benchmarker.clear_test_dir()
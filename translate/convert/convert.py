@@ -21,9 +21,13 @@ Handles converting of files between formats (used by
 :mod:`translate.convert` tools).
 """
 
+import hashlib
+import json
 import os.path
+import tempfile
 from io import BytesIO
 
+from translate import __version__
 from translate.misc import optrecurse
 from translate.tools import pocount
 
@@ -50,7 +54,13 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser):
             description=description,
         )
         self.usepots = usepots
+        # Options naming files whose content is part of the --manifest entries
+        self.manifestfiles = []
+        # Options which do not change the output, left out of the --manifest
+        # entries
+        self.manifestignored = ["progress"]
         self.settimestampoption()
+        self.setmanifestoption()
         self.setpotoption()
 
     def add_fuzzy_option(self, default=False) -> None:
@@ -225,6 +235,19 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser):
         )
         self.define_option(timestampopt)
 
+    def setmanifestoption(self) -> None:
+        """Sets ``--manifest`` option."""
+        manifestopt = optparse.Option(
+            None,
+            "--manifest",
+            dest="manifest",
+            default=None,
+            metavar="MANIFEST",
+            help="skip conversion if the input, template and options did not "
+            "change since the conversion recorded in MANIFEST",
+        )
+        self.define_option(manifestopt)
+
     def verifyoptions(self, options) -> None:
         """
         Verifies that the options are valid (required options are present,
@@ -243,9 +266,64 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser):
             self.error(str(e))
         self.recursiveprocess(options)
 
-    def processfile(
-        self, fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
-    ):
+    def __getstate__(self):
+        # The manifest is only used by the main process, not by --jobs
+        state = self.__dict__.copy()
+        state.pop("manifest", None)
+        state.pop("manifestpending", None)
+        state.pop("manifestoptions", None)
+        return state
+
+    def canprocessinparallel(self, options) -> bool:
+        # All the files are converted to a single output file
+        if getattr(options, "multifilestyle", None) == "onefile":
+            return False
+        return super().canprocessinparallel(options)
+
+    def recursiveprocess(self, options):
+        """Recurse through directories and convert files, keeping the manifest."""
+        if not getattr(options, "manifest", None):
+            return super().recursiveprocess(options)
+        self.manifest = _loadmanifest(options.manifest)
+        self.manifestpending = {}
+        # The same for all the files, and hashing big files takes time
+        self.manifestoptions = self.getmanifestoptions(options)
+        try:
+            return super().recursiveprocess(options)
+        finally:
+            _savemanifest(options.manifest, self.manifest)
+            del self.manifest, self.manifestpending, self.manifestoptions
+
+    def getmanifestoptions(self, options):
+        """
+        Returns the digest of the options affecting the output, including the
+        content of the files named by :attr:`manifestfiles`.
+        """
+        settings = {
+            name: value
+            for name, value in self.getpassthroughoptions(options).items()
+            if name not in self.manifestignored
+        }
+        files = {
+            name: _hashfile(getattr(options, name, None)) for name in self.manifestfiles
+        }
+        encoded = json.dumps(
+            [__version__.sver, settings, files], sort_keys=True, default=repr
+        )
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def getmanifestentry(self, options, fullinputpath, fulltemplatepath):
+        """Describes everything a conversion depends on, for the manifest."""
+        return {
+            "input": _hashfile(fullinputpath),
+            "template": _hashfile(fulltemplatepath),
+            "options": self.manifestoptions,
+        }
+
+    def isuptodate(
+        self, options, fullinputpath, fulloutputpath, fulltemplatepath=None
+    ) -> bool:
+        """Whether ``--timestamp`` or ``--manifest`` skip the conversion of this file."""
         # The `fulloutputpath`s parsed when `onefile` is enabled don't exist, which causes
         # the `_output_is_newer` check to return False. This means that even if there is
         # no content update, the POT/PO files are regenerated. When `onefile` is enabled,
@@ -257,6 +335,42 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser):
             timecheck_output_path = fulloutputpath
 
         if options.timestamp and _output_is_newer(fullinputpath, timecheck_output_path):
+            return True
+
+        manifest = getattr(self, "manifest", None)
+        if (
+            manifest is None
+            # Every input contributes to the single output file
+            or getattr(options, "multifilestyle", None) == "onefile"
+            or not fulloutputpath
+            or not fullinputpath
+            or not os.path.isfile(fullinputpath)
+        ):
+            return False
+        key = _manifestkey(options.manifest, fulloutputpath)
+        entry = self.getmanifestentry(options, fullinputpath, fulltemplatepath)
+        if manifest.get(key) == entry and os.path.exists(fulloutputpath):
+            return True
+        manifest.pop(key, None)
+        # Recorded once the conversion succeeds
+        self.manifestpending[key] = entry
+        return False
+
+    def fileprocessed(
+        self, options, fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+    ) -> None:
+        manifest = getattr(self, "manifest", None)
+        if manifest is None or not fulloutputpath:
+            return
+        key = _manifestkey(options.manifest, fulloutputpath)
+        entry = self.manifestpending.pop(key, None)
+        if entry is not None:
+            manifest[key] = entry
+
+    def processfile(
+        self, fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
+    ):
+        if self.isuptodate(options, fullinputpath, fulloutputpath, fulltemplatepath):
             return False
 
         return super().processfile(
@@ -526,6 +640,16 @@ class ArchiveConvertOptionParser(ConvertOptionParser):
             return outputstream
         return super().openoutputfile(options, fulloutputpath)
 
+    def canprocessinparallel(self, options) -> bool:
+        # The archives are read and written by this process only
+        if (
+            getattr(options, "inputarchive", None) is not None
+            or getattr(self, "templatearchive", None) is not None
+            or getattr(self, "outputarchive", None) is not None
+        ):
+            return False
+        return super().canprocessinparallel(options)
+
     def recursiveprocess(self, options):
         """Recurse through directories and convert files."""
         try:
@@ -582,6 +706,52 @@ class ArchiveConvertOptionParser(ConvertOptionParser):
         )
 
 
+def _hashfile(path):
+    """Returns the SHA-256 digest of a file, or None without a file."""
+    if not path or not os.path.isfile(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as hashedfile:
+        for block in iter(lambda: hashedfile.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _manifestkey(manifestpath, outputpath):
+    """Returns the output path relative to the manifest, which keys its entries."""
+    return os.path.relpath(outputpath, os.path.dirname(os.path.abspath(manifestpath)))
+
+
+def _loadmanifest(manifestpath):
+    """Reads the entries of a manifest, ignoring a missing or broken one."""
+    try:
+        with open(manifestpath, "rb") as manifestfile:
+            manifest = json.load(manifestfile)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != 1:
+        return {}
+    return manifest.get("outputs", {})
+
+
+def _savemanifest(manifestpath, outputs) -> None:
+    """Writes a manifest at once, so that an interrupted run keeps the old one."""
+    directory = os.path.dirname(os.path.abspath(manifestpath))
+    handle, temppath = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as manifestfile:
+            json.dump(
+                {"version": 1, "outputs": outputs},
+                manifestfile,
+                indent=1,
+                sort_keys=True,
+            )
+        os.replace(temppath, manifestpath)
+    except OSError:
+        os.remove(temppath)
+        raise
+
+
 def _output_is_newer(input_path, output_path):
     """
     Check if input_path was not modified since output_path was generated,
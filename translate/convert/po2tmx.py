@@ -117,6 +117,9 @@ class tmxmultifile:
 
 
 class TmxOptionParser(convert.ArchiveConvertOptionParser):
+    def setjobsoption(self) -> None:
+        """All the files are combined, so --jobs is not offered."""
+
     def recursiveprocess(self, options) -> None:
         if not options.targetlanguage:
             raise ValueError("You must specify the target language")
@@ -80,6 +80,9 @@ class wfmultifile:
 
 
 class WfOptionParser(convert.ArchiveConvertOptionParser):
+    def setjobsoption(self) -> None:
+        """All the files are combined, so --jobs is not offered."""
+
     def recursiveprocess(self, options) -> None:
         if not options.targetlanguage:
             raise ValueError("You must specify the target language")
@@ -41,6 +41,9 @@ def convertpot(
     maxlength=None,
     classes=None,
     classes_str=None,
+    tm_index=None,
+    fuzzy_jobs=1,
+    tm_cache=None,
     **kwargs,
 ) -> int:
     """Main conversion function."""
@@ -64,6 +67,9 @@ def convertpot(
         tm,
         min_similarity,
         fuzzymatching,
+        tm_index=tm_index,
+        fuzzy_jobs=fuzzy_jobs,
+        tm_cache=tm_cache,
         **kwargs,
     )
     convert.set_po_max_line_length(output_store, maxlength)
@@ -79,6 +85,9 @@ def convert_stores(
     tm=None,
     min_similarity=75,
     fuzzymatching=True,
+    tm_index=None,
+    fuzzy_jobs=1,
+    tm_cache=None,
     **kwargs,
 ):
     """
@@ -107,7 +116,12 @@ def convert_stores(
             matchers.append(matcher)
         if tm:
             matcher = pretranslate.memory(
-                tm, max_candidates=1, min_similarity=min_similarity, max_length=1000
+                tm,
+                max_candidates=1,
+                min_similarity=min_similarity,
+                max_length=1000,
+                tm_index=tm_index,
+                tm_cache=tm_cache,
             )
             matcher.addpercentage = False
             matchers.append(matcher)
@@ -115,6 +129,16 @@ def convert_stores(
     # initialize store
     _store_pre_merge(input_store, temp_store, template_store)
 
+    fuzzy_matches = None
+    if matchers:
+        fuzzy_matches = pretranslate.prepare_fuzzy_matches(
+            temp_store.units,
+            template_store,
+            matchers,
+            merge_on=input_store.merge_on,
+            processes=fuzzy_jobs,
+        )
+
     # Do matching
     for input_unit in temp_store.units:
         if input_unit.istranslatable():
@@ -124,6 +148,7 @@ def convert_stores(
                 matchers,
                 mark_reused=True,
                 merge_on=input_store.merge_on,
+                fuzzy_matches=fuzzy_matches,
             )
             _unit_post_merge(input_unit, input_store, temp_store, template_store)
 
@@ -351,6 +376,32 @@ def main(argv=None) -> None:
         help="The file to use as translation memory when fuzzy matching",
     )
     parser.passthrough.append("tm")
+    # A changed translation memory changes the output
+    parser.manifestfiles.append("tm")
+
+    parser.add_option(
+        "",
+        "--tm-index",
+        dest="tm_index",
+        default=None,
+        metavar="INDEX",
+        help="Keep the translation memory in this index file, so it is only reparsed when it changes",
+    )
+    parser.passthrough.append("tm_index")
+    # Only caches the parsing of --tm
+    parser.manifestignored.append("tm_index")
+
+    parser.add_option(
+        "",
+        "--tm-cache",
+        dest="tm_cache",
+        default=None,
+        metavar="CACHE",
+        help="Keep the translation memory matches in this cache file for later runs",
+    )
+    parser.passthrough.append("tm_cache")
+    # Only caches the matches
+    parser.manifestignored.append("tm_cache")
 
     defaultsimilarity = 75
     parser.add_option(
@@ -372,9 +423,22 @@ def main(argv=None) -> None:
     )
     parser.passthrough.append("fuzzymatching")
 
+    parser.add_option(
+        "",
+        "--fuzzy-jobs",
+        dest="fuzzy_jobs",
+        default=1,
+        type="int",
+        metavar="JOBS",
+        help="Number of processes to use for fuzzy matching (default: 1)",
+    )
+    parser.passthrough.append("fuzzy_jobs")
+    parser.manifestignored.append("fuzzy_jobs")
+
     parser.add_po_max_line_length_option()
 
     parser.run(argv)
+    pretranslate.save_memory_cache()
 
 
 if __name__ == "__main__":
@@ -34,6 +34,7 @@ from __future__ import annotations
 import logging
 import re
 import string
+from functools import wraps
 
 from translate.filters import decoration, helpers, prefilters, spelling
 from translate.filters.decorators import cosmetic, critical, extraction, functional
@@ -314,6 +315,7 @@ class CheckerConfig:
 
 
 def cache_results(f):
+    @wraps(f)
     def cached_f(self, param1):
         key = (f.__name__, param1)
         res_cache = self.results_cache
@@ -238,6 +238,10 @@ class Common:
             code = data.simplercode(code)
         return language
 
+    def __getnewargs__(self):
+        # Unpickle to the language object of this process
+        return (self.code,)
+
     def __deepcopy__(self, memo={}):
         memo[id(self)] = self
         return self
@@ -18,11 +18,14 @@
 
 import fnmatch
 import logging
+import multiprocessing
 import optparse
 import os.path
+import pickle  # ruff:ignore[suspicious-pickle-import]
 import re
 import sys
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from types import TracebackType
 from typing import Any
@@ -121,6 +124,57 @@ class StdoutWrapper:
             self.out.write(content)
 
 
+def setuplogging() -> None:
+    """Sets up the format of the warnings, also in the processes of --jobs."""
+    logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
+
+
+# The parser and options of a process of --jobs
+_worker: dict[str, Any] = {}
+
+
+class _RecordCollector(logging.Handler):
+    """Keeps the log records of a process of --jobs, see :func:`_processinworker`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Send the message and traceback as text, the arguments might not
+        # be picklable
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+def _initworker(parser, options) -> None:
+    """Sets up a process of --jobs, which receives the parser only once."""
+    collector = _RecordCollector()
+    logging.basicConfig(handlers=[collector])
+    _worker["collector"] = collector
+    _worker["parser"] = parser
+    _worker["options"] = options
+
+
+def _processinworker(processingpaths) -> tuple[bool, list[logging.LogRecord]]:
+    """
+    Processes a file in a process of --jobs.
+
+    :return: Whether it succeeded, and the records it logged, which the main
+             process logs with the progress of the file.
+    """
+    records = _worker["collector"].records
+    try:
+        success = _worker["parser"].tryprocessfile(_worker["options"], *processingpaths)
+        return success, records[:]
+    finally:
+        records.clear()
+
+
 class RecursiveOptionParser(optparse.OptionParser):
     """A specialized Option Parser for recursing through directories."""
 
@@ -141,10 +195,11 @@ class RecursiveOptionParser(optparse.OptionParser):
         self.setmanpageoption()
         self.setprogressoptions()
         self.seterrorleveloptions()
+        self.setjobsoption()
         self.setformats(formats, usetemplates)
         self.passthrough = []
         self.allowmissingtemplate = allowmissingtemplate
-        logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
+        setuplogging()
 
     def get_prog_name(self):
         return os.path.basename(sys.argv[0])
@@ -426,6 +481,19 @@ class RecursiveOptionParser(optparse.OptionParser):
         )
         self.define_option(errorleveloption)
 
+    def setjobsoption(self) -> None:
+        """Sets the ``--jobs`` option, to process files in parallel."""
+        jobsoption = RecursiveOption(
+            None,
+            "--jobs",
+            dest="jobs",
+            type="int",
+            default=1,
+            metavar="JOBS",
+            help="process up to JOBS files at the same time",
+        )
+        self.define_option(jobsoption)
+
     @staticmethod
     def getformathelp(formats) -> str:
         """Make a nice help string for describing formats..."""
@@ -655,6 +723,19 @@ class RecursiveOptionParser(optparse.OptionParser):
         # this makes for more merge-friendly content in single-output-file mode.
         inputfiles.sort()
         progress_bar = ProgressBar(options.progress, inputfiles)
+        if getattr(options, "jobs", 1) > 1 and len(inputfiles) > 1:
+            if self.canprocessinparallel(options):
+                self.parallelprocess(options, inputfiles, progress_bar)
+                return
+            self.warning("The files can not be processed in parallel, ignoring --jobs")
+        for inputpath, processingpaths in self.iterprocessingpaths(options, inputfiles):
+            success = self.tryprocessfile(options, *processingpaths)
+            if success:
+                self.fileprocessed(options, *processingpaths)
+            progress_bar.report_progress(inputpath, success)
+
+    def iterprocessingpaths(self, options, inputfiles):
+        """Yields the input files that can be processed, with their paths."""
         for inputpath in inputfiles:
             try:
                 processingpaths = self.getprocessingpaths(options, inputpath)
@@ -663,27 +744,98 @@ class RecursiveOptionParser(optparse.OptionParser):
                     f"Couldn't handle input file {inputpath}", options, sys.exc_info()
                 )
                 continue
-            if processingpaths is None:
-                continue
-            fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath = (
-                processingpaths
+            if processingpaths is not None:
+                yield inputpath, processingpaths
+
+    def tryprocessfile(
+        self, options, fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+    ) -> bool:
+        """Process an individual file, reporting any error as a warning."""
+        try:
+            return self.processfile(
+                fileprocessor,
+                options,
+                fullinputpath,
+                fulloutputpath,
+                fulltemplatepath,
             )
-            try:
-                success = self.processfile(
-                    fileprocessor,
-                    options,
-                    fullinputpath,
-                    fulloutputpath,
-                    fulltemplatepath,
+        except Exception:
+            self.warning(
+                f"Error processing: input {fullinputpath}, output {fulloutputpath}, template {fulltemplatepath}",
+                options,
+                sys.exc_info(),
+            )
+            return False
+
+    def canprocessinparallel(self, options) -> bool:
+        """
+        Whether the files can be processed in separate processes.
+
+        This needs every file to have its own output file, and the parser to
+        be picklable.
+        """
+        if not options.recursiveoutput:
+            return False
+        try:
+            pickle.loads(pickle.dumps((self, options)))  # ruff:ignore[suspicious-pickle-usage]
+        except Exception:
+            return False
+        return True
+
+    def parallelprocess(self, options, inputfiles, progress_bar) -> None:
+        """
+        Process the files in a pool of ``options.jobs`` processes.
+
+        The paths and output directories are prepared here. The progress and
+        the messages logged by the workers are reported in the same order as
+        when processing one file at a time.
+        """
+        with ProcessPoolExecutor(
+            options.jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initworker,
+            initargs=(self, options),
+        ) as executor:
+            pending = []
+            for inputpath, processingpaths in self.iterprocessingpaths(
+                options, inputfiles
+            ):
+                _fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath = (
+                    processingpaths
                 )
-            except Exception:
-                self.warning(
-                    f"Error processing: input {fullinputpath}, output {fulloutputpath}, template {fulltemplatepath}",
-                    options,
-                    sys.exc_info(),
+                if self.isuptodate(
+                    options, fullinputpath, fulloutputpath, fulltemplatepath
+                ):
+                    # Not worth sending to the pool
+                    pending.append((inputpath, processingpaths, None))
+                    continue
+                pending.append(
+                    (
+                        inputpath,
+                        processingpaths,
+                        executor.submit(_processinworker, processingpaths),
+                    )
                 )
+            for inputpath, processingpaths, result in pending:
                 success = False
-            progress_bar.report_progress(inputpath, success)
+                if result is not None:
+                    success, records = result.result()
+                    for record in records:
+                        logging.getLogger(record.name).handle(record)
+                if success:
+                    self.fileprocessed(options, *processingpaths)
+                progress_bar.report_progress(inputpath, success)
+
+    def isuptodate(
+        self, options, fullinputpath, fulloutputpath, fulltemplatepath=None
+    ) -> bool:
+        """Whether the output file does not need to be processed again."""
+        return False
+
+    def fileprocessed(
+        self, options, fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+    ) -> None:
+        """Called in this process once a file was processed successfully."""
 
     def ensurerecursiveoutputdirexists(self, options) -> None:
         if not self.isrecursive(options.output, "output"):
@@ -28,6 +28,7 @@ will be used which will provide better performance as it is implemented natively
 
 import logging
 import math
+from operator import itemgetter
 
 logger = logging.getLogger(__name__)
 
@@ -36,29 +37,62 @@ def python_distance(a, b, stopvalue=-1):
     """
     Calculates the distance for use in similarity calculation. Python
     version.
+
+    This uses the bit-parallel algorithm by Myers (in the formulation of
+    Hyyrö), which processes a whole column of the dynamic programming matrix
+    with a few operations on Python integers. If stopvalue is given, the
+    calculation stops as soon as the distance is known to exceed it, and a
+    value larger than stopvalue is returned.
+
+    .. seealso:: :wp:`Levenshtein_distance`
     """
+    # Let's make a the shortest, it is encoded as bit vectors
+    if len(a) > len(b):
+        a, b = b, a
     l1 = len(a)
     l2 = len(b)
     if stopvalue == -1:
         stopvalue = l2
-    current = range(l1 + 1)
-    for i in range(1, l2 + 1):
-        previous, current = current, ([i] + [0] * l1)
-        least = l2
-        for j in range(1, l1 + 1):
-            change = previous[j - 1]
-            if a[j - 1] != b[i - 1]:
-                change += 1
-            insert = previous[j] + 1
-            delete = current[j - 1] + 1
-            current[j] = min(insert, delete, change)
-            least = min(least, current[j])
-        # The smallest value in the current array is the best (lowest) value
-        # that can be attained in the end if the strings are identical further
-        if least > stopvalue:
-            return least
-
-    return current[l1]
+    # The distance is at least the difference in length
+    if l2 - l1 > stopvalue:
+        return l2 - l1
+    if l1 == 0:
+        return l2
+
+    # Positions of every character in a
+    peq = {}
+    bit = 1
+    for char in a:
+        peq[char] = peq.get(char, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = bit >> 1
+
+    # Vertical positive and negative deltas of the current column
+    pv = mask
+    mv = 0
+    score = l1
+    remaining = l2
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        # Every remaining column can lower the score by one at most
+        if score - remaining > stopvalue:
+            return score - remaining
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return score
 
 
 def native_distance(a, b, stopvalue=0):
@@ -73,6 +107,7 @@ def native_distance(a, b, stopvalue=0):
 
 
 try:
+    from rapidfuzz import process
     from rapidfuzz.distance import Levenshtein
 
     distance = native_distance
@@ -81,6 +116,7 @@ except ImportError:
         "RapidFuzz not found. Continuing with built-in (slower) fuzzy matching."
     )
     distance = python_distance
+    process = None
 
 
 class LevenshteinComparer:
@@ -126,7 +162,8 @@ class LevenshteinComparer:
           - Calculation is stopped as soon as a similarity of stoppercentage
             becomes unattainable. See the use of the variable stopvalue.
           - Implementation uses memory O(min(len(a), len(b))
-          - Execution time is O(len(a)*len(b))
+          - Execution time is O(len(a)*len(b)), the Python version works
+            on len(a) bits at once, so it is O(len(b)) for short strings
         """
         l1, l2 = len(a), len(b)
         if l1 == 0 or l2 == 0:
@@ -164,6 +201,72 @@ class LevenshteinComparer:
             penalty = 0
         return 100 - (dist * 1.0 / l2) * 100 - penalty
 
+    def similarity_many(self, a, candidates, stoppercentage=40):
+        """
+        Returns the similarity between a and each of the candidates, as
+        calculated by :meth:`similarity_real`.
+
+        If RapidFuzz is available, all distances are calculated in a single
+        native call.
+
+        :return: A list of (index, similarity) pairs for the candidates which
+                 are at least stoppercentage similar, in the order of
+                 candidates.
+        """
+        if process is None or not a:
+            return [
+                (index, similarity)
+                for index, similarity in (
+                    (index, self.similarity_real(a, b, stoppercentage))
+                    for index, b in enumerate(candidates)
+                )
+                if similarity >= stoppercentage
+            ]
+
+        query = a[: self.MAX_LEN]
+        choices = [b[: self.MAX_LEN] for b in candidates]
+        if not choices:
+            return []
+        # The largest distance that any of the candidates could have
+        stopvalue = math.ceil(
+            (100.0 - stoppercentage) / 100 * max(len(query), *map(len, choices))
+        )
+        results = process.extract(
+            query,
+            choices,
+            scorer=Levenshtein.distance,
+            limit=None,
+            score_cutoff=stopvalue,
+        )
+        results.sort(key=itemgetter(2))
+
+        similarities = []
+        la = len(a)
+        for _choice, dist, index in results:
+            lb = len(candidates[index])
+            if lb == 0:
+                if stoppercentage <= 0:
+                    similarities.append((index, 0))
+                continue
+            l1, l2 = min(la, lb), max(la, lb)
+            # The same shortcuts and penalties as in similarity_real
+            if 100 - 100.0 * (l2 - l1) / l2 < stoppercentage:
+                continue
+            penalty = 0
+            if l2 > self.MAX_LEN:
+                l2 = self.MAX_LEN
+                penalty += 7
+                if l1 > self.MAX_LEN:
+                    penalty += 7
+            if dist > math.ceil((100.0 - stoppercentage) / 100 * l2):
+                continue
+            if dist != 0:
+                penalty = 0
+            similarity = 100 - (dist * 1.0 / l2) * 100 - penalty
+            if similarity >= stoppercentage:
+                similarities.append((index, similarity))
+        return similarities
+
 
 if __name__ == "__main__":
     from sys import argv
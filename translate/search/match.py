@@ -23,14 +23,26 @@ units.
 
 from __future__ import annotations
 
+import hashlib
 import heapq
+import logging
+import multiprocessing
+import os
+import pickle  # ruff:ignore[suspicious-pickle-import]
 import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from operator import itemgetter
 
 from translate.misc.multistring import multistring
-from translate.search import lshtein, terminology
+from translate.search import lshtein, ngram, terminology, tmindex
 from translate.storage import base, po
 
+logger = logging.getLogger(__name__)
+
 
 def sourcelen(unit):
     """Returns the length of the source string."""
@@ -47,6 +59,174 @@ def _sort_matches(matches, match_info) -> None:
     matches.sort(key=lambda x: match_info[x.source]["pos"])
 
 
+def _intern(text):
+    """Interns plain strings, so that repeated strings are only stored once."""
+    if type(text) is str:
+        return sys.intern(text)
+    return text
+
+
+class Candidate:
+    """
+    A compact translation memory entry, as stored by :class:`matcher`.
+
+    Only the few attributes used for matching are stored, full units are
+    only built for the final results in :meth:`matcher.buildunits`.
+    """
+
+    __slots__ = ("fuzzy", "notes", "orig_source", "orig_target", "source", "target")
+
+    def __init__(self, source="", target="", notes="", fuzzy=False) -> None:
+        self.source = _intern(source)
+        self.target = _intern(target)
+        self.notes = notes
+        self.fuzzy = fuzzy
+
+    def getnotes(self, origin=None):
+        return self.notes
+
+    def addnote(self, text, origin=None, position="append") -> None:
+        if position == "append" and self.notes:
+            self.notes += f"\n{text}"
+        else:
+            self.notes = text
+
+    def isfuzzy(self) -> bool:
+        return self.fuzzy
+
+
+class CandidateStore:
+    """
+    The translation memory candidates of a :class:`matcher`.
+
+    Besides the list of candidates, the lengths of their source strings are
+    kept in an array, so that the candidates within a length range can be
+    found with a binary search.
+    """
+
+    def __init__(self) -> None:
+        self.units = []
+        self.lengths = array("L")
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def append(self, unit) -> None:
+        self.units.append(unit)
+        self.lengths.append(len(unit.source))
+
+    def sort(self, reverse=False) -> None:
+        """Sorts the candidates by the length of their source string."""
+        self.units.sort(key=sourcelen, reverse=reverse)
+        self.lengths = array("L", map(sourcelen, self.units))
+
+    def insert(self, unit) -> None:
+        """
+        Inserts unit into the candidates sorted by source length.
+
+        The unit goes after the candidates of the same length, so the result
+        is the same as appending it and sorting again.
+        """
+        length = len(unit.source)
+        index = bisect_right(self.lengths, length)
+        self.units.insert(index, unit)
+        self.lengths.insert(index, length)
+
+    def remove(self, source):
+        """
+        Removes the candidates with the given source text from the
+        candidates sorted by source length.
+
+        :return: The removed candidates.
+        """
+        length = len(source)
+        start = bisect_left(self.lengths, length)
+        stop = bisect_right(self.lengths, length, lo=start)
+        removed = []
+        for index in range(stop - 1, start - 1, -1):
+            if self.units[index].source == source:
+                removed.append(self.units.pop(index))
+                del self.lengths[index]
+        removed.reverse()
+        return removed
+
+
+class MatchCache:
+    """
+    A bounded least recently used cache of :class:`matcher` results.
+
+    Results are keyed by the searched text, a fingerprint of the translation
+    memory and the matching parameters, so a single cache can be shared by
+    several matchers, for example while processing many files. The cache
+    can be persisted to a file between runs.
+    """
+
+    VERSION = 1
+
+    def __init__(self, maxsize=100000, filename=None) -> None:
+        self.maxsize = maxsize
+        self.filename = filename
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if filename is not None and os.path.exists(filename):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key):
+        """Returns the cached result for key, or None."""
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def stats(self):
+        """Returns the cache statistics."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def load(self) -> None:
+        with open(self.filename, "rb") as handle:
+            try:
+                version, entries = pickle.load(handle)  # ruff:ignore[suspicious-pickle-usage]
+            except (pickle.UnpicklingError, EOFError, ValueError, TypeError):
+                logger.warning("Ignoring invalid match cache %s", self.filename)
+                return
+        if version == self.VERSION:
+            self.entries.update(entries)
+
+    def save(self) -> None:
+        """Writes the cache to :attr:`filename`, if there is one."""
+        if self.filename is None:
+            return
+        with open(self.filename, "wb") as handle:
+            pickle.dump((self.VERSION, list(self.entries.items())), handle)
+
+
+# The matcher used by the worker processes of matcher.matches_many()
+_worker_matcher = None
+
+
+def _init_worker(tmmatcher) -> None:
+    global _worker_matcher  # ruff:ignore[global-statement]
+    _worker_matcher = tmmatcher
+
+
+def _worker_candidates(text):
+    return _worker_matcher.findcandidates(text)  # ty:ignore[unresolved-attribute]
+
+
 class matcher:
     """
     A class that will do matching and store configuration for the matching
@@ -54,6 +234,8 @@ class matcher:
     """
 
     sort_reverse = False
+    #: The class used to store translation memory entries
+    candidate_class: type = Candidate
 
     def __init__(
         self,
@@ -63,18 +245,28 @@ class matcher:
         max_length=70,
         comparer=None,
         usefuzzy=False,
+        ngram_size=None,
+        cache=None,
     ) -> None:
         """
         max_candidates is the maximum number of candidates that should be
         assembled, min_similarity is the minimum similarity that must be
         attained to be included in the result, comparer is an optional Comparer
         with similarity() function.
+
+        If ngram_size is given and the Levenshtein comparer is used, an
+        :class:`~translate.search.ngram.NgramIndex` of that n-gram length is
+        built to avoid comparing candidates that can not reach min_similarity.
+
+        cache is an optional :class:`MatchCache` to look results up in.
         """
         if comparer is None:
             comparer = lshtein.LevenshteinComparer(max_length)
         self.comparer = comparer
         self.setparameters(max_candidates, min_similarity, max_length)
         self.usefuzzy = usefuzzy
+        self.ngram_size = ngram_size
+        self.cache = cache
         self.inittm(store)
         self.addpercentage = True
 
@@ -94,54 +286,170 @@ class matcher:
 
     def inittm(self, stores, reverse=False) -> None:
         """
-        Initialises the memory for later use. We use simple base units for
-        speedup.
+        Initialises the memory for later use. We use simple
+        :class:`Candidate` records for speedup.
+
+        :param stores: A store, a :class:`~translate.search.tmindex.TMIndex`
+                       or a list of these. The memory built from a single
+                       index is kept in it for the next time.
         """
         # reverse is deprecated - just use self.sort_reverse
+        if isinstance(stores, tmindex.TMIndex):
+            cachekey = repr(
+                (
+                    type(self).__qualname__,
+                    type(self.comparer).__name__,
+                    self.MAX_LENGTH,
+                    self.usefuzzy,
+                    self.ngram_size,
+                )
+            )
+            cached = stores.loadcached(cachekey)
+            if cached is not None:
+                self.existingunits, self.candidates, self.ngramindex, fingerprint = (
+                    cached
+                )
+                # Hash objects can not be pickled, changes are hashed after
+                # the fingerprint of the cached memory
+                self._tmhash = hashlib.sha256(fingerprint.encode())
+                self._fingerprint = fingerprint
+                return
+        else:
+            cachekey = None
         self.existingunits = {}
-        self.candidates = base.TranslationStore()
+        self.candidates = CandidateStore()
+        self._tmhash = hashlib.sha256(
+            repr((type(self.comparer).__name__, self.usefuzzy)).encode()
+        )
+        self._fingerprint = None
+        self.ngramindex = None
+        if self.ngram_size and isinstance(self.comparer, lshtein.LevenshteinComparer):
+            self.ngramindex = ngram.NgramIndex(self.ngram_size, self.comparer.MAX_LEN)
 
-        if isinstance(stores, base.TranslationStore):
+        if isinstance(stores, (base.TranslationStore, tmindex.TMIndex)):
             stores = [stores]
         for store in stores:
             self.extendtm(store.units, store=store, sort=False)
-        self.candidates.units.sort(key=sourcelen, reverse=self.sort_reverse)
-
-    def extendtm(self, units, store=None, sort=True) -> None:
+        self.candidates.sort(reverse=self.sort_reverse)
+        if cachekey is not None:
+            stores[0].savecached(
+                cachekey,
+                (
+                    self.existingunits,
+                    self.candidates,
+                    self.ngramindex,
+                    self.fingerprint(),
+                ),
+            )
+
+    def extendtm(self, units, store=None, sort=True, replace=False) -> None:
         """
         Extends the memory with extra unit(s).
 
+        With sort enabled, few new units are inserted at their place in the
+        sorted candidates with a binary search, so that updating a big TM
+        with single units (for example as translations are saved) does not
+        need to sort all the candidates again.
+
         :param units: The units to add to the TM.
         :param store: Optional store from where some metadata can be retrieved
                       and associated with each unit.
         :param sort: Optional parameter that can be set to False to suppress
                      sorting of the candidates list. This should probably
                      only be used in :meth:`matcher.inittm`.
+        :param replace: Whether a unit replaces the candidates with the same
+                        source text already in the TM instead of adding an
+                        alternative translation.
         """
         if isinstance(units, base.TranslationUnit):
             units = [units]
-        for candidate in (unit for unit in units if self.usable(unit)):
-            simpleunit = base.TranslationUnit("")
+        if sort and self.sort_reverse:
+            # Binary search needs candidates in ascending order
+            insert = None
+        elif sort:
+            insert = self.candidates.insert
+        else:
+            insert = self.candidates.append
+        added = []
+        for candidate in units:
+            if (
+                replace
+                and candidate.source in self.existingunits
+                and self.existingunits[candidate.source] != candidate.target
+            ):
+                self.removetm(candidate.source)
+            if not self.usable(candidate):
+                continue
+            simpleunit = self.candidate_class("")
             # We need to ensure that we don't pass multistrings further, since
             # some modules (like the native Levenshtein) can't use it.
             if isinstance(candidate.source, multistring):
                 if len(candidate.source.strings) > 1:
                     simpleunit.orig_source = candidate.source  # ty:ignore[unresolved-attribute]
                     simpleunit.orig_target = candidate.target  # ty:ignore[unresolved-attribute]
-                simpleunit.source = str(candidate.source)
-                simpleunit.target = str(candidate.target)
+                simpleunit.source = _intern(str(candidate.source))
+                simpleunit.target = _intern(str(candidate.target))
             else:
-                simpleunit.source = candidate.source
-                simpleunit.target = candidate.target
+                simpleunit.source = _intern(candidate.source)
+                simpleunit.target = _intern(candidate.target)
             # If we now only get translator comments, we don't get programmer
             # comments in TM suggestions (in Pootle, for example). If we get all
             # notes, pot2po adds all previous comments as translator comments
             # in the new po file
             simpleunit.addnote(candidate.getnotes(origin="translator"))
             simpleunit.fuzzy = candidate.isfuzzy()  # ty:ignore[unresolved-attribute]
-            self.candidates.units.append(simpleunit)
-        if sort:
-            self.candidates.units.sort(key=sourcelen, reverse=self.sort_reverse)
+            added.append(simpleunit)
+            self._tmhash.update(
+                repr(
+                    (
+                        getattr(candidate.source, "strings", candidate.source),
+                        getattr(candidate.target, "strings", candidate.target),
+                        simpleunit.getnotes(),
+                        simpleunit.fuzzy,
+                    )
+                ).encode()
+            )
+            self._fingerprint = None
+            if self.ngramindex is not None:
+                self.ngramindex.add(simpleunit)
+        if insert is not None and len(added) <= max(len(self.candidates) // 100, 1):
+            for simpleunit in added:
+                insert(simpleunit)
+        else:
+            # Sorting once is faster than many insertions into a big list
+            for simpleunit in added:
+                self.candidates.append(simpleunit)
+            if sort:
+                self.candidates.sort(reverse=self.sort_reverse)
+
+    def removetm(self, source) -> None:
+        """
+        Removes the candidates with the given source text from the memory.
+
+        :param source: The source text of the units to remove.
+        """
+        if source not in self.existingunits:
+            return
+        del self.existingunits[source]
+        source = str(source)
+        if self.sort_reverse:
+            removed = [unit for unit in self.candidates.units if unit.source == source]
+            if removed:
+                self.candidates.units = [
+                    unit for unit in self.candidates.units if unit.source != source
+                ]
+                self.candidates.lengths = array(
+                    "L", map(sourcelen, self.candidates.units)
+                )
+        else:
+            removed = self.candidates.remove(source)
+        if not removed:
+            return
+        self._tmhash.update(repr(("-", source)).encode())
+        self._fingerprint = None
+        if self.ngramindex is not None:
+            for unit in removed:
+                self.ngramindex.remove(unit)
 
     def setparameters(
         self, max_candidates=10, min_similarity=75, max_length=70
@@ -154,6 +462,31 @@ class matcher:
         self.MIN_SIMILARITY = min_similarity
         self.MAX_LENGTH = max_length
 
+    def __getstate__(self):
+        odict = self.__dict__.copy()
+        # Hash objects can not be pickled, and results are only cached in
+        # the main process
+        odict["_tmhash"] = None
+        odict["_fingerprint"] = self.fingerprint()
+        odict["cache"] = None
+        return odict
+
+    def fingerprint(self):
+        """Returns a fingerprint of the content of the translation memory."""
+        if self._fingerprint is None:
+            self._fingerprint = self._tmhash.hexdigest()
+        return self._fingerprint
+
+    def cachekey(self, text):
+        """Returns the key of the results for text in :attr:`cache`."""
+        return (
+            text,
+            self.fingerprint(),
+            self.MIN_SIMILARITY,
+            self.MAX_CANDIDATES,
+            self.MAX_LENGTH,
+        )
+
     def getstoplength(self, min_similarity, text):
         """
         Calculates a length beyond which we are not interested.  The extra
@@ -179,32 +512,116 @@ class matcher:
                  *True* (default) the match quality is given as a
                  percentage in the notes.
         """
-        bestcandidates = [(0.0, None)] * self.MAX_CANDIDATES
+        return self.buildunits(self.findcandidates(text))
+
+    def matches_many(self, texts, processes=1) -> list[list[base.TranslationUnit]]:
+        """
+        Returns the lists of possible matches for many source texts.
+
+        Every distinct text is only searched for once.
+
+        :param texts: The texts that will be searched for in the translation
+                      memory.
+        :param processes: The number of worker processes to spread the
+                          search over. The candidates are passed to each
+                          worker once, when it starts.
+        :return: a list with the result of :meth:`matches` for every text.
+        """
+        texts = list(texts)
+        found = {}
+        if self.cache is not None:
+            for text in dict.fromkeys(texts):
+                cached = self.cache.get(self.cachekey(text))
+                if cached is not None:
+                    found[text] = cached
+        unique = [text for text in dict.fromkeys(texts) if text not in found]
+        if processes > 1 and len(unique) > 1:
+            # Spawn the workers, forking a possibly multi-threaded process is
+            # not safe
+            with ProcessPoolExecutor(
+                processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as executor:
+                chunksize = max(1, len(unique) // (processes * 4))
+                results = list(
+                    executor.map(_worker_candidates, unique, chunksize=chunksize)
+                )
+        else:
+            results = [self._findcandidates(text) for text in unique]
+        for text, candidates in zip(unique, results, strict=True):
+            found[text] = candidates
+            if self.cache is not None:
+                self.cache.set(self.cachekey(text), candidates)
+        return [self.buildunits(found[text]) for text in texts]
+
+    def findcandidates(self, text):
+        """
+        Returns the best (score, candidate) pairs for given source text,
+        best first.
+        """
+        if self.cache is not None:
+            key = self.cachekey(text)
+            cached = self.cache.get(key)
+            if cached is None:
+                cached = self._findcandidates(text)
+                self.cache.set(key, cached)
+            return cached
+        return self._findcandidates(text)
+
+    def _findcandidates(self, text):
+        # The heap holds (similarity, order, candidate), the order avoids
+        # comparing candidates of equal similarity, evicting later ones first
+        bestcandidates = [(0.0, 0, None)] * self.MAX_CANDIDATES
+        order = 0
         # We use self.MIN_SIMILARITY, but if we already know we have max_candidates
         # that are better, we can adjust min_similarity upwards for speedup
         min_similarity = self.MIN_SIMILARITY
 
         # We want to limit our search in self.candidates, so we want to ignore
         # all units with a source string that is too short or too long. We use
-        # a binary search to find the shortest string, from where we start our
-        # search in the candidates.
+        # a binary search on the source lengths to find the shortest and the
+        # longest string to consider.
 
         # minimum source string length to be considered
         startlength = self.getstartlength(min_similarity, text)
-        startindex = 0
-        endindex = len(self.candidates.units)
-        while startindex < endindex:
-            mid = (startindex + endindex) // 2
-            if sourcelen(self.candidates.units[mid]) < startlength:
-                startindex = mid + 1
-            else:
-                endindex = mid
-
         # maximum source string length to be considered
         stoplength = self.getstoplength(min_similarity, text)
+
+        if self.ngramindex is not None:
+            # The index already drops candidates which can not reach
+            # min_similarity and those outside of the length window
+            candidates = self.ngramindex.shortlist(
+                text, min_similarity, startlength, stoplength
+            )
+        else:
+            candidates = self.candidates.units[
+                bisect_left(self.candidates.lengths, startlength) : bisect_right(
+                    self.candidates.lengths, stoplength
+                )
+            ]
+
         lowestscore = 0
 
-        for candidate in self.candidates.units[startindex:]:
+        if lshtein.process is not None and isinstance(
+            self.comparer, lshtein.LevenshteinComparer
+        ):
+            # Score the whole length window in one native call
+            for index, similarity in self.comparer.similarity_many(
+                text, [candidate.source for candidate in candidates], min_similarity
+            ):
+                if similarity > lowestscore:
+                    order -= 1
+                    heapq.heapreplace(
+                        bestcandidates, (similarity, order, candidates[index])
+                    )
+                    lowestscore = bestcandidates[0][0]
+                    if lowestscore >= 100:
+                        break
+            candidates = []
+
+        for candidate in candidates:
             cmpstring = candidate.source
             if len(cmpstring) > stoplength:
                 break
@@ -212,7 +629,8 @@ class matcher:
             if similarity < min_similarity:
                 continue
             if similarity > lowestscore:
-                heapq.heapreplace(bestcandidates, (similarity, candidate))
+                order -= 1
+                heapq.heapreplace(bestcandidates, (similarity, order, candidate))
                 lowestscore = bestcandidates[0][0]
                 if lowestscore >= 100:
                     break
@@ -221,10 +639,14 @@ class matcher:
                     stoplength = self.getstoplength(min_similarity, text)
 
         # Remove the empty ones:
-        bestcandidates = [item for item in bestcandidates if item[0] != 0]
+        bestcandidates = [
+            (similarity, candidate)
+            for similarity, _order, candidate in bestcandidates
+            if similarity != 0
+        ]
         # Sort for use as a general list, and reverse so the best one is at index 0
         bestcandidates.sort(key=itemgetter(0), reverse=True)
-        return self.buildunits(bestcandidates)
+        return bestcandidates
 
     def buildunits(self, candidates):
         """
@@ -234,10 +656,11 @@ class matcher:
         units = []
         for score, candidate in candidates:
             if hasattr(candidate, "orig_source"):
-                candidate.source = candidate.orig_source
-                candidate.target = candidate.orig_target
-            newunit = po.pounit(candidate.source)
-            newunit.target = candidate.target
+                newunit = po.pounit(candidate.orig_source)
+                newunit.target = candidate.orig_target
+            else:
+                newunit = po.pounit(candidate.source)
+                newunit.target = candidate.target
             newunit.markfuzzy(candidate.fuzzy)
             candidatenotes = candidate.getnotes().strip()
             if candidatenotes:
@@ -270,6 +693,8 @@ class terminologymatcher(matcher):
     """A matcher with settings specifically for terminology matching."""
 
     sort_reverse = True
+    # Matches are returned as they are stored, so keep them full units
+    candidate_class = base.TranslationUnit
 
     def __init__(
         self, store, max_candidates=10, min_similarity=75, max_length=500, comparer=None
@@ -286,8 +711,28 @@ class terminologymatcher(matcher):
         self.addpercentage = False
         self.match_info = {}
 
+    def extendtm(self, units, store=None, sort=True, replace=False) -> None:
+        super().extendtm(units, store=store, sort=sort, replace=replace)
+        # The automaton is rebuilt on the next lookup
+        self.automaton = None
+
+    def removetm(self, source) -> None:
+        super().removetm(source)
+        self.automaton = None
+
+    def buildautomaton(self) -> None:
+        """
+        Compiles the candidate terms, including their altered forms, into
+        a :class:`~translate.search.terminology.TermAutomaton`.
+        """
+        self.termindexes = {}
+        for index, unit in enumerate(self.candidates.units):
+            self.termindexes.setdefault(unit.source, []).append(index)
+        self.automaton = terminology.TermAutomaton(self.termindexes)
+
     def inittm(self, store) -> None:  # ty:ignore[invalid-method-override]
         """Normal initialisation, but convert all source strings to lower case."""
+        self.automaton = None
         super().inittm(store)
         extras = []
         for unit in self.candidates.units:
@@ -302,7 +747,7 @@ class terminologymatcher(matcher):
                     # We mark it fuzzy to indicate that it isn't pristine
                     unit.markfuzzy()
                     extras.append(new_unit)
-        self.candidates.units.sort(key=sourcelen, reverse=self.sort_reverse)
+        self.candidates.sort(reverse=self.sort_reverse)
         if extras:
             # We don't sort, so that the altered forms are at the back and
             # considered last.
@@ -341,29 +786,51 @@ class terminologymatcher(matcher):
         matches = []
         known = set()
 
-        # We want to limit our search in self.candidates, so we want to ignore
-        # all units with a source string that is too long. We use binary search
-        # to find the first string short enough to occur in text, from where we
-        # start our search in the candidates.
-
-        # the maximum possible length is text_l
-        startindex = 0
-        endindex = len(self.candidates.units)
-        while startindex < endindex:
-            mid = (startindex + endindex) // 2
-            if sourcelen(self.candidates.units[mid]) > text_l:
-                startindex = mid + 1
-            else:
-                endindex = mid
-
-        for cand in self.candidates.units[startindex:]:
+        if isinstance(comparer, terminology.TerminologyComparer):
+            # Find all terms in a single pass over the text
+            if self.automaton is None:
+                self.buildautomaton()
+            positions = self.automaton.find(text[: comparer.MAX_LEN])
+            comparer.match_info = {
+                term: {"pos": pos} for term, pos in positions.items()
+            }
+            candidates = [
+                self.candidates.units[index]
+                for index in sorted(
+                    index
+                    for term in positions
+                    if len(term) <= text_l
+                    for index in self.termindexes[term]
+                )
+            ]
+        else:
+            # We want to limit our search in self.candidates, so we want to
+            # ignore all units with a source string that is too long. We use
+            # binary search to find the first string short enough to occur in
+            # text, from where we start our search in the candidates.
+
+            # the maximum possible length is text_l
+            startindex = 0
+            endindex = len(self.candidates.units)
+            while startindex < endindex:
+                mid = (startindex + endindex) // 2
+                if sourcelen(self.candidates.units[mid]) > text_l:
+                    startindex = mid + 1
+                else:
+                    endindex = mid
+            candidates = [
+                cand
+                for cand in self.candidates.units[startindex:]
+                if comparer.similarity(text, cand.source, self.MIN_SIMILARITY)
+            ]
+
+        for cand in candidates:
             source = cand.source
             if (source, cand.target) in known:
                 continue
-            if comparer.similarity(text, source, self.MIN_SIMILARITY):
-                match_info[source] = {"pos": comparer.match_info[source]["pos"]}  # ty:ignore[unresolved-attribute]
-                matches.append(cand)
-                known.add((source, cand.target))
+            match_info[source] = {"pos": comparer.match_info[source]["pos"]}  # ty:ignore[unresolved-attribute]
+            matches.append(cand)
+            known.add((source, cand.target))
 
         final_matches = []
         lastend = 0
@@ -395,6 +862,15 @@ class terminologymatcher(matcher):
             self.match_info = match_info
         return final_matches
 
+    def matches_many(self, texts, processes=1):
+        """
+        Returns the lists of terminology matches for many texts.
+
+        Terminology matching is cheap and keeps :attr:`match_info` of the last
+        match, so it is always done in this process.
+        """
+        return [self.matches(text) for text in texts]
+
 
 # utility functions used by virtaal and tmserver to convert matching units in easily marshallable dictionaries
 def unit2dict(unit):
@@ -409,7 +885,7 @@ def unit2dict(unit):
 
 def _parse_quality(comment):
     """Extracts match quality from po comments."""
-    quality = re.search(r"([0-9]+)%", comment)
+    quality = re.search(r"([0-9]+)(?:\.[0-9]+)?%", comment)
     if quality:
         return quality.group(1)
     return None
@@ -0,0 +1,178 @@
+#
+# Copyright 2026 Translate toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Character n-gram inverted index used to prune translation memory candidates.
+
+The index implements q-gram count filtering: two strings ``a`` and ``b``
+with a Levenshtein distance of at most ``k`` share at least
+``max(len(a), len(b)) - q + 1 - k * q`` of their q-grams. Candidates sharing
+fewer n-grams with the searched text can not reach the requested similarity
+and are never passed to the (expensive) comparer.
+
+.. seealso:: :wp:`N-gram`
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import insort
+from collections import Counter
+
+
+class NgramIndex:
+    """
+    An inverted index from character n-grams to translation memory units.
+
+    Units are bucketed by the length of their source text, so that a lookup
+    only has to visit the lengths the caller is interested in.
+    """
+
+    def __init__(self, size=3, max_len=None) -> None:
+        """
+        :param size: Length of the n-grams to index.
+        :param max_len: The number of leading characters that the comparer
+                        considers, see
+                        :attr:`translate.search.lshtein.LevenshteinComparer.MAX_LEN`.
+        """
+        self.size = size
+        self.max_len = max_len
+        self._nextseq = 0
+        # unit sequence number -> unit
+        self.units = {}
+        # id(unit) -> unit sequence number
+        self._seqs = {}
+        # source length -> unit sequence numbers
+        self.lengths = {}
+        self._sortedlengths = []
+        # n-gram -> source length -> {unit sequence number: occurrences}
+        self.postings = {}
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def __getstate__(self):
+        odict = self.__dict__.copy()
+        # unit ids are not valid after unpickling
+        del odict["_seqs"]
+        return odict
+
+    def __setstate__(self, state) -> None:
+        self.__dict__.update(state)
+        self._seqs = {id(unit): seq for seq, unit in self.units.items()}
+
+    def grams(self, text):
+        """Returns the n-grams of text with the number of their occurrences."""
+        if self.max_len is not None:
+            text = text[: self.max_len]
+        size = self.size
+        return Counter(text[i : i + size] for i in range(len(text) - size + 1))
+
+    def add(self, unit) -> None:
+        """Adds unit to the index."""
+        seq = self._nextseq
+        self._nextseq += 1
+        length = len(unit.source)
+        self.units[seq] = unit
+        self._seqs[id(unit)] = seq
+        if length not in self.lengths:
+            self.lengths[length] = set()
+            insort(self._sortedlengths, length)
+        self.lengths[length].add(seq)
+        for gram, occurrences in self.grams(unit.source).items():
+            self.postings.setdefault(gram, {}).setdefault(length, {})[seq] = occurrences
+
+    def remove(self, unit) -> None:
+        """Removes unit from the index."""
+        seq = self._seqs.pop(id(unit))
+        del self.units[seq]
+        length = len(unit.source)
+        self.lengths[length].discard(seq)
+        if not self.lengths[length]:
+            del self.lengths[length]
+            self._sortedlengths.remove(length)
+        for gram in self.grams(unit.source):
+            bylength = self.postings[gram]
+            bylength[length].pop(seq, None)
+            if not bylength[length]:
+                del bylength[length]
+                if not bylength:
+                    del self.postings[gram]
+
+    def threshold(self, length, textlength, min_similarity):
+        """
+        Returns the minimal number of shared n-grams for a candidate of the
+        given source length to be able to reach min_similarity.
+
+        A result smaller than one means that count filtering can not rule out
+        any candidate of this length.
+        """
+        if self.max_len is not None:
+            length = min(length, self.max_len)
+            textlength = min(textlength, self.max_len)
+        longest = max(length, textlength)
+        maxdistance = math.ceil((100 - min_similarity) / 100.0 * longest)
+        return longest - self.size + 1 - maxdistance * self.size
+
+    def shortlist(self, text, min_similarity, startlength, stoplength):
+        """
+        Returns units with a source length between startlength and
+        stoplength which might be at least min_similarity similar to text.
+
+        The units are ordered by source length, and in order of addition for
+        units of equal length.
+        """
+        textlength = len(text)
+        shortlist = []
+        thresholds = {}
+        for length in self._sortedlengths:
+            if length < startlength:
+                continue
+            if length > stoplength:
+                break
+            threshold = self.threshold(length, textlength, min_similarity)
+            if threshold > 0:
+                thresholds[length] = threshold
+            else:
+                shortlist.extend(self.lengths[length])
+
+        if thresholds:
+            shared = Counter()
+            for gram, occurrences in self.grams(text).items():
+                bylength = self.postings.get(gram)
+                if not bylength:
+                    continue
+                for length in thresholds:
+                    entries = bylength.get(length)
+                    if not entries:
+                        continue
+                    if occurrences == 1:
+                        # Most n-grams occur once, count those in bulk
+                        shared.update(entries.keys())
+                    else:
+                        for seq, unitoccurrences in entries.items():
+                            shared[seq] += min(occurrences, unitoccurrences)
+            units = self.units
+            shortlist.extend(
+                seq
+                for seq, common in shared.items()
+                if common >= thresholds[len(units[seq].source)]
+            )
+
+        shortlist.sort(key=lambda seq: (len(self.units[seq].source), seq))
+        return [self.units[seq] for seq in shortlist]
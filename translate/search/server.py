@@ -0,0 +1,329 @@
+#
+# Copyright 2026 Translate toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+A local translation memory lookup server.
+
+The server loads a translation memory (and optionally a terminology file)
+once and answers lookups from several processes on the same host over a
+Unix socket or TCP, so that they share a single warm
+:class:`~translate.search.match.matcher`.
+
+The protocol is line based: every request is a JSON object on its own
+line, for example::
+
+    {"id": 1, "type": "matches", "text": "Open file"}
+
+The ``type`` is one of ``matches``, ``terminology`` or ``stats``. The
+response is a JSON object on its own line with the same ``id`` and either
+a ``result`` or an ``error``. Lookups of a kind arriving together are
+handled as a single batch by :meth:`~translate.search.match.matcher.matches_many`.
+
+:class:`TMClient` is a simple blocking client for this protocol. The server
+can be started with ``python -m translate.search.server``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import socket
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+
+from translate.search import match, tmindex
+from translate.storage import factory
+
+logger = logging.getLogger(__name__)
+
+
+class TMServer:
+    """Serves lookups from a translation memory and terminology matcher."""
+
+    def __init__(
+        self, tmmatcher, termmatcher=None, batch_size=64, batch_delay=0.005
+    ) -> None:
+        """
+        :param tmmatcher: The :class:`~translate.search.match.matcher` for
+                          ``matches`` requests.
+        :param termmatcher: The
+                            :class:`~translate.search.match.terminologymatcher`
+                            for ``terminology`` requests.
+        :param batch_size: The maximal number of lookups in a batch.
+        :param batch_delay: How long (in seconds) to wait for more lookups
+                            to join a batch.
+        """
+        self.matchers = {"matches": tmmatcher}
+        if termmatcher is not None:
+            self.matchers["terminology"] = termmatcher
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.queues = {}
+        self.tasks = []
+        self.server = None
+        # The matchers are not thread safe, so they get a single thread
+        self.executor = ThreadPoolExecutor(1)
+        self.started = time.monotonic()
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self.latency = 0.0
+        self.max_latency = 0.0
+
+    async def start(self, path=None, host="127.0.0.1", port=0):
+        """
+        Starts serving on the Unix socket path, or on host and port if no
+        path is given.
+
+        :return: The :class:`asyncio.Server`.
+        """
+        for kind in self.matchers:
+            self.queues[kind] = asyncio.Queue()
+            self.tasks.append(asyncio.create_task(self._process(kind)))
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port)
+        self.started = time.monotonic()
+        return self.server
+
+    async def close(self) -> None:
+        """Stops the server."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        self.executor.shutdown()
+
+    def stats(self):
+        """Returns the request counters of the server."""
+        uptime = time.monotonic() - self.started
+        stats = {
+            "requests": self.requests,
+            "batches": self.batches,
+            "errors": self.errors,
+            "uptime": uptime,
+            "throughput": self.requests / uptime if uptime else 0.0,
+            "average_batch": self.requests / self.batches if self.batches else 0.0,
+            "average_latency": self.latency / self.requests if self.requests else 0.0,
+            "max_latency": self.max_latency,
+        }
+        cache = self.matchers["matches"].cache
+        if cache is not None:
+            stats["cache"] = cache.stats()
+        return stats
+
+    async def lookup(self, kind, text):
+        """Queues text for a lookup of the given kind and returns the result."""
+        if kind not in self.queues:
+            raise ValueError(f"Unsupported lookup: {kind}")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        await self.queues[kind].put((text, future, loop.time()))
+        return await future
+
+    def _lookup(self, kind, texts):
+        return [
+            [match.unit2dict(unit) for unit in units]
+            for units in self.matchers[kind].matches_many(texts)
+        ]
+
+    async def _process(self, kind) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self.queues[kind]
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except TimeoutError:
+                        break
+                else:
+                    batch.append(queue.get_nowait())
+            texts = [text for text, _future, _queued in batch]
+            try:
+                results = await loop.run_in_executor(
+                    self.executor, self._lookup, kind, texts
+                )
+            except Exception as error:
+                logger.exception("Lookup failed")
+                results = [error] * len(batch)
+            done = loop.time()
+            self.batches += 1
+            self.requests += len(batch)
+            for (_text, future, queued), result in zip(batch, results, strict=True):
+                self.latency += done - queued
+                self.max_latency = max(self.max_latency, done - queued)
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _respond(self, writer, line) -> None:
+        response = {}
+        try:
+            request = json.loads(line)
+            response["id"] = request.get("id")
+            response["result"] = await self._result(request)
+        except Exception as error:
+            self.errors += 1
+            response["error"] = str(error)
+        writer.write(json.dumps(response).encode("utf-8") + b"\n")
+        await writer.drain()
+
+    async def _result(self, request: dict):
+        kind = request.get("type")
+        if kind == "stats":
+            return self.stats()
+        return await self.lookup(kind, request["text"])
+
+    async def _handle(self, reader, writer) -> None:
+        # Requests on a connection are answered as soon as they are done, so
+        # a client can send several at once
+        pending = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._respond(writer, line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            writer.close()
+
+
+class TMClient:
+    """A blocking client for a :class:`TMServer`."""
+
+    def __init__(self, path=None, host="127.0.0.1", port=None, timeout=None) -> None:
+        if path is not None:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(path)
+        else:
+            self.socket = socket.create_connection((host, port), timeout)
+        self.file = self.socket.makefile("rwb")
+        self.nextid = 0
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def request(self, kind, text=None):
+        """Sends a request to the server and returns its result."""
+        self.nextid += 1
+        request = {"id": self.nextid, "type": kind}
+        if text is not None:
+            request["text"] = text
+        self.file.write(json.dumps(request).encode("utf-8") + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("Connection closed by the TM server")
+        response = json.loads(line)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    def matches(self, text):
+        """Returns the translation memory matches for text as dictionaries."""
+        return self.request("matches", text)
+
+    def terminology(self, text):
+        """Returns the terminology matches for text as dictionaries."""
+        return self.request("terminology", text)
+
+    def stats(self):
+        """Returns the request counters of the server."""
+        return self.request("stats")
+
+
+async def serve(server, path=None, host="127.0.0.1", port=0) -> None:
+    """Runs server until it is cancelled."""
+    asyncserver = await server.start(path, host, port)
+    for sock in asyncserver.sockets:
+        logger.info("Serving translation memory on %s", sock.getsockname())
+    try:
+        await asyncserver.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(arguments=None) -> None:
+    parser = ArgumentParser(description="Serve translation memory lookups.")
+    parser.add_argument(
+        "--tm", action="append", default=[], help="translation memory file"
+    )
+    parser.add_argument("--tm-index", help="translation memory index database")
+    parser.add_argument("--terminology", help="terminology file")
+    parser.add_argument("--socket", help="Unix socket to listen on")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument("--max-candidates", type=int, default=3)
+    parser.add_argument("--min-similarity", type=int, default=75)
+    parser.add_argument("--max-length", type=int, default=1000)
+    args = parser.parse_args(arguments)
+    if not args.tm and not args.tm_index:
+        parser.error("a translation memory is required")
+
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.ExitStack() as stack:
+        if args.tm_index:
+            stores = stack.enter_context(tmindex.TMIndex(args.tm_index))
+            # Without TM files, serve the index as it is
+            if args.tm:
+                stores.update(args.tm)
+        else:
+            stores = [factory.getobject(tmfile) for tmfile in args.tm]
+        tmmatcher = match.matcher(
+            stores,
+            max_candidates=args.max_candidates,
+            min_similarity=args.min_similarity,
+            max_length=args.max_length,
+            ngram_size=3,
+            cache=match.MatchCache(),
+        )
+    termmatcher = None
+    if args.terminology:
+        termmatcher = match.terminologymatcher(factory.getobject(args.terminology))
+    server = TMServer(tmmatcher, termmatcher)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(server, args.socket, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,8 @@
 
 """A class that does terminology matching."""
 
+from collections import deque
+
 
 class TerminologyComparer:
     def __init__(self, max_len=500) -> None:
@@ -43,3 +45,75 @@ class TerminologyComparer:
             self.match_info[term] = {"pos": pos}
             return 100
         return 0
+
+
+class TermAutomaton:
+    """
+    An Aho-Corasick automaton to find many terms in a text in a single pass.
+
+    .. seealso:: :wp:`Aho–Corasick_algorithm`
+    """
+
+    def __init__(self, terms) -> None:
+        # Transitions, failure links and the term ending in every state
+        self.goto = [{}]
+        self.fail = [0]
+        self.term = [None]
+        # Link to the next state on the failure chain that ends a term
+        self.output = [0]
+        for term in terms:
+            self.add(term)
+        self._link()
+
+    def add(self, term) -> None:
+        state = 0
+        for char in term:
+            nextstate = self.goto[state].get(char)
+            if nextstate is None:
+                nextstate = len(self.goto)
+                self.goto[state][char] = nextstate
+                self.goto.append({})
+                self.fail.append(0)
+                self.term.append(None)
+                self.output.append(0)
+            state = nextstate
+        self.term[state] = term
+
+    def _link(self) -> None:
+        """Computes the failure links in breadth first order."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nextstate in self.goto[state].items():
+                queue.append(nextstate)
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                fail = self.goto[fail].get(char, 0)
+                self.fail[nextstate] = fail
+                self.output[nextstate] = (
+                    fail if self.term[fail] is not None else self.output[fail]
+                )
+
+    def find(self, text):
+        """
+        Returns a dictionary of the terms occurring in text, with the
+        position of their first occurrence.
+        """
+        goto = self.goto
+        fail = self.fail
+        terms = self.term
+        output = self.output
+        found = {}
+        state = 0
+        for pos, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            match = state if terms[state] is not None else output[state]
+            while match:
+                term = terms[match]
+                if term not in found:
+                    found[term] = pos - len(term) + 1
+                match = output[match]
+        return found
@@ -0,0 +1,246 @@
+#
+# Copyright 2026 Translate toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+A persistent translation memory index stored in an SQLite database.
+
+Parsing big translation memories (PO compendia, TMX or XLIFF files) is
+slow. The index keeps the entries usable for fuzzy matching in a database
+file and only reparses translation memory files which changed since the
+last :meth:`TMIndex.update`, so repeated runs can skip parsing completely.
+
+The index can be passed directly to :class:`~translate.search.match.matcher`
+instead of a store. The candidates (and n-gram index) the matcher builds
+from the indexed entries are kept in the index too, see
+:meth:`TMIndex.loadcached`, so later runs with the same translation memory
+and matcher settings load them instead of building them again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pickle  # ruff:ignore[suspicious-pickle-import]
+import sqlite3
+
+from translate.misc.multistring import multistring
+from translate.storage import base, factory
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    file INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    sources TEXT,
+    targets TEXT,
+    notes TEXT NOT NULL,
+    fuzzy INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS units_file ON units(file);
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+"""
+
+
+class TMIndexUnit(base.TranslationUnit):
+    """A translation memory entry loaded from a :class:`TMIndex`."""
+
+    def __init__(self, source=None, fuzzy=False) -> None:
+        super().__init__(source)
+        self.fuzzy = fuzzy
+
+    def isfuzzy(self) -> bool:
+        return self.fuzzy
+
+    def markfuzzy(self, value=True) -> None:
+        self.fuzzy = value
+
+
+def _plurals(text):
+    """Returns the JSON encoded plural forms of text, if there are any."""
+    if isinstance(text, multistring) and len(text.strings) > 1:
+        return json.dumps(text.strings)
+    return None
+
+
+class TMIndex:
+    """An SQLite backed index of translation memory files."""
+
+    def __init__(self, filename) -> None:
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in {0, SCHEMA_VERSION}:
+            logger.info("Rebuilding TM index %s with old schema", filename)
+            with self.connection:
+                self.connection.execute("DROP TABLE IF EXISTS units")
+                self.connection.execute("DROP TABLE IF EXISTS files")
+                self.connection.execute("DROP TABLE IF EXISTS cache")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.paths = [
+            path
+            for (path,) in self.connection.execute("SELECT path FROM files ORDER BY id")
+        ]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def update(self, tmfiles) -> bool:
+        """
+        Synchronises the index with the given translation memory files.
+
+        Files which are not listed are dropped from the index, files which
+        changed since they were indexed (as seen by their modification time
+        and size) are parsed again.
+
+        :return: Whether the index content changed.
+        """
+        if isinstance(tmfiles, (str, os.PathLike)):
+            tmfiles = [tmfiles]
+        paths = [os.path.abspath(os.fspath(tmfile)) for tmfile in tmfiles]
+        changed = False
+        with self.connection:
+            known = {
+                path: (fileid, mtime, size)
+                for fileid, path, mtime, size in self.connection.execute(
+                    "SELECT id, path, mtime, size FROM files"
+                )
+            }
+            for path in set(known) - set(paths):
+                self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+                changed = True
+            for path in paths:
+                stat = os.stat(path)
+                if known.get(path, (None,))[1:] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+                self._addfile(path, stat)
+                changed = True
+            if changed:
+                self.connection.execute("DELETE FROM cache")
+        self.paths = paths
+        return changed
+
+    def _addfile(self, path, stat) -> None:
+        logger.debug("Indexing translation memory %s", path)
+        store = factory.getobject(path)
+        fileid = self.connection.execute(
+            "INSERT INTO files (path, mtime, size) VALUES (?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size),
+        ).lastrowid
+        self.connection.executemany(
+            "INSERT INTO units (file, source, target, sources, targets, notes, fuzzy)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    fileid,
+                    str(unit.source),
+                    str(unit.target),
+                    _plurals(unit.source),
+                    _plurals(unit.target),
+                    unit.getnotes(origin="translator"),
+                    unit.isfuzzy(),
+                )
+                for unit in store.units
+                if unit.source and unit.target
+            ),
+        )
+
+    def _cachekey(self, key: str) -> str:
+        # The units are in the order of the files
+        return json.dumps([key, self.paths])
+
+    def loadcached(self, key: str):
+        """
+        Returns the object stored by :meth:`savecached` for key, or None if
+        the indexed units changed since.
+
+        Like the index itself, the objects are only loaded from trusted files.
+        """
+        row = self.connection.execute(
+            "SELECT data FROM cache WHERE key = ?", (self._cachekey(key),)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])  # ruff:ignore[suspicious-pickle-usage]
+        except Exception:
+            # From an incompatible version
+            logger.info("Ignoring invalid cached %s in TM index", key)
+            return None
+
+    def savecached(self, key: str, value) -> None:
+        """Stores an object built from the indexed units, see :meth:`loadcached`."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cache (key, data) VALUES (?, ?)",
+                (
+                    self._cachekey(key),
+                    pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                ),
+            )
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM units").fetchone()[0]
+
+    @property
+    def units(self):
+        """
+        The indexed units, in the order of the translation memory
+        files passed to the last :meth:`update`.
+        """
+        for path in self.paths:
+            rows = self.connection.execute(
+                "SELECT units.source, units.target, units.sources, units.targets,"
+                " units.notes, units.fuzzy FROM units JOIN files"
+                " ON units.file = files.id WHERE files.path = ? ORDER BY units.id",
+                (path,),
+            )
+            for source, target, sources, targets, notes, fuzzy in rows:
+                if sources is not None:
+                    source = multistring(json.loads(sources))
+                if targets is not None:
+                    target = multistring(json.loads(targets))
+                unit = TMIndexUnit(source, bool(fuzzy))
+                unit.target = target
+                if notes:
+                    unit.addnote(notes)
+                yield unit
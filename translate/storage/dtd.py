@@ -81,10 +81,17 @@ Escaping in Android DTD
 
     - The ' character is escaped using \&apos; or \' or \u0027
     - The " character is escaped using \&quot;
+
+Passthrough
+    By default all the units are normalized when the file is written. With
+    ``dtdfile(inputfile, passthrough=True)``, units which did not change
+    since parsing are written as they were parsed instead. This is only
+    available when using the library, the converters always normalize.
 """
 
 import re
 import warnings
+from itertools import accumulate
 
 from lxml import etree
 
@@ -227,6 +234,10 @@ class DTDValidationResolver(etree.Resolver):
 class dtdunit(base.TranslationUnit):
     """An entity definition from a DTD file (and any associated comments)."""
 
+    # The parsed text, the span of the unit in it, its _rawkey() and the
+    # encoding of the file, see dtdfile.serialize()
+    _rawsource: tuple[str, int, int, tuple, str] | None = None
+
     def __init__(self, source="", android=False) -> None:
         """Construct the dtdunit, prepare it for parsing."""
         self.android = android
@@ -277,6 +288,21 @@ class dtdunit(base.TranslationUnit):
             self.definition = quotefordtd(target)
         self._rich_target = None
 
+    def _rawkey(self) -> tuple:
+        """Returns everything getoutput() writes, to tell whether it changed."""
+        return (
+            self.entity,
+            self.definition,
+            tuple(self.comments),
+            tuple(self.unparsedlines),
+            self.space_pre_entity,
+            self.space_pre_definition,
+            self.closing,
+            getattr(self, "entitytype", None),
+            getattr(self, "entityparameter", None),
+            getattr(self, "hashprefix", None),
+        )
+
     def getid(self):
         return self.entity
 
@@ -332,10 +358,15 @@ class dtdfile(base.TranslationStore):
     """A .dtd file made up of dtdunits."""
 
     UnitClass = dtdunit
+    # Whether serialize() writes unchanged units as they were parsed, instead
+    # of normalizing them
+    passthrough = False
 
-    def __init__(self, inputfile=None, android=False) -> None:
+    def __init__(self, inputfile=None, android=False, passthrough=None) -> None:
         """Construct a dtdfile, optionally reading in from inputfile."""
         super().__init__()
+        if passthrough is not None:
+            self.passthrough = passthrough
         self.filename = getattr(inputfile, "name", "")
         self.android = android
         if inputfile is not None:
@@ -441,12 +472,20 @@ class dtdfile(base.TranslationStore):
         if lines and not lines[-1]:
             lines = lines[:-1]
 
+        # The offsets of the lines in source
+        offsets = (
+            list(accumulate((len(line) + 1 for line in lines), initial=0))
+            if self.passthrough and "\r" not in source
+            else None
+        )
+
         # Parse state
         line_idx = 0
 
         while line_idx < len(lines):
             # Create a new unit
             newdtd = dtdunit(android=self.android)
+            first_idx = line_idx
 
             # Initialize unit state
             newdtd.comments = []
@@ -633,14 +672,38 @@ class dtdfile(base.TranslationStore):
                 not newdtd.isblank() or newdtd.unparsedlines or newdtd.comments
             ):
                 self.units.append(newdtd)
+                # Units at the end of a file without final newline are
+                # written as usual
+                if offsets is not None and offsets[line_idx] <= len(source):
+                    newdtd._rawsource = (
+                        source,
+                        offsets[first_idx],
+                        offsets[line_idx],
+                        newdtd._rawkey(),
+                        self.encoding,
+                    )
 
     def serialize(self, out) -> None:
-        """Write content to file."""
-        content = b""
+        """
+        Write content to file.
+
+        Units which did not change since they were parsed are written as they
+        were in the parsed file, as long as the encoding did not change.
+        """
+        passthrough = self.passthrough
+        chunks = []
         for dtd in self.units:
-            unit_str = str(dtd).encode(self.encoding)
-            out.write(unit_str)
-            content += unit_str
+            rawsource = getattr(dtd, "_rawsource", None) if passthrough else None
+            if (
+                rawsource is not None
+                and rawsource[4] == self.encoding
+                and dtd._rawkey() == rawsource[3]
+            ):
+                chunks.append(rawsource[0][rawsource[1] : rawsource[2]])
+            else:
+                chunks.append(str(dtd))
+        content = "".join(chunks).encode(self.encoding)
+        out.write(content)
         if not self._valid_store(content):
             warnings.warn(f"DTD file '{self.filename}' does not validate")
             out.truncate(0)
@@ -20,11 +20,17 @@
 
 from __future__ import annotations
 
+import contextlib
+import gc
+import hashlib
 import os
+import pickle  # ruff:ignore[suspicious-pickle-import]
+import tempfile
 from functools import lru_cache
 from importlib import import_module
 from typing import BinaryIO
 
+from translate.__version__ import sver
 from translate.storage.base import TranslationStore
 
 # TODO: Monolingual formats (with template?)
@@ -68,11 +74,22 @@ Used for dynamic lazy loading of modules.
 _ext is a pseudo extension, that is their is no real extension by that name.
 """
 
+cachedir = os.getenv("TRANSLATE_STORE_CACHE")
+"""Directory keeping the stores parsed by :func:`getobject`, if any.
+
+Only use a directory nobody else can write to, the cached stores are pickles.
+"""
+
+cachesize = 512 * 1024 * 1024
+"""The size in bytes above which the least recently used stores are evicted
+from :data:`cachedir`."""
+
 
 def _examine_txt(storefile):
     """Determine the true filetype for a .txt file."""
     if isinstance(storefile, str) and os.path.exists(storefile):
-        storefile = open(storefile, "rb")
+        with open(storefile, "rb") as handle:
+            return _examine_txt(handle)
     try:
         start = storefile.read(600).strip()
     except AttributeError:
@@ -199,6 +216,119 @@ def getclass(
     return storeclass
 
 
+def _cachepath(directory: str, filename: str, storeclass: type) -> str | None:
+    """
+    Returns the path caching the store parsed from a file, which changes with
+    the modification time and the size of the file, or None if there is no
+    such file.
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    key = "\0".join(
+        (
+            os.path.abspath(filename),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+            storeclass.__module__,
+            storeclass.__qualname__,
+            sver,
+        )
+    )
+    return os.path.join(directory, f"{hashlib.sha256(key.encode()).hexdigest()}.pickle")
+
+
+def _loadcached(path: str) -> TranslationStore | None:
+    """Returns the cached store, or None if it is missing or unreadable."""
+    # The collections triggered by creating all the units take longer than
+    # loading them
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, "rb") as cachefile:
+            # Only trusted cache directories are used, see cachedir
+            store = pickle.load(cachefile)  # ruff:ignore[suspicious-pickle-usage]
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated or from an incompatible environment, unpickling can raise
+        # about anything then
+        _removecached(path)
+        return None
+    finally:
+        if collecting:
+            gc.enable()
+    if not isinstance(store, TranslationStore):
+        _removecached(path)
+        return None
+    # Marks the entry as recently used for evicting
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return store
+
+
+def _savecached(path: str, store: TranslationStore) -> None:
+    """
+    Stores a parsed store in the cache, and evicts the least recently used
+    ones beyond :data:`cachesize`.
+
+    Stores which cannot be pickled, like the XML based ones keeping their
+    lxml tree, are not cached.
+    """
+    try:
+        data = pickle.dumps(store, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        _writecached(directory, path, data)
+    except OSError:
+        return
+    _evictcache(directory, cachesize)
+
+
+def _writecached(directory: str, path: str, data: bytes) -> None:
+    """Writes a cache entry at once, so that readers never see a partial one."""
+    handle, temppath = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as cachefile:
+            cachefile.write(data)
+        os.replace(temppath, path)
+    except OSError:
+        _removecached(temppath)
+        raise
+
+
+def _removecached(path: str) -> None:
+    """Removes a cached store, ignoring missing files."""
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+
+def _evictcache(directory: str, size: int) -> None:
+    """
+    Removes the least recently used stores from a cache directory until it
+    holds at most size bytes.
+    """
+    entries = []
+    try:
+        with os.scandir(directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(".pickle") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    except OSError:
+        return
+    total = sum(entrysize for _mtime, entrysize, _path in entries)
+    for _mtime, entrysize, path in sorted(entries):
+        if total <= size:
+            break
+        _removecached(path)
+        total -= entrysize
+
+
 def getobject(
     storefile: str | TranslationStore | BinaryIO,
     localfiletype: str | None = None,
@@ -206,10 +336,13 @@ def getobject(
     classes: dict | None = None,
     classes_str: dict | None = None,
     hiddenclasses: dict | None = None,
+    cache: str | None = None,
 ) -> TranslationStore:
     """
     Factory that returns a usable object for the type of file presented.
     :param storefile: File object or file name.
+    :param cache: Directory keeping the parsed stores, to load unchanged
+                  files given by name from, defaults to :data:`cachedir`.
 
     Specify ignore to ignore some part at the back of the name (like .gz).
     """
@@ -235,6 +368,15 @@ def getobject(
         classes_str=classes_str,
         hiddenclasses=hiddenclasses,
     )
+    if cache is None:
+        cache = cachedir
+    cachepath = None
+    if cache and isinstance(storefile, str):
+        cachepath = _cachepath(cache, storefile, storeclass)
+        if cachepath is not None:
+            store = _loadcached(cachepath)
+            if store is not None:
+                return store
     if os.path.exists(storefilename) or not getattr(storefile, "closed", True):
         _name, ext = os.path.splitext(storefilename)
         ext = ext[len(os.path.extsep) :].lower()
@@ -242,6 +384,8 @@ def getobject(
             file = import_class(*decompressclass[ext])
             storefile = file(storefilename)
         store = storeclass.parsefile(storefile)
+        if cachepath is not None:
+            _savecached(cachepath, store)
     else:
         store = storeclass()
         store.filename = storefilename
@@ -42,8 +42,11 @@ in very small files.
 from __future__ import annotations
 
 import array
+import mmap
 import re
 import struct
+import sys
+from itertools import accumulate
 
 from translate.misc.multistring import multistring
 from translate.storage import base, poheader
@@ -53,17 +56,13 @@ POT_HEADER = re.compile(r"^POT-Creation-Date:.*(\n|$)", re.IGNORECASE | re.MULTI
 
 
 def hashpjw(str_param):
-    HASHWORDBITS = 32
     hval = 0
-    for s in str_param:
-        if not s:
-            break
-        hval <<= 4
-        hval += s
-        g = hval & 0xF << (HASHWORDBITS - 4)
-        if g != 0:
-            hval ^= g >> HASHWORDBITS - 8
-            hval ^= g
+    # The hash stops at the first NUL, the end of the singular source
+    for s in str_param.partition(b"\0")[0]:
+        hval = (hval << 4) + s
+        g = hval & 0xF0000000
+        if g:
+            hval ^= (g >> 24) ^ g
     return hval
 
 
@@ -128,25 +127,66 @@ class mofile(poheader.poheader, base.TranslationStore):
     Extensions = ["mo", "gmo"]
     _binary = True
 
+    # Whether parsed files only decode the messages when the units are used.
+    # Until then, translate() and findunit() look the messages up in the
+    # hash table of the file.
+    lazy_units = False
+    # The parsed content and its key and value tables, while the units are
+    # not created yet
+    _content: bytes | mmap.mmap | None = None
+    _keys: memoryview | array.array
+    _values: memoryview | array.array
+    _hashtable: memoryview | array.array
+    _lazycache: dict[int, mounit]
+    # Whether sources can be in several messages, which the hash table
+    # does not find
+    _ambiguous = False
+
     def __init__(self, inputfile=None, **kwargs) -> None:
         super().__init__(**kwargs)
         self.filename = ""
         if inputfile is not None:
             self.parsestring(inputfile)
 
+    @classmethod
+    def mapfile(cls, filename: str) -> mofile:
+        """
+        Opens a MO file by mapping it into memory, without reading it.
+
+        The messages are decoded when the units are used, see
+        :attr:`lazy_units`.
+        """
+        with open(filename, "rb") as handle:
+            try:
+                content = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file
+                raise ValueError("This is not an MO file") from None
+        store = cls()
+        store.filename = filename
+        store._setcontent(content)
+        return store
+
+    @property
+    def units(self) -> list[mounit]:
+        if self._content is not None:
+            self._loadunits()
+        return self._units
+
+    @units.setter
+    def units(self, units: list[mounit]) -> None:
+        self._content = None
+        self._units = units
+
+    def __getstate__(self):
+        # The mapped content cannot be pickled
+        self._loadunits()
+        return super().__getstate__()
+
     def serialize(self, out) -> None:
         """Output a string representation of the MO data file."""
         # check the header of this file for the copyright note of this function
 
-        def add_to_hash_table(string, i) -> None:
-            hash_value = hashpjw(string)
-            hash_cursor = hash_value % hash_size
-            increment = 1 + (hash_value % (hash_size - 2))
-            while hash_table[hash_cursor] != 0:
-                hash_cursor += increment
-                hash_cursor %= hash_size
-            hash_table[hash_cursor] = i + 1
-
         def lst_encode(lst, join_char=b""):
             return join_char.join([i.encode("utf-8") for i in lst])
 
@@ -179,33 +219,36 @@ class mofile(poheader.poheader, base.TranslationStore):
                 target = unit.target.encode("utf-8")
             if unit.target:
                 MESSAGES[source] = target
-        # using "I" works for 32- and 64-bit systems, but not for 16-bit!
-        hash_table = array.array("I", [0] * hash_size)
         # the keys are sorted in the .mo file
-        keys = sorted(MESSAGES.keys())
-        offsets = []
-        ids = strs = b""
-        for i, id in enumerate(keys):
-            # For each string, we need size and file offset.  Each string is
-            # NUL terminated; the NUL does not count into the size.
-            # TODO: We don't do any encoding detection from the PO Header
-            add_to_hash_table(id, i)
-            string = MESSAGES[id]  # id already encoded for use as dictionary key
-            offsets.append((len(ids), len(id), len(strs), len(string)))
-            ids = ids + id + b"\0"
-            strs = strs + string + b"\0"
+        keys = sorted(MESSAGES)
+        values = [MESSAGES[key] for key in keys]
+        # using "I" works for 32- and 64-bit systems, but not for 16-bit!
+        hash_table = array.array("I", bytes(4 * hash_size))
+        for i, key in enumerate(keys, 1):
+            hash_value = hashpjw(key)
+            hash_cursor = hash_value % hash_size
+            increment = 1 + (hash_value % (hash_size - 2))
+            while hash_table[hash_cursor]:
+                hash_cursor = (hash_cursor + increment) % hash_size
+            hash_table[hash_cursor] = i
         # The header is 7 32-bit unsigned integers
         keystart = 7 * 4 + 16 * len(keys) + hash_size * 4
-        # and the values start after the keys
-        valuestart = keystart + len(ids)
-        koffsets = []
-        voffsets = []
         # The string table first has the list of keys, then the list of values.
         # Each entry has first the size of the string, then the file offset.
-        for o1, l1, o2, l2 in offsets:
-            koffsets = [*koffsets, l1, o1 + keystart]
-            voffsets = [*voffsets, l2, o2 + valuestart]
-        offsets = koffsets + voffsets
+        # Each string is NUL terminated; the NUL does not count into the size.
+        # TODO: We don't do any encoding detection from the PO Header
+        offsets = array.array("I", bytes(16 * len(keys)))
+        start = keystart
+        for table, strings in ((0, keys), (2 * len(keys), values)):
+            lengths = array.array("I", map(len, strings))
+            offsets[table : table + 2 * len(keys) : 2] = lengths
+            offsets[table + 1 : table + 2 * len(keys) : 2] = array.array(
+                "I",
+                accumulate(
+                    lengths, lambda offset, length: offset + length + 1, initial=start
+                ),
+            )[:-1]
+            start += sum(lengths) + len(keys)
         out.write(
             struct.pack(
                 "Iiiiiii",
@@ -219,11 +262,19 @@ class mofile(poheader.poheader, base.TranslationStore):
             )
         )
         # additional data is not necessary for empty mo files
-        if len(keys) > 0:
-            out.write(array.array("i", offsets).tobytes())
-            out.write(hash_table.tobytes())
-            out.write(ids)
-            out.write(strs)
+        if keys:
+            out.write(
+                b"".join(
+                    (
+                        offsets.tobytes(),
+                        hash_table.tobytes(),
+                        b"\0".join(keys),
+                        b"\0",
+                        b"\0".join(values),
+                        b"\0",
+                    )
+                )
+            )
 
     @staticmethod
     def parse_header(content: bytes) -> tuple[str, int, int, int, int, int, int, int]:
@@ -267,6 +318,12 @@ class mofile(poheader.poheader, base.TranslationStore):
             content = mosrc
         else:
             content = input
+        self._setcontent(content)
+        if not self.lazy_units:
+            self._loadunits()
+
+    def _setcontent(self, content: bytes | mmap.mmap) -> None:
+        """Reads the tables of a MO file, but none of its messages."""
         (
             endian,
             version_maj,
@@ -274,42 +331,130 @@ class mofile(poheader.poheader, base.TranslationStore):
             lenkeys,
             startkey,
             startvalue,
-            _sizehash,
-            _offsethash,
+            sizehash,
+            offsethash,
         ) = self.parse_header(content)
         if version_maj >= 1:
             raise base.ParseError(
                 f"Unable to process version {version_maj}.{version_min} MO files"
             )
-        for i in range(lenkeys):
-            nextkey = startkey + (i * 2 * 4)
-            nextvalue = startvalue + (i * 2 * 4)
-            klength, koffset = struct.unpack(
-                f"{endian}ii", content[nextkey : nextkey + (2 * 4)]
-            )
-            vlength, voffset = struct.unpack(
-                f"{endian}ii", content[nextvalue : nextvalue + (2 * 4)]
+        view = memoryview(content)
+        native = endian == ("<" if sys.byteorder == "little" else ">")
+
+        def table(start: int, count: int) -> memoryview | array.array:
+            """Returns count 32-bit integers at start, converted in one go."""
+            data = view[start : start + 4 * count]
+            if len(data) != 4 * count:
+                raise base.ParseError("This MO file is truncated")
+            if native:
+                return data.cast("I")
+            values = array.array("I", data)
+            values.byteswap()
+            return values
+
+        self._keys = table(startkey, 2 * lenkeys)
+        self._values = table(startvalue, 2 * lenkeys)
+        if sizehash <= 2 or offsethash + 4 * sizehash > len(content):
+            # No hash table, or one left out like serialize() does for empty
+            # files, so the full index is used
+            sizehash = 0
+        self._hashtable = table(offsethash, sizehash)
+        self._lazycache = {}
+        self._content = content
+        if lenkeys:
+            # The header sorts first
+            if self._keys[0] == 0:
+                charset = re.search(rb"charset=([^\s]+)", self._string(self._values, 0))
+                if charset:
+                    self.encoding = charset.group(1).decode()
+            # Sources with a context are only found by the full index
+            offsets = self._keys[1::2]
+            self._ambiguous = (
+                not self._hashtable
+                or content.find(
+                    b"\x04", min(offsets), max(offsets) + max(self._keys[::2])
+                )
+                != -1
             )
-            source = content[koffset : koffset + klength]
+
+    def _string(self, table: memoryview | array.array, index: int) -> bytes:
+        offset = table[2 * index + 1]
+        return self._content[offset : offset + table[2 * index]]
+
+    def _unitat(self, index: int) -> mounit:
+        """Returns the unit of a message, decoding it once."""
+        unit = self._lazycache.get(index)
+        if unit is None:
+            encoding = self.encoding
+            source = self._string(self._keys, index)
             context = None
             if b"\x04" in source:
                 context, source = source.split(b"\x04")
             # Still need to handle KDE comments
-            if not source:
-                charset = re.search(
-                    rb"charset=([^\s]+)", content[voffset : voffset + vlength]
-                )
-                if charset:
-                    self.encoding = charset.group(1).decode()
-            source = multistring([s.decode(self.encoding) for s in source.split(b"\0")])
-            target = multistring(
+            unit = mounit(
+                multistring([s.decode(encoding) for s in source.split(b"\0")])
+            )
+            unit.target = multistring(
                 [
-                    s.decode(self.encoding)
-                    for s in content[voffset : voffset + vlength].split(b"\0")
+                    s.decode(encoding)
+                    for s in self._string(self._values, index).split(b"\0")
                 ]
             )
-            newunit = mounit(source)
-            newunit.target = target
             if context is not None:
-                newunit.msgctxt.append(context.decode(self.encoding))
-            self.addunit(newunit)
+                unit.msgctxt.append(context.decode(encoding))
+            unit._store = self
+            self._lazycache[index] = unit
+        return unit
+
+    def _loadunits(self) -> None:
+        """Creates the units of all the messages."""
+        if self._content is None:
+            return
+        units = [self._unitat(index) for index in range(len(self._keys) // 2)]
+        self._lazycache = {}
+        self._keys = self._values = self._hashtable = array.array("I")
+        self.units = units
+
+    def _lookup(self, key: bytes) -> int | None:
+        """Returns the index of a message in the hash table, like gettext."""
+        hashtable = self._hashtable
+        size = len(hashtable)
+        if size <= 2:
+            # Written without a hash table
+            return None
+        hash_value = hashpjw(key)
+        cursor = hash_value % size
+        increment = 1 + (hash_value % (size - 2))
+        while index := hashtable[cursor]:
+            string = self._string(self._keys, index - 1)
+            # Plural messages are found by their singular source
+            if string == key or string.startswith(key + b"\0"):
+                return index - 1
+            cursor = (cursor + increment) % size
+        return None
+
+    def findunit(self, source: str) -> mounit | None:
+        """
+        Find the unit with the given source string.
+
+        A unit without context is preferred. While the units are not
+        created, it is found in the hash table of the file.
+        """
+        if self._content is not None and source:
+            try:
+                index = self._lookup(source.encode(self.encoding))
+            except UnicodeEncodeError:
+                index = None
+            if index is not None:
+                return self._unitat(index)
+            if not self._ambiguous:
+                return None
+        if not source:
+            return None
+        units = self.findunits(source)
+        if not units:
+            return None
+        for unit in units:
+            if not unit.msgctxt:
+                return unit
+        return units[0]
@@ -37,10 +37,11 @@ from __future__ import annotations
 import codecs
 import re
 from collections import defaultdict
+from itertools import chain
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
     from .pypo import pofile, pounit
 
@@ -64,18 +65,26 @@ class PoParseError(ValueError):
 class PoParseState:
     def __init__(
         self,
-        input_lines: list[bytes] | list[str],
+        input_lines: Iterable[bytes] | Iterable[str],
         UnitClass: Callable[[], pounit],
         encoding: str | None = None,
+        lineno: int = 0,
     ) -> None:
         # A single-byte encoding is first defined to be able to read the header
         # without risking UnicodeDecodeErrors. As soon as the header is parsed,
         # the encoding defined in the header is used to reset the parser and
         # re-parse all content (including the header) with the correct encoding.
-        self._input_lines = input_lines
+        # The input is consumed as an iterator, so the lines read before the
+        # encoding is known are kept to be able to re-parse them.
+        self._input_lines: Iterator[bytes] | Iterator[str] = iter(input_lines)
+        self._consumed: list[bytes] | list[str] | None = []
+        # The number of lines before input_lines
+        self._input_lineno = lineno
         self.next_line: str = ""
         self.lineno: int = 0
         self.eof: bool = False
+        # Whether the lines of an incomplete unit at the end were dropped
+        self.dropped: bool = False
         self.charset_lineno = 0
         self.charset_line = ""
         # Configured encoding
@@ -88,8 +97,16 @@ class PoParseState:
 
     def finalize_encoding(self, encoding: str) -> bool:
         """Finalize encoding detection and check whether restart is needed."""
-        if encoding == self._current_encoding:
+        try:
+            same = (
+                codecs.lookup(encoding).name
+                == codecs.lookup(self._current_encoding).name
+            )
+        except LookupError:
+            return False
+        if same:
             self.encoding = encoding
+            self._consumed = None
             return True
         return False
 
@@ -105,11 +122,26 @@ class PoParseState:
                 error_line=self.charset_line,
             ) from error
         self.encoding = encoding
+        self._current_encoding = encoding
+        self._input_lines = chain(self._consumed or (), self._input_lines)
+        self._consumed = None
+        self._input_lineno = 0
         self.next_line = ""
         self.lineno = 0
         self.eof = False
         self.read_line()
 
+    def _read_input_line(self) -> bytes | str | None:
+        """Returns the next line of the input, or None at its end."""
+        line = next(self._input_lines, None)
+        if line is None:
+            self.eof = True
+            return None
+        self._input_lineno += 1
+        if self._consumed is not None:
+            self._consumed.append(line)
+        return line
+
     def read_line(self) -> str:
         current = self.next_line
         if self.charset_lineno == 0 and "charset=" in current:
@@ -117,25 +149,15 @@ class PoParseState:
             self.charset_line = current
         if self.eof:
             return current
-        next_lineno = self.lineno
-        try:
-            next_line = self._input_lines[next_lineno]
-        except IndexError:
-            self.eof = True
-        else:
-            while next_line.isspace():
-                next_lineno += 1
-                try:
-                    next_line = self._input_lines[next_lineno]
-                except IndexError:
-                    self.eof = True
-                    break
+        next_line = self._read_input_line()
+        while next_line is not None and next_line.isspace():
+            next_line = self._read_input_line()
 
-        if self.eof:
+        if next_line is None:
             self.next_line = ""
         else:
             # This is 1-based
-            self.lineno = next_lineno + 1
+            self.lineno = self._input_lineno
             if isinstance(next_line, bytes):
                 try:
                     self.next_line = next_line.decode(self._current_encoding)
@@ -386,6 +408,7 @@ def parse_unit(parse_state: PoParseState, unit: pounit | None = None) -> pounit
     # Store the line number where this unit starts
     # Use the current line number since we're at the start of parsing
     start_line = parse_state.lineno
+    started = bool(parse_state.next_line)
     parsed_comments = parse_comments(parse_state, unit)
     obsolete_unit = parse_obsolete(parse_state, unit)
     if obsolete_unit is not None:
@@ -398,7 +421,11 @@ def parse_unit(parse_state: PoParseState, unit: pounit | None = None) -> pounit
         # Set line number for regular units
         if hasattr(unit, "_line_number"):
             unit._line_number = start_line
+        if not parsed_msg_entries and hasattr(unit, "_dirty"):
+            # Completed when written, so not as it was parsed
+            unit._dirty = True
         return unit
+    parse_state.dropped = started
     return None
 
 
@@ -416,6 +443,20 @@ def get_header_charset(unit: pounit) -> str:
     return "utf-8"
 
 
+def detect_charset(
+    input_lines: Iterable[bytes], UnitClass: Callable[[], pounit]
+) -> str:
+    """
+    Returns the charset declared in the header of a PO file.
+
+    Only the lines of the first unit are read from input_lines.
+    """
+    unit = parse_unit(PoParseState(input_lines, UnitClass))
+    if unit is None:
+        return "utf-8"
+    return get_header_charset(unit)
+
+
 def parse_header(parse_state: PoParseState, store: pofile) -> pounit | None:
     first_unit = parse_unit(parse_state)
     if first_unit is None:
@@ -436,12 +477,369 @@ def parse_header(parse_state: PoParseState, store: pofile) -> pounit | None:
     return parse_unit(parse_state)
 
 
-def parse_units(parse_state: PoParseState, store: pofile) -> None:
-    unit = parse_header(parse_state, store)
+def iter_units(parse_state: PoParseState, store: pofile) -> Iterator[pounit]:
+    """Yields the units parsed from parse_state one at a time."""
+    yield from continue_units(parse_state, parse_header(parse_state, store))
+
+
+def continue_units(
+    parse_state: PoParseState, unit: pounit | None, previous: pounit | None = None
+) -> Iterator[pounit]:
+    """
+    Yields unit and the units following it in parse_state.
+
+    :param previous: The unit yielded before unit, if any.
+    """
     while unit:
         if not unit.obsolete:
             unit.infer_state()
-        store.addunit(unit)
+        yield unit
+        previous = unit
         unit = parse_unit(parse_state)
     if not parse_state.eof:
         raise PoParseError(parse_state)
+    if parse_state.dropped and hasattr(previous, "_dirty"):
+        # The dropped lines follow the ones of the previous unit
+        previous._dirty = True
+
+
+def parse_units(parse_state: PoParseState, store: pofile) -> None:
+    for unit in iter_units(parse_state, store):
+        store.addunit(unit)
+
+
+# Token kinds of the fast tokenizer
+(
+    TOKEN_UNKNOWN,
+    TOKEN_AUTOMATIC,
+    TOKEN_SOURCE,
+    TOKEN_TYPE,
+    TOKEN_OTHER,
+    TOKEN_MSGCTXT,
+    TOKEN_MSGID,
+    TOKEN_MSGID_PLURAL,
+    TOKEN_MSGSTR,
+    TOKEN_MSGSTR_ARRAY,
+    TOKEN_QUOTED,
+) = range(11)
+
+COMMENT_TOKENS = {
+    ".": TOKEN_AUTOMATIC,
+    ":": TOKEN_SOURCE,
+    ",": TOKEN_TYPE,
+    "=": TOKEN_TYPE,
+    # Obsolete units and previous msgids are left to the parser
+    "~": TOKEN_UNKNOWN,
+    "|": TOKEN_UNKNOWN,
+}
+
+KEYWORD_TOKENS = {
+    "msgctxt": TOKEN_MSGCTXT,
+    "msgid": TOKEN_MSGID,
+    "msgid_plural": TOKEN_MSGID_PLURAL,
+    "msgstr": TOKEN_MSGSTR,
+}
+
+msgstr_array_re = re.compile(r'msgstr\[([0-9]+)\]\s*"')
+
+
+def tokenize(lines: list[str], lineno: int = 0) -> list[tuple[int, int, str, int]]:
+    """
+    Splits decoded PO lines into (line number, kind, payload, index) tokens.
+
+    The payload is the comment line, or the quoted string of message lines.
+    The index is only used for msgstr[index] lines. Lines which are not
+    understood are reported as :data:`TOKEN_UNKNOWN`.
+
+    :param lineno: The number of lines preceding the lines in the file.
+    """
+    comment_tokens = COMMENT_TOKENS
+    keyword_tokens = KEYWORD_TOKENS
+    msgstr_array_match = msgstr_array_re.match
+    tokens = []
+    append = tokens.append
+    for line in lines:
+        lineno += 1
+        first = line[0]
+        if first == '"':
+            right = line.rfind('"')
+            if right:
+                append((lineno, TOKEN_QUOTED, line[: right + 1], 0))
+            else:
+                append((lineno, TOKEN_UNKNOWN, line, 0))
+        elif first == "#":
+            append((lineno, comment_tokens.get(line[1], TOKEN_OTHER), line, 0))
+        elif first == "m" and (left := line.find('"')) > 0:
+            right = line.rfind('"')
+            kind = keyword_tokens.get(line[:left].rstrip())
+            if right == left:
+                append((lineno, TOKEN_UNKNOWN, line, 0))
+            elif kind is not None:
+                append((lineno, kind, line[left : right + 1], 0))
+            elif (match := msgstr_array_match(line)) is not None:
+                append(
+                    (
+                        lineno,
+                        TOKEN_MSGSTR_ARRAY,
+                        line[left : right + 1],
+                        int(match.group(1)),
+                    )
+                )
+            else:
+                append((lineno, TOKEN_UNKNOWN, line, 0))
+        elif not line.isspace():
+            append((lineno, TOKEN_UNKNOWN, line, 0))
+    return tokens
+
+
+def _fast_quoted(
+    tokens: list[tuple[int, int, str, int]],
+    i: int,
+    strings: list[str] | None,
+    kde: bool = False,
+) -> int | None:
+    """
+    Adds the quoted strings of a message starting at token i to strings, or
+    only skips them if strings is None.
+
+    :return: The index of the token after the message, or None if the
+             message has to be handled by the full parser.
+    """
+    count = len(tokens)
+    while True:
+        payload = tokens[i][2]
+        if kde and payload.startswith('"_:'):
+            return None
+        if strings is not None:
+            strings.append(payload)
+        i += 1
+        if i == count:
+            return i
+        kind = tokens[i][1]
+        if kind != TOKEN_QUOTED:
+            # The parser might read unknown lines as part of the string
+            return None if kind == TOKEN_UNKNOWN else i
+
+
+def _fast_unit(
+    tokens: list[tuple[int, int, str, int]], i: int, unit: pounit | None = None
+) -> int | None:
+    """
+    Fills unit from the tokens starting at i, or only finds the end of the
+    unit if no unit is given.
+
+    :return: The index of the token after the unit, or None if the unit has
+             to be handled by the full parser.
+    """
+    count = len(tokens)
+    kind = tokens[i][1]
+    if kind <= TOKEN_OTHER:
+        othercomments = []
+        automaticcomments = []
+        sourcecomments = []
+        typecomments = []
+        while kind <= TOKEN_OTHER:
+            payload = tokens[i][2]
+            if kind == TOKEN_OTHER:
+                othercomments.append(payload)
+            elif kind == TOKEN_SOURCE:
+                sourcecomments.append(payload)
+            elif kind == TOKEN_TYPE:
+                typecomments.append(f"#,{payload[2:]}")
+            elif kind == TOKEN_AUTOMATIC:
+                automaticcomments.append(payload)
+            else:
+                return None
+            i += 1
+            if i == count:
+                kind = None
+                break
+            kind = tokens[i][1]
+        if unit is not None:
+            unit.othercomments = othercomments
+            unit.automaticcomments = automaticcomments
+            unit.sourcecomments = sourcecomments
+            unit.typecomments = typecomments
+        if kind is None:
+            # Trailing comments, which are written as they are when they are
+            # translator comments only
+            if automaticcomments or sourcecomments or typecomments:
+                return None
+            return i
+
+    if kind == TOKEN_MSGCTXT:
+        i = _fast_quoted(tokens, i, None if unit is None else unit.msgctxt)
+        if i is None or i == count:
+            return None
+        kind = tokens[i][1]
+    if kind != TOKEN_MSGID:
+        return None
+    i = _fast_quoted(tokens, i, None if unit is None else unit.msgid, kde=True)
+    if i is None or i == count:
+        return None
+    kind = tokens[i][1]
+    if kind == TOKEN_MSGSTR:
+        return _fast_quoted(tokens, i, None if unit is None else unit.msgstr)
+    if kind != TOKEN_MSGID_PLURAL:
+        return None
+    i = _fast_quoted(tokens, i, None if unit is None else unit.msgid_plural, kde=True)
+    if i is None or i == count or tokens[i][1] != TOKEN_MSGSTR_ARRAY:
+        return None
+    msgstr_dict: dict[int, list[str]] = defaultdict(list)
+    while i is not None and i < count and tokens[i][1] == TOKEN_MSGSTR_ARRAY:
+        i = _fast_quoted(tokens, i, msgstr_dict[tokens[i][3]])
+    if unit is not None:
+        unit.msgstr = msgstr_dict
+    return i
+
+
+# The raw pounit fields holding the payload of the tokens of a kind
+FIELD_NAMES = {
+    TOKEN_AUTOMATIC: "automaticcomments",
+    TOKEN_SOURCE: "sourcecomments",
+    TOKEN_TYPE: "typecomments",
+    TOKEN_OTHER: "othercomments",
+    TOKEN_MSGCTXT: "msgctxt",
+    TOKEN_MSGID: "msgid",
+    TOKEN_MSGID_PLURAL: "msgid_plural",
+    TOKEN_MSGSTR: "msgstr",
+}
+
+
+def fast_fields(
+    tokens: list[tuple[int, int, str, int]],
+) -> dict[str, list[str] | dict[int, list[str]]]:
+    """
+    Returns the raw pounit fields of a unit parsed from tokens.
+
+    This is how units parsed by :func:`fast_iter_units` in lazy mode read
+    their fields on first access, it gives the same values as
+    :func:`_fast_unit`.
+    """
+    fields: dict[str, list[str] | dict[int, list[str]]] = {
+        "othercomments": [],
+        "automaticcomments": [],
+        "sourcecomments": [],
+        "typecomments": [],
+        # Previous msgids and KDE comments are left to the parser
+        "msgidcomments": [],
+        "prev_msgctxt": [],
+        "prev_msgid": [],
+        "prev_msgid_plural": [],
+        "msgctxt": [],
+        "msgid": [],
+        "msgid_pluralcomments": [],
+        "msgid_plural": [],
+        "msgstr": [],
+    }
+    strings = []
+    for _lineno, kind, payload, index in tokens:
+        if kind == TOKEN_QUOTED:
+            strings.append(payload)
+            continue
+        if kind == TOKEN_TYPE:
+            payload = f"#,{payload[2:]}"
+        if kind == TOKEN_MSGSTR_ARRAY:
+            msgstr = fields["msgstr"]
+            if not isinstance(msgstr, dict):
+                msgstr = fields["msgstr"] = defaultdict(list)
+            strings = msgstr[index]
+        else:
+            strings = fields[FIELD_NAMES[kind]]
+        strings.append(payload)
+    return fields
+
+
+def _fast_infer_state(tokens: list[tuple[int, int, str, int]], unit: pounit) -> None:
+    """Infers the state of a unit from its tokens without reading its fields."""
+    fuzzy = translated = msgstr = False
+    for _lineno, kind, payload, _index in tokens:
+        if kind == TOKEN_TYPE:
+            if not fuzzy:
+                fuzzy = "fuzzy" in [flag.strip() for flag in payload[2:].split(",")]
+        elif kind in {TOKEN_MSGSTR, TOKEN_MSGSTR_ARRAY}:
+            msgstr = True
+            translated = translated or payload != '""'
+        elif kind == TOKEN_QUOTED and msgstr:
+            translated = translated or payload != '""'
+    if translated:
+        state = unit.S_FUZZY if fuzzy else unit.S_TRANSLATED
+        unit._state_n = unit.STATE[state][0]
+    elif fuzzy:
+        # The parser drops the fuzzy flag of untranslated units
+        unit.infer_state()
+    else:
+        unit._state_n = unit.S_UNTRANSLATED
+
+
+def fast_iter_units(
+    lines: list[str],
+    store: pofile,
+    encoding: str | None = None,
+    lazy: bool = False,
+    lineno: int = 0,
+) -> Iterator[pounit]:
+    """
+    Yields the units of decoded PO lines, like :func:`iter_units`.
+
+    The lines are split into tokens by :func:`tokenize` at once, and the
+    common units are built from the tokens directly. Starting with the first
+    unit using anything else (obsolete units, previous msgids, KDE comments
+    or syntax errors) the remaining lines are handled by the full parser, so
+    the units and errors are the same.
+
+    :param lazy: Whether the units (except the header) keep their tokens
+                 and only read their fields on first access, see
+                 :func:`fast_fields`. Otherwise the fields are read at once,
+                 leaving out the empty ones until they are used.
+    :param lineno: The number of lines preceding the lines in the file. The
+                   lines of a file split at the end of a unit do not start
+                   with a header.
+    """
+    UnitClass = store.create_unit
+    tokens = tokenize(lines, lineno)
+    count = len(tokens)
+    i = 0
+    previous = None
+    while i < count:
+        line_number = tokens[i][0]
+        header = i == 0 and lineno == 0
+        raw = None
+        if header:
+            unit = UnitClass()
+            end = _fast_unit(tokens, i, unit)
+        else:
+            end = _fast_unit(tokens, i)
+            if end is not None:
+                raw = tokens[i:end]
+                unit = UnitClass(raw=raw)
+        if end is None:
+            parse_state = PoParseState(
+                iter(lines[line_number - lineno - 1 :]),
+                UnitClass,
+                encoding,
+                line_number - 1,
+            )
+            if header:
+                yield from iter_units(parse_state, store)
+            else:
+                parse_state._consumed = None
+                yield from continue_units(
+                    parse_state, parse_unit(parse_state), previous
+                )
+            return
+        if hasattr(unit, "_line_number"):
+            unit._line_number = line_number
+        if header:
+            store._encoding = get_header_charset(unit)
+        if raw is None:
+            unit.infer_state()
+        else:
+            _fast_infer_state(raw, unit)
+            if not lazy:
+                unit._loadfields()
+        yield unit
+        previous = unit
+        i = end
+    if count == 0:
+        yield from iter_units(PoParseState(lines, UnitClass, encoding, lineno), store)
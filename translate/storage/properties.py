@@ -125,6 +125,11 @@ Name and Value pairs:
    # .strings specific
    "key" = "value";
 
+Passthrough
+    By default all the units are normalized when the file is written. With
+    ``propfile(inputfile, passthrough=True)``, units which did not change
+    since parsing are written as they were parsed instead. This is only
+    available when using the library, the converters always normalize.
 """
 
 from __future__ import annotations
@@ -132,8 +137,9 @@ from __future__ import annotations
 import re
 from codecs import iterencode
 from copy import deepcopy
-from dataclasses import dataclass
-from typing import TypeVar
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import TYPE_CHECKING, TypeVar
 
 from lxml import etree
 
@@ -151,6 +157,9 @@ from translate.misc.quote import (
 from translate.misc.xml_helpers import get_safe_xml_parser
 from translate.storage import base
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 labelsuffixes = (".label", ".title")
 """Label suffixes: entries with this suffix are able to be comibed with accesskeys
 found in in entries ending with :attr:`.accesskeysuffixes`"""
@@ -941,6 +950,10 @@ class propunit(base.TranslationUnit):
     associated.
     """
 
+    # The parsed text, the span of the unit in it, its _rawkey() and the
+    # encoding of the file, see propfile.serialize()
+    _rawsource: tuple[str, int, int, tuple, str] | None = None
+
     def __init__(self, source="", personality="java") -> None:
         """Construct a blank propunit."""
         self.personality = get_dialect(personality)
@@ -1046,6 +1059,21 @@ class propunit(base.TranslationUnit):
             missing_prefix = self.get_missing_part()
         return f"{notes}{missing_prefix}{key}{delimiter}{value}{ending}\n"
 
+    def _rawkey(self) -> tuple:
+        """Returns everything getoutput() writes, to tell whether it changed."""
+        return (
+            self.name,
+            self.value,
+            self.translation,
+            self.delimiter,
+            tuple(self.comments),
+            self.explicitly_missing,
+            self.output_missing,
+            self.out_delimiter_wrappers,
+            self.out_ending,
+            self.personality,
+        )
+
     def getlocations(self):
         return [self.name]
 
@@ -1142,16 +1170,25 @@ class _ParseState:
     in_multiline_comment: bool = False
     was_header: bool = False
     unit_start_line: int = 1
+    # The units with their first line and the line following them
+    spans: list[tuple[propunit, int, int | None]] = field(default_factory=list)
 
 
 class propfile(base.TranslationStore):
     """this class represents a .properties file, made up of propunits."""
 
     UnitClass = propunit
+    # Whether serialize() writes unchanged units as they were parsed, instead
+    # of normalizing them
+    passthrough = False
 
-    def __init__(self, inputfile=None, personality="java", encoding=None) -> None:
+    def __init__(
+        self, inputfile=None, personality="java", encoding=None, passthrough=None
+    ) -> None:
         """Construct a propfile, optionally reading in from inputfile."""
         super().__init__()
+        if passthrough is not None:
+            self.passthrough = passthrough
         self.personality = get_dialect(personality)
         self.encoding = encoding or self.personality.default_encoding
         self.filename = getattr(inputfile, "name", "")
@@ -1175,8 +1212,9 @@ class propfile(base.TranslationStore):
         if text is None:
             text = ""
         state = _ParseState(unit=self.UnitClass("", self.personality.name))
+        lines = text.split("\n")
 
-        for linenum, line in enumerate(text.split("\n"), start=1):
+        for linenum, line in enumerate(lines, start=1):
             line = rstripeol(line)
             if state.in_multiline_value:
                 self._append_multiline_value(state, line, linenum)
@@ -1192,6 +1230,24 @@ class propfile(base.TranslationStore):
 
         if self.personality.has_plurals:
             self.fold()
+        elif self.passthrough and "\r" not in text:
+            self._keepsource(text, lines, state.spans)
+
+    def _keepsource(
+        self,
+        text: str,
+        lines: list[str],
+        spans: list[tuple[propunit, int, int | None]],
+    ) -> None:
+        """Remembers the lines of text every unit was parsed from."""
+        offsets = list(accumulate((len(line) + 1 for line in lines), initial=0))
+        for unit, first, stop in spans:
+            start = offsets[first - 1]
+            end = offsets[stop - 1] if stop is not None else len(text)
+            # Units at the end of a file without final newline are written
+            # as usual
+            if text[end - 1 : end] == "\n":
+                unit._rawsource = (text, start, end, unit._rawkey(), self.encoding)
 
     def _new_unit(self) -> propunit:
         return self.UnitClass("", self.personality.name)
@@ -1200,6 +1256,7 @@ class propfile(base.TranslationStore):
         self, state: _ParseState, next_line: int | None = None
     ) -> None:
         state.unit._line_number = state.unit_start_line
+        state.spans.append((state.unit, state.unit_start_line, next_line))
         self.addunit(state.unit)
         state.unit = self._new_unit()
         if next_line is not None:
@@ -1319,13 +1376,29 @@ class propfile(base.TranslationStore):
             plurals[key].add_unit(unit, variant)
 
     def serialize(self, out) -> None:
-        """Write the units back to file."""
+        """
+        Write the units back to file.
+
+        Units which did not change since they were parsed are written as they
+        were in the parsed file, as long as the encoding did not change.
+        """
         # Thanks to iterencode, a possible BOM is written only once
-        for chunk in iterencode(
-            (unit.getoutput() for unit in self.units), self.encoding
-        ):
+        for chunk in iterencode(self._iteroutput(), self.encoding):
             out.write(chunk)
 
+    def _iteroutput(self) -> Iterator[str]:
+        passthrough = self.passthrough
+        for unit in self.units:
+            rawsource = getattr(unit, "_rawsource", None) if passthrough else None
+            if (
+                rawsource is not None
+                and rawsource[4] == self.encoding
+                and unit._rawkey() == rawsource[3]
+            ):
+                yield rawsource[0][rawsource[1] : rawsource[2]]
+            else:
+                yield unit.getoutput()
+
 
 class xwikifile(propfile):
     Name = "XWiki Properties"
@@ -21,15 +21,27 @@
 """
 Classes that hold units of Gettext .po files (pounit) or entire
 files (pofile).
+
+Passthrough
+    By default all the units are normalized when the file is written. With
+    ``pofile(inputfile, passthrough=True)``, units which did not change
+    since parsing are written as they were parsed instead. This is only
+    available when using the library, the tools always normalize.
 """
 
 from __future__ import annotations
 
+import codecs
 import copy
 import logging
+import multiprocessing
+import operator
+import os
 import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
-from itertools import chain
+from itertools import accumulate, chain, pairwise, repeat
 from string import punctuation
 from typing import IO, TYPE_CHECKING
 
@@ -40,7 +52,7 @@ from translate.misc.multistring import multistring
 from translate.storage import pocommon, poparser
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Generator, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +79,34 @@ po_open_parenthesis_chars = {"{", "("}
 po_punctuation = set(punctuation)
 
 
+def detect_newline(text: bytes) -> bytes:
+    """
+    Detect the newline used in text, based on the first newline after the
+    first msgid, see :func:`splitlines`.
+    """
+    newline = b"\n"
+    msgid_pos = max(0, text.find(b"\rmsgid ") + 1, text.find(b"\nmsgid ") + 1)
+    for i, ch in enumerate(text[msgid_pos:]):
+        # Iteration over bytes yields numbers in Python 3
+        if ch == 10:  # LF
+            break
+        if ch == 13:  # CR
+            # Check for CR, CRLF, or unusual patterns like \r\r\n
+            j = msgid_pos + i + 1
+            # Count consecutive CRs to handle patterns like \r\r\n
+            while j < len(text) and text[j] == 13:  # CR
+                j += 1
+            # Check if followed by LF
+            if j < len(text) and text[j] == 10:  # LF
+                # Use the entire pattern (CR(s) + LF) as the line ending
+                newline = text[msgid_pos + i : j + 1]
+            else:
+                # Just CR without LF
+                newline = b"\r"
+            break
+    return newline
+
+
 def splitlines(text: bytes) -> tuple[list[bytes], str]:
     r"""
     Split lines based on first newline char.
@@ -89,29 +129,166 @@ def splitlines(text: bytes) -> tuple[list[bytes], str]:
     # by gettext, but some editors might create it, so better handle it.
     if text[:3] == b"\xef\xbb\xbf":
         text = text[3:]
-    # Find first newline after first msgid
-    newline = b"\n"
-    msgid_pos = max(0, text.find(b"\rmsgid ") + 1, text.find(b"\nmsgid ") + 1)
-    for i, ch in enumerate(text[msgid_pos:]):
-        # Iteration over bytes yields numbers in Python 3
-        if ch == 10:  # LF
+    newline = detect_newline(text)
+    return [x + newline for x in text.split(newline)], newline.decode()
+
+
+def iterbufferlines(text: bytes, newline: bytes) -> Generator[bytes]:
+    """Lazily split text into lines like :func:`splitlines`."""
+    start = 0
+    step = len(newline)
+    while (end := text.find(newline, start)) >= 0:
+        yield text[start : end + step]
+        start = end + step
+    yield text[start:] + newline
+
+
+def decodelines(text: bytes, newline: bytes) -> tuple[list[str], str] | None:
+    """
+    Decode a PO file at once, using the charset declared in its header.
+
+    Only the header is parsed to find the charset, so that the lines do not
+    have to be decoded one by one, nor parsed again when the charset turns
+    out not to be UTF-8.
+
+    :return: The decoded lines and the charset, or None if the file can not be
+             decoded this way.
+    """
+    try:
+        charset = poparser.detect_charset(iterbufferlines(text, newline), pounit)
+        decoded = text.decode(charset)
+    except (LookupError, UnicodeDecodeError, poparser.PoParseError):
+        return None
+    separator = newline.decode()
+    return [line + separator for line in decoded.split(separator)], charset
+
+
+# The minimal size of the chunks a file is split into for parallel parsing
+PARALLEL_CHUNK_SIZE = 1 << 20
+
+
+def unitboundary(text: bytes, newline: bytes, start: int) -> int:
+    """
+    Finds the start of a unit following blank lines at or after start.
+
+    Only blank lines after a msgstr and before a comment, msgctxt or msgid
+    are considered, so that the text can be split there and the parts parsed
+    separately.
+
+    :return: The offset of the unit, or -1 if there is none.
+    """
+    step = len(newline)
+    separator = newline * 2
+    while (end := text.find(separator, start)) >= 0:
+        start = end + step
+        # Find the keyword of the message ending before the blank line
+        lineend = end
+        while True:
+            linestart = text.rfind(newline, 0, lineend)
+            linestart = 0 if linestart < 0 else linestart + step
+            if linestart == 0 or not text.startswith((b'"', b'#~ "'), linestart):
+                break
+            lineend = linestart - step
+        if not text.startswith((b"msgstr", b"#~ msgstr"), linestart):
+            continue
+        unitstart = end + 2 * step
+        while text.startswith(newline, unitstart):
+            unitstart += step
+        if text.startswith((b"#", b"msgctxt", b"msgid"), unitstart) and (
+            not text.startswith((b"#~ msgstr", b'#~ "'), unitstart)
+        ):
+            return unitstart
+    return -1
+
+
+def _parsechunk(
+    storeclass: type[pofile],
+    text: bytes,
+    newline: bytes,
+    charset: str,
+    lineno: int,
+    width: int,
+    lazy: bool,
+) -> list[dict]:
+    """
+    Parses a part of a PO file in a worker process, see
+    :meth:`pofile._parallelparse`.
+
+    :return: The attributes of the units. The fields which are not set or
+             empty are left out, which makes them a lot faster to transfer
+             than the units.
+    """
+    store = storeclass(width=width, noheader=True)
+    separator = newline.decode()
+    lines = [line + separator for line in text.decode(charset).split(separator)]
+    return [
+        {
+            key: value
+            for key, value in unit._attributes().items()
+            if key != "wrapper"
+            and value is not None
+            and (value or type(value) is not list)
+        }
+        for unit in poparser.fast_iter_units(lines, store, charset, lazy, lineno)
+    ]
+
+
+def _restoreunit(
+    unitclass: type[pounit],
+    values: tuple,
+    attributes: dict | None,
+) -> pounit:
+    """
+    Recreates a pickled unit, see :meth:`pounit.__reduce__`.
+
+    This is a lot faster to load than the slots and their names, for
+    example from the cache of :func:`translate.storage.factory.getobject`.
+    """
+    unit = unitclass.__new__(unitclass)
+    for name, value in zip(pounit.__slots__, values, strict=True):
+        setattr(unit, name, value)
+    if attributes:
+        unit.__dict__.update(attributes)
+    return unit
+
+
+def iterlines(
+    inputfile: IO[bytes], chunksize: int = 1 << 16
+) -> tuple[Iterator[bytes], str]:
+    """
+    Split the lines of a binary file while reading it, like :func:`splitlines`.
+
+    Only the beginning of the file is read to detect the newline.
+
+    :return: An iterator over the lines and the newline.
+    """
+    text = inputfile.read(chunksize)
+    if text[:3] == b"\xef\xbb\xbf":
+        text = text[3:]
+    while True:
+        msgid_pos = max(text.find(b"\rmsgid "), text.find(b"\nmsgid "))
+        if (text.startswith(b"msgid ") or msgid_pos >= 0) and text.find(
+            b"\n", msgid_pos + 1
+        ) >= 0:
             break
-        if ch == 13:  # CR
-            # Check for CR, CRLF, or unusual patterns like \r\r\n
-            j = msgid_pos + i + 1
-            # Count consecutive CRs to handle patterns like \r\r\n
-            while j < len(text) and text[j] == 13:  # CR
-                j += 1
-            # Check if followed by LF
-            if j < len(text) and text[j] == 10:  # LF
-                # Use the entire pattern (CR(s) + LF) as the line ending
-                newline = text[msgid_pos + i : j + 1]
-            else:
-                # Just CR without LF
-                newline = b"\r"
+        chunk = inputfile.read(chunksize)
+        if not chunk:
             break
+        text += chunk
+    newline = detect_newline(text)
 
-    return [x + newline for x in text.split(newline)], newline.decode()
+    def lines(text: bytes) -> Generator[bytes]:
+        while True:
+            *complete, text = text.split(newline)
+            for line in complete:
+                yield line + newline
+            chunk = inputfile.read(chunksize)
+            if not chunk:
+                break
+            text += chunk
+        yield text + newline
+
+    return lines(text), newline.decode()
 
 
 def escapehandler(match: re.Match) -> str:
@@ -162,19 +339,36 @@ def quoteforpo(text: str | None, wrapper_obj: PoWrapper | None = None) -> list[s
     """Quotes the given text for a PO file, returning quoted and escaped lines."""
     if text is None:
         return []
-    if wrapper_obj is None:
-        wrapper_obj = PoWrapper()
-    text = escapeforpo(text)
-    if wrapper_obj.width == -1:
+    width = 77 if wrapper_obj is None else wrapper_obj.width
+    if (
+        text
+        and len(text) <= width - 6
+        and text.isascii()
+        and po_escape_re.search(text) is None
+    ):
+        # Fits on the msgid line as it is
         return [f'"{text}"']
+    return list(_quotelines(text, width))
+
+
+# The number of texts quoteforpo() keeps the quoted lines of, the same
+# strings are quoted over and over when merging and updating files
+QUOTE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=QUOTE_CACHE_SIZE)
+def _quotelines(text: str, width: int) -> tuple[str, ...]:
+    text = escapeforpo(text)
+    if width == -1:
+        return (f'"{text}"',)
 
-    lines = wrapper_obj.wrap(text)
+    lines = PoWrapper(width).wrap(text)
 
     polines = []
-    if len(lines) >= 2 or (lines and len(lines[0]) > wrapper_obj.width - 6):
+    if len(lines) >= 2 or (lines and len(lines[0]) > width - 6):
         polines.append('""')
     polines.extend(f'"{line}"' for line in lines)
-    return polines
+    return tuple(polines)
 
 
 def unescapehandler(match: re.Match) -> str:
@@ -216,6 +410,94 @@ def extractstr(string: str) -> str:
     return f'{string[left:]}"'
 
 
+# The raw fields of pounit, in the order they are written
+_FIELDS = (
+    "othercomments",
+    "automaticcomments",
+    "sourcecomments",
+    "typecomments",
+    "msgidcomments",
+    "prev_msgctxt",
+    "prev_msgid",
+    "prev_msgid_plural",
+    "msgctxt",
+    "msgid",
+    "msgid_pluralcomments",
+    "msgid_plural",
+    "msgstr",
+)
+# Reads the raw fields of a pounit as they are, None for the empty ones
+_getfields = operator.attrgetter(*(f"_{name}" for name in _FIELDS))
+
+
+def _field(name: str) -> property:
+    """
+    Returns the property of a raw field of :class:`pounit`.
+
+    The field is kept in the slot of the same name with a leading underscore,
+    which is None while it is empty, so that parsed units do not allocate the
+    empty fields. They become a new list on first access, and units parsed in
+    lazy mode read their fields then.
+    """
+    slot = f"_{name}"
+
+    def getfield(self):
+        value = getattr(self, slot)
+        if value is None:
+            if self._raw is not None:
+                self._loadfields()
+                return getattr(self, name)
+            value = []
+            setattr(self, slot, value)
+        return value
+
+    def setfield(self, value) -> None:
+        setattr(self, slot, value)
+
+    return property(getfield, setfield)
+
+
+class SourceBuffer:
+    """The content a :class:`pofile` was parsed from, see :meth:`pofile.serialize`."""
+
+    def __init__(
+        self, data: bytes, charset: str, newline: bytes, wrapper: PoWrapper
+    ) -> None:
+        self.data = data
+        self.charset = charset
+        self.newline = newline
+        self.wrapper = wrapper
+        # The offset of every line, computed on first use
+        self._offsets: array | None = None
+
+    def lines(self, first: int, stop: int | None) -> bytes:
+        """
+        Returns the lines from the line number first up to the line before
+        stop (or the end), without trailing blank lines.
+        """
+        lengths = self._offsets
+        if lengths is None:
+            # The length of all lines before a line, without newlines
+            lengths = self._offsets = array(
+                "q", accumulate(map(len, self.data.split(self.newline)), initial=0)
+            )
+        data = self.data
+        step = len(self.newline)
+        last = len(lengths) - 1 if stop is None else stop - 1
+        end = lengths[last] + last * step
+        while last > first:
+            start = lengths[last - 1] + (last - 1) * step
+            if data[start:end].strip():
+                break
+            last -= 1
+            end = start
+        lines = data[lengths[first - 1] + (first - 1) * step : end]
+        if end > len(data):
+            # The last line has no newline
+            lines += self.newline
+        return lines
+
+
 class pounit(pocommon.pounit):
     # othercomments = []      #   # this is another comment
     # automaticcomments = []  #   #. comment extracted from the source code
@@ -231,20 +513,97 @@ class pounit(pocommon.pounit):
 
     # Our homegrown way to indicate what must be copied in a shallow
     # fashion
-    __shallow__ = ["_store", "wrapper"]
-
-    def __init__(self, source=None, wrapper: PoWrapper | None = None, **kwargs) -> None:
+    __shallow__ = ["_store", "wrapper", "_rawsource"]
+
+    # Units are kept by the million, so keep them small. Other attributes go
+    # to the instance dictionary.
+    __slots__ = (
+        "_automaticcomments",
+        "_context",
+        "_dirty",
+        "_docpath",
+        "_line_number",
+        "_msgctxt",
+        "_msgid",
+        "_msgid_plural",
+        "_msgid_pluralcomments",
+        "_msgidcomments",
+        "_msgstr",
+        "_msgstrlen_cache",
+        "_othercomments",
+        "_prev_context",
+        "_prev_msgctxt",
+        "_prev_msgid",
+        "_prev_msgid_plural",
+        "_prev_source",
+        "_prev_target",
+        "_raw",
+        "_rawsource",
+        "_rich_source",
+        "_rich_target",
+        "_source_cache",
+        "_source_cache_key",
+        "_sourcecomments",
+        "_state_n",
+        "_store",
+        "_target_cache",
+        "_typecomments",
+        "_typecomments_cache",
+        "obsolete",
+        "wrapper",
+    )
+
+    # The raw lines of the unit, see _field() and poparser.fast_fields()
+    othercomments = _field("othercomments")
+    automaticcomments = _field("automaticcomments")
+    sourcecomments = _field("sourcecomments")
+    typecomments = _field("typecomments")
+    msgidcomments = _field("msgidcomments")
+    prev_msgctxt = _field("prev_msgctxt")
+    prev_msgid = _field("prev_msgid")
+    prev_msgid_plural = _field("prev_msgid_plural")
+    msgctxt = _field("msgctxt")
+    msgid = _field("msgid")
+    msgid_pluralcomments = _field("msgid_pluralcomments")
+    msgid_plural = _field("msgid_plural")
+    msgstr = _field("msgstr")
+
+    def __init__(
+        self,
+        source=None,
+        wrapper: PoWrapper | None = None,
+        raw: list[tuple[int, int, str, int]] | None = None,
+        **kwargs,
+    ) -> None:
         self.wrapper: PoWrapper | None = wrapper
         self.obsolete: bool = False
-        self._initallcomments(blankall=True)
-        self.prev_msgctxt: list[str] = []
-        self.prev_msgid: list[str] = []
-        self.prev_msgid_plural: list[str] = []
-        self.msgctxt: list[str] = []
-        self.msgid: list[str] = []
-        self.msgid_pluralcomments: list[str] = []
-        self.msgid_plural: list[str] = []
-        self.msgstr: list[str] | dict[int, list[str]] = []
+        self._raw: list[tuple[int, int, str, int]] | None = raw
+        self._othercomments: list[str] | None = None
+        self._automaticcomments: list[str] | None = None
+        self._sourcecomments: list[str] | None = None
+        self._typecomments: list[str] | None = None
+        self._msgidcomments: list[str] | None = None
+        self._prev_msgctxt: list[str] | None = None
+        self._prev_msgid: list[str] | None = None
+        self._prev_msgid_plural: list[str] | None = None
+        self._msgctxt: list[str] | None = None
+        self._msgid: list[str] | None = None
+        self._msgid_pluralcomments: list[str] | None = None
+        self._msgid_plural: list[str] | None = None
+        self._msgstr: list[str] | dict[int, list[str]] | None = None
+        # The SourceBuffer, first and stop line, and _rawkey() of a parsed
+        # unit, see pofile.serialize()
+        self._rawsource: tuple[SourceBuffer, int, int | None, tuple | None] | None = (
+            None
+        )
+        # Whether the unit was changed while parsing, or by one of the
+        # methods changing it
+        self._dirty = False
+        self._store = None
+        self._state_n = 0
+        self._line_number = None
+        self._rich_source = None
+        self._rich_target = None
         self._msgstrlen_cache: int | None = None
         self._typecomments_cache: list[str] | None = None
         self._source_cache: str | tuple[str, ...] | None = None
@@ -252,6 +611,93 @@ class pounit(pocommon.pounit):
         self._target_cache: str | tuple[str, ...] | None = None
         super().__init__(source)
 
+    def _extraattributes(self) -> dict | None:
+        """
+        Returns the attributes which are not in slots, without adding an
+        instance dictionary to units which have none.
+        """
+        state = object.__getstate__(self)
+        return state[0] if isinstance(state, tuple) else state
+
+    def _attributes(self) -> dict:
+        """Returns the attributes of the unit, like vars() for objects without slots."""
+        attributes = {name: getattr(self, name) for name in pounit.__slots__}
+        attributes.update(self._extraattributes() or ())
+        return attributes
+
+    def __reduce__(self):
+        """Pickles the values of the slots, see :func:`_restoreunit`."""
+        return _restoreunit, (
+            type(self),
+            tuple([getattr(self, name) for name in pounit.__slots__]),
+            self._extraattributes() or None,
+        )
+
+    def _loadfields(self) -> None:
+        """
+        Reads the fields of a unit parsed from tokens.
+
+        Fields set directly before the first access are kept.
+        """
+        raw = self._raw
+        if raw is not None:
+            self._raw = None
+            parsed = poparser.fast_fields(raw)
+            if self._rawsource is not None:
+                self._rawsource = (*self._rawsource[:3], self._rawkey(parsed))
+            for name, value in parsed.items():
+                slot = f"_{name}"
+                if value and getattr(self, slot) is None:
+                    setattr(self, slot, value)
+
+    def _rawkey(self, fields: dict | None = None) -> tuple:
+        """
+        Returns the content of the raw fields, to be able to tell whether the
+        unit changed since it was parsed.
+
+        :param fields: The fields to use instead of the ones of the unit.
+        """
+        if fields is None:
+            values = _getfields(self)
+        else:
+            values = [fields[name] for name in _FIELDS]
+        key = [self.obsolete]
+        for value in values[:-1]:
+            if value:
+                key.extend(value)
+            key.append(None)
+        msgstr = values[-1]
+        if isinstance(msgstr, dict):
+            key.extend((index, *strings) for index, strings in msgstr.items())
+        elif msgstr:
+            key.extend(msgstr)
+        return tuple(key)
+
+    def _isunchanged(self) -> bool:
+        """Returns whether the unit is the same as when it was parsed."""
+        if self._rawsource is None or self._dirty:
+            return False
+        raw = self._raw
+        if raw is not None:
+            if self.obsolete:
+                return False
+            if not any(_getfields(self)):
+                # None of the fields was read or set yet
+                for token in raw:
+                    if token[1] == poparser.TOKEN_MSGID:
+                        break
+                if token[2] != '""':
+                    return True
+            # Possibly a unit without msgid, or with fields set
+            self._loadfields()
+        return self._rawkey() == self._rawsource[3] and not self._isblank()
+
+    def _isblank(self) -> bool:
+        """Returns whether the unit has no msgid, and is not written as such."""
+        return is_null(self.msgid) and not (
+            self.isheader() or self.getcontext() or self.sourcecomments
+        )
+
     @property
     def newline(self):
         if self._store is not None:
@@ -327,6 +773,7 @@ class pounit(pocommon.pounit):
 
         :param source: an unescaped source string.
         """
+        self._loadfields()
         self._rich_source = None
         self._invalidate_source_cache()
         self.msgid, self.msgid_plural = self._set_source_vars(source)
@@ -345,6 +792,7 @@ class pounit(pocommon.pounit):
 
         :param source: an unescaped source string.
         """
+        self._loadfields()
         if source is None:
             self.prev_msgid = []
             self.prev_msgid_plural = []
@@ -360,6 +808,7 @@ class pounit(pocommon.pounit):
 
     @prev_context.setter
     def prev_context(self, context) -> None:
+        self._loadfields()
         self.prev_msgctxt = self.quote(context) if context else []
 
     @property
@@ -453,9 +902,9 @@ class pounit(pocommon.pounit):
             for line in text.split(self.newline)
         ]
         if position == "append":
-            newcomments = commentlist + newcomments
+            newcomments = [*commentlist, *newcomments]
         elif position == "prepend":
-            newcomments += commentlist
+            newcomments.extend(commentlist)
 
         if autocomments:
             self.automaticcomments = newcomments
@@ -464,16 +913,18 @@ class pounit(pocommon.pounit):
 
     def removenotes(self, origin=None) -> None:
         """Remove all the translator's notes (other comments)."""
+        self._loadfields()
         self.othercomments = []
 
     def __deepcopy__(self, memo={}):
+        self._loadfields()
         # Make an instance to serve as the copy
         new_unit = self.__class__()
         # We'll be testing membership frequently, so make a set from
         # self.__shallow__
         shallow = set(self.__shallow__)
         # Make deep copies of all members which are not in shallow
-        for key, value in self.__dict__.items():
+        for key, value in self._attributes().items():
             if key not in shallow:
                 setattr(new_unit, key, copy.deepcopy(value))
         # Make shallow copies of all members which are in shallow
@@ -570,9 +1021,16 @@ class pounit(pocommon.pounit):
                 # We don't bring across otherunit.automaticcomments as we
                 # consider ourself to be the the authority.  Same applies
                 # to otherunit.msgidcomments
-                mergelists(self.automaticcomments, otherunit.automaticcomments)
+                mergelists(
+                    self.automaticcomments,
+                    otherunit.automaticcomments,
+                )
                 mergelists(self.msgidcomments, otherunit.msgidcomments)
-                mergelists(self.sourcecomments, otherunit.sourcecomments, split=True)
+                mergelists(
+                    self.sourcecomments,
+                    otherunit.sourcecomments,
+                    split=True,
+                )
         if not self.istranslated() or overwrite:
             # Remove kde-style comments from the translation (if any).
             if self._extract_msgidcomments(otherunit.target):
@@ -659,6 +1117,7 @@ class pounit(pocommon.pounit):
                 self._typecomments_cache.append(typecomment)  # ty:ignore[unresolved-attribute]
             else:
                 self._typecomments_cache.remove(typecomment)  # ty:ignore[unresolved-attribute]
+            self._dirty = True
             if self._typecomments_cache:
                 self._typecomments_cache.sort()
                 comments_str = ", ".join(self._typecomments_cache)
@@ -696,6 +1155,8 @@ class pounit(pocommon.pounit):
         self.obsolete = True
         # Historically gettext did not preserve these comment types on obsolete
         # units, so we keep dropping them here for compatibility.
+        if self.sourcecomments or self.automaticcomments:
+            self._dirty = True
         self.sourcecomments = []
         self.automaticcomments = []
 
@@ -766,6 +1227,26 @@ class pounit(pocommon.pounit):
 
     def _getoutput(self):
         """Return this po element as a string."""
+        # Read the fields without adding the empty ones
+        if self._raw is not None:
+            self._loadfields()
+        (
+            othercomments,
+            automaticcomments,
+            sourcecomments,
+            typecomments,
+            msgidcomments,
+            prev_msgctxt,
+            prev_msgid,
+            prev_msgid_plural,
+            msgctxt,
+            msgid,
+            msgid_pluralcomments,
+            msgid_plural,
+            msgstr,
+        ) = _getfields(self)
+        msgid = msgid or ()
+        msgstr = msgstr or ()
 
         def add_prev_msgid_lines(lines, prefix, header, var) -> None:
             if var:
@@ -773,28 +1254,28 @@ class pounit(pocommon.pounit):
                 lines.extend(f"{prefix} {line}\n" for line in var[1:])
 
         def add_prev_msgid_info(lines, prefix) -> None:
-            add_prev_msgid_lines(lines, prefix, "msgctxt", self.prev_msgctxt)
-            add_prev_msgid_lines(lines, prefix, "msgid", self.prev_msgid)
-            add_prev_msgid_lines(lines, prefix, "msgid_plural", self.prev_msgid_plural)
+            add_prev_msgid_lines(lines, prefix, "msgctxt", prev_msgctxt)
+            add_prev_msgid_lines(lines, prefix, "msgid", prev_msgid)
+            add_prev_msgid_lines(lines, prefix, "msgid_plural", prev_msgid_plural)
 
         lines = []
-        lines.extend(self.othercomments)
+        if othercomments:
+            lines.extend(othercomments)
         if self.isobsolete():
-            lines.extend(self.typecomments)
+            if typecomments:
+                lines.extend(typecomments)
             obsoletelines = []
             add_prev_msgid_info(obsoletelines, prefix="#~|")
-            if self.msgctxt:
-                obsoletelines.append(self._getmsgpartstr("#~ msgctxt", self.msgctxt))
-            obsoletelines.append(
-                self._getmsgpartstr("#~ msgid", self.msgid, self.msgidcomments)
-            )
-            if self.msgid_plural or self.msgid_pluralcomments:
+            if msgctxt:
+                obsoletelines.append(self._getmsgpartstr("#~ msgctxt", msgctxt))
+            obsoletelines.append(self._getmsgpartstr("#~ msgid", msgid, msgidcomments))
+            if msgid_plural or msgid_pluralcomments:
                 obsoletelines.append(
                     self._getmsgpartstr(
-                        "#~ msgid_plural", self.msgid_plural, self.msgid_pluralcomments
+                        "#~ msgid_plural", msgid_plural or (), msgid_pluralcomments
                     )
                 )
-            obsoletelines.append(self._getmsgpartstr("#~ msgstr", self.msgstr))
+            obsoletelines.append(self._getmsgpartstr("#~ msgstr", msgstr))
             for index, obsoleteline in enumerate(obsoletelines):
                 # We need to account for a multiline msgid or msgstr here
                 obsoletelines[index] = obsoleteline.replace('\n"', '\n#~ "')
@@ -803,24 +1284,22 @@ class pounit(pocommon.pounit):
         # if there's no msgid don't do msgid and string, unless we're the
         # header this will also discard any comments other than plain
         # othercomments...
-        if is_null(self.msgid) and not (
-            self.isheader() or self.getcontext() or self.sourcecomments
-        ):
+        if self._isblank():
             return "".join(lines)
-        lines.extend(self.automaticcomments)
-        lines.extend(self.sourcecomments)
-        lines.extend(self.typecomments)
+        for comments in (automaticcomments, sourcecomments, typecomments):
+            if comments:
+                lines.extend(comments)
         add_prev_msgid_info(lines, prefix="#|")
-        if self.msgctxt:
-            lines.append(self._getmsgpartstr("msgctxt", self.msgctxt))
-        lines.append(self._getmsgpartstr("msgid", self.msgid, self.msgidcomments))
-        if self.msgid_plural or self.msgid_pluralcomments:
+        if msgctxt:
+            lines.append(self._getmsgpartstr("msgctxt", msgctxt))
+        lines.append(self._getmsgpartstr("msgid", msgid, msgidcomments))
+        if msgid_plural or msgid_pluralcomments:
             lines.append(
                 self._getmsgpartstr(
-                    "msgid_plural", self.msgid_plural, self.msgid_pluralcomments
+                    "msgid_plural", msgid_plural or (), msgid_pluralcomments
                 )
             )
-        lines.append(self._getmsgpartstr("msgstr", self.msgstr))
+        lines.append(self._getmsgpartstr("msgstr", msgstr))
         return "".join(lines)
 
     def getlocations(self):
@@ -860,6 +1339,7 @@ class pounit(pocommon.pounit):
         return text.split(self.newline)[0].replace("_: ", "", 1)
 
     def setmsgidcomment(self, msgidcomment) -> None:
+        self._loadfields()
         if msgidcomment:
             self.msgidcomments = [f'"_: {msgidcomment}\\n"']
         else:
@@ -876,6 +1356,7 @@ class pounit(pocommon.pounit):
         return unquotefrompo(self.msgctxt)
 
     def setcontext(self, context) -> None:
+        self._loadfields()
         self.msgctxt = self.quote(context)
 
     def getid(self):
@@ -898,8 +1379,20 @@ class pofile(pocommon.pofile[pounit]):
     """A .po file containing various units."""
 
     UnitClass = pounit
-
-    def __init__(self, inputfile=None, width=None, **kwargs) -> None:
+    # Whether to use poparser.fast_iter_units() for decoded files
+    fast_parser = True
+    # Whether units of decoded files read their fields only on first access
+    lazy_units = False
+    # The number of processes parsing big files, see _parallelparse()
+    parse_jobs = 1
+    # Whether serialize() writes unchanged units as they were parsed, instead
+    # of normalizing them. Every unit then keeps what it was parsed from, so
+    # this is only done on request, like for properties and DTD files.
+    passthrough = False
+
+    def __init__(self, inputfile=None, width=None, passthrough=None, **kwargs) -> None:
+        if passthrough is not None:
+            self.passthrough = passthrough
         wrapargs = {}
         if width is not None:
             wrapargs = {"width": width}
@@ -907,8 +1400,8 @@ class pofile(pocommon.pofile[pounit]):
         self.newline = "\n"
         super().__init__(inputfile, **kwargs)
 
-    def create_unit(self) -> pounit:
-        return self.UnitClass(wrapper=self.wrapper)
+    def create_unit(self, **kwargs) -> pounit:
+        return self.UnitClass(wrapper=self.wrapper, **kwargs)
 
     def parse(self, input) -> None:  # ty:ignore[invalid-method-override]
         """Parses the given file or file source string."""
@@ -918,10 +1411,126 @@ class pofile(pocommon.pofile[pounit]):
             self.filename = ""
         if not isinstance(input, bytes):
             input = input.read()
-        lines, self.newline = splitlines(input)
         # clear units to get rid of automatically generated headers before parsing
         self.units = []
-        poparser.parse_units(poparser.PoParseState(lines, self.create_unit), self)
+        if input[:3] == b"\xef\xbb\xbf":
+            input = input[3:]
+        newline = detect_newline(input)
+        self.newline = newline.decode()
+        units = None
+        if self.parse_jobs > 1:
+            units = self._parallelparse(input, newline)
+        if units is not None:
+            charset = self._encoding
+        else:
+            decoded = decodelines(input, newline)
+            if decoded is None:
+                # Decode line by line, falling back to ISO-8859-1 as needed
+                charset = None
+                units = poparser.iter_units(
+                    poparser.PoParseState(
+                        iterbufferlines(input, newline), self.create_unit
+                    ),
+                    self,
+                )
+            elif self.fast_parser:
+                lines, charset = decoded
+                units = poparser.fast_iter_units(lines, self, charset, self.lazy_units)
+            else:
+                lines, charset = decoded
+                units = poparser.iter_units(
+                    poparser.PoParseState(lines, self.create_unit, charset), self
+                )
+        for unit in units:
+            self.addunit(unit)
+        if charset is not None and self.passthrough:
+            self._keepsource(SourceBuffer(input, charset, newline, self.wrapper))
+
+    def _keepsource(self, source: SourceBuffer) -> None:
+        """Remembers the lines of source every unit was parsed from."""
+        units = self.units
+        for index, unit in enumerate(units, 1):
+            first = unit._line_number
+            stop = units[index]._line_number if index < len(units) else None
+            if unit._dirty or first is None or (stop is not None and stop <= first):
+                continue
+            if unit._raw is not None:
+                key = None
+            elif unit.msgidcomments:
+                # Rewrapped by _getoutput()
+                continue
+            else:
+                key = unit._rawkey()
+            unit._rawsource = (source, first, stop, key)
+
+    def _parallelparse(self, input: bytes, newline: bytes) -> list[pounit] | None:
+        """
+        Parses a big file in several processes.
+
+        Once the header gave the charset, the file is split at blank lines
+        between units (see :func:`unitboundary`) into up to
+        :attr:`parse_jobs` chunks of at least :data:`PARALLEL_CHUNK_SIZE`
+        bytes, which are decoded and parsed by :func:`_parsechunk` in a
+        process pool.
+
+        :return: The units, or None if the file has to be parsed at once,
+                 for example because it is small or has syntax errors.
+        """
+        chunks = min(self.parse_jobs, len(input) // PARALLEL_CHUNK_SIZE)
+        if chunks < 2:
+            return None
+        try:
+            charset = poparser.detect_charset(iterbufferlines(input, newline), pounit)
+            if newline.decode(charset) != self.newline:
+                return None
+        except (LookupError, UnicodeDecodeError, poparser.PoParseError):
+            return None
+        offsets = [0]
+        for index in range(1, chunks):
+            start = max(index * len(input) // chunks, offsets[-1] + 1)
+            offset = unitboundary(input, newline, start)
+            if offset < 0:
+                break
+            offsets.append(offset)
+        if len(offsets) < 2:
+            return None
+        offsets.append(len(input))
+        parts = [input[start:end] for start, end in pairwise(offsets)]
+        linenos = [input.count(newline, 0, offset) for offset in offsets[:-1]]
+        # Spawn the workers, forking a possibly multi-threaded process is not
+        # safe
+        with ProcessPoolExecutor(
+            len(parts), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = executor.map(
+                _parsechunk,
+                repeat(type(self)),
+                parts,
+                repeat(newline),
+                repeat(charset),
+                linenos,
+                repeat(self.wrapper.width),
+                repeat(self.lazy_units),
+            )
+            try:
+                units = [
+                    self._restoreparsed(attributes)
+                    for chunk in results
+                    for attributes in chunk
+                ]
+            except Exception:
+                # Parse at once to report errors as usual
+                return None
+        self._encoding = charset
+        return units
+
+    def _restoreparsed(self, attributes: dict) -> pounit:
+        """Creates a unit from the attributes returned by :func:`_parsechunk`."""
+        raw = attributes.pop("_raw", None)
+        unit = self.create_unit() if raw is None else self.create_unit(raw=raw)
+        for name, value in attributes.items():
+            setattr(unit, name, value)
+        return unit
 
     def removeduplicates(self, duplicatestyle: str = "merge") -> None:
         """
@@ -978,15 +1587,15 @@ class pofile(pocommon.pofile[pounit]):
         self.units = uniqueunits
 
     def serialize(self, out: IO[bytes]) -> None:
-        """Write to file."""
-        at_start = True
+        """
+        Write to file.
+
+        With :attr:`passthrough`, units which did not change since they were
+        parsed are written as they were in the parsed file, as long as the
+        encoding, newlines and wrapping width did not change either.
+        """
         try:
-            for unit in self.units:
-                if not at_start:
-                    out.write(self.newline.encode())
-                else:
-                    at_start = False
-                out.write(unit._getoutput().encode(self.encoding))
+            self._serializeunits(out)
         except UnicodeEncodeError:
             if self.encoding == "utf-8":
                 raise
@@ -995,6 +1604,36 @@ class pofile(pocommon.pofile[pounit]):
             out.seek(0)
             self.serialize(out)
 
+    def _serializeunits(self, out: IO[bytes]) -> None:
+        at_start = True
+        newline = self.newline.encode()
+        # Whether the units of a SourceBuffer can be written as they are
+        sources: dict[SourceBuffer, bool] = {}
+        for unit in self.units:
+            if not at_start:
+                out.write(newline)
+            else:
+                at_start = False
+            rawsource = unit._rawsource
+            if rawsource is not None and self.passthrough:
+                source = rawsource[0]
+                if source not in sources:
+                    sources[source] = (
+                        source.newline == newline
+                        and source.wrapper == self.wrapper
+                        and self._samecharset(source.charset)
+                    )
+                if sources[source] and unit._isunchanged():
+                    out.write(source.lines(rawsource[1], rawsource[2]))
+                    continue
+            out.write(unit._getoutput().encode(self.encoding))
+
+    def _samecharset(self, charset: str) -> bool:
+        try:
+            return codecs.lookup(charset).name == codecs.lookup(self.encoding).name
+        except LookupError:
+            return False
+
     def unit_iter(self) -> Generator[pounit]:
         for unit in self.units:
             if not (unit.isheader() or unit.isobsolete()):
@@ -1006,3 +1645,54 @@ class pofile(pocommon.pofile[pounit]):
         super().addunit(unit)
         if needs_update:
             unit.target = unit.target
+
+
+def iterparse(inputfile, width: int | None = None) -> Generator[pounit]:
+    """
+    Parses a PO file, yielding its units one at a time.
+
+    Unlike :class:`pofile`, the units are not collected, so files of any size
+    can be processed in constant memory. The units belong to a
+    :class:`pofile` which holds only the header unit, so that the file
+    encoding and header stay available.
+
+    :param inputfile: A binary file object or a file name.
+    :param width: The wrapping width of the units, see :class:`pofile`.
+    """
+    if isinstance(inputfile, (str, os.PathLike)):
+        with open(inputfile, "rb") as handle:
+            yield from iterparse(handle, width)
+        return
+    store = pofile(width=width, noheader=True)
+    store.filename = getattr(inputfile, "name", "")
+    lines, store.newline = iterlines(inputfile)
+    parse_state = poparser.PoParseState(lines, store.create_unit)
+    for unit in poparser.iter_units(parse_state, store):
+        if not store.units and unit.isheader():
+            store.addunit(unit)
+        else:
+            unit._store = store
+        yield unit
+
+
+def writeunits(
+    units: Iterable[pounit], out: IO[bytes], encoding: str | None = None
+) -> None:
+    """
+    Writes units to a binary file one at a time, like :meth:`pofile.serialize`.
+
+    This is the counterpart of :func:`iterparse`, the units are consumed
+    while writing.
+
+    :param encoding: The output encoding, defaults to the encoding of the
+                     store of the first unit.
+    """
+    newline = b"\n"
+    for index, unit in enumerate(units):
+        if index == 0:
+            if encoding is None:
+                encoding = unit._store.encoding if unit._store else "utf-8"
+            newline = unit.newline.encode()
+        else:
+            out.write(newline)
+        out.write(unit._getoutput().encode(encoding))
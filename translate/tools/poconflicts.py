@@ -94,6 +94,9 @@ class ConflictOptionParser(optrecurse.RecursiveOptionParser):
         else:
             super().set_usage(usage)
 
+    def setjobsoption(self) -> None:
+        """All the files are combined, so --jobs is not offered."""
+
     def recursiveprocess(self, options) -> None:
         """Recurse through directories and process files."""
         if self.isrecursive(options.input, "input") and getattr(
@@ -38,13 +38,18 @@ from collections import defaultdict
 from dataclasses import dataclass
 from functools import cached_property
 from operator import itemgetter
-from typing import BinaryIO, TypedDict, cast
+from typing import TYPE_CHECKING, BinaryIO, TypedDict, cast
 
 from translate.lang.common import Common
 from translate.misc.multistring import multistring
-from translate.storage import factory
+from translate.storage import factory, po, pypo
 from translate.storage.workflow import StateEnum
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from translate.storage.base import TranslationUnit
+
 extended_state_strings: dict[StateEnum | int, str] = {
     StateEnum.EMPTY: "empty",
     StateEnum.NEEDS_WORK: "needs-work",
@@ -171,14 +176,34 @@ class StatsDict(TypedDict, total=False):
     extended: dict[str, StatsDict]
 
 
+def iterunits(filename: str | BinaryIO) -> Iterable[TranslationUnit]:
+    """
+    Returns the units of a file.
+
+    Gettext PO files are parsed one unit at a time, so that files of any size
+    can be counted in constant memory.
+    """
+    if (
+        isinstance(filename, str)
+        and filename.endswith((".po", ".pot"))
+        and po.pofile is pypo.pofile
+    ):
+        return pypo.iterparse(filename)
+    return factory.getobject(filename).units
+
+
 def calcstats(filename: str | BinaryIO) -> StatsDict:
-    # ignore totally blank or header units
     try:
-        store = factory.getobject(filename)
+        return calcunitstats(filename, iterunits(filename))
     except ValueError as e:
         logger.warning("Error in %s: %s", filename, e)
         return {}
 
+
+def calcunitstats(
+    filename: str | BinaryIO, units: Iterable[TranslationUnit]
+) -> StatsDict:
+    # ignore totally blank or header units
     # Initialize counters
     stats: StatsDict = {"filename": filename}
     stats["translated"] = 0
@@ -195,7 +220,7 @@ def calcstats(filename: str | BinaryIO) -> StatsDict:
     extended_stats: dict[str, StatsDict] = {}
 
     # Single pass through all units
-    for unit in store.units:
+    for unit in units:
         if not unit.istranslatable():
             continue
 
@@ -49,6 +49,9 @@ class SplitOptionParser(optrecurse.RecursiveOptionParser):
         else:
             super().set_usage(usage)
 
+    def setjobsoption(self) -> None:
+        """All the files are combined, so --jobs is not offered."""
+
     def recursiveprocess(self, options) -> None:
         """Recurse through directories and process files."""
         if not self.isrecursive(options.output, "output"):
@@ -508,6 +508,9 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
         )
         self.recursiveprocess(options)
 
+    def setjobsoption(self) -> None:
+        """All the files are combined, so --jobs is not offered."""
+
     def recursiveprocess(self, options) -> None:
         """Recurse through directories and process files."""
         if self.isrecursive(options.input, "input") and getattr(
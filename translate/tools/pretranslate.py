@@ -24,32 +24,74 @@ See: https://docs.translatehouse.org/projects/translate-toolkit/en/latest/comman
 for examples and usage instructions.
 """
 
+import contextlib
+import logging
+
 from translate.convert import convert
-from translate.search import match
+from translate.search import match, tmindex
 from translate.storage import factory
 
+logger = logging.getLogger(__name__)
+
 # We don't want to reinitialise the TM each time, so let's store it here.
 tmmatcher = None
+# Fuzzy matching results of the TM, shared by all processed files.
+tmcache = None
+
+
+def memory(
+    tmfiles,
+    max_candidates=1,
+    min_similarity=75,
+    max_length=1000,
+    tm_index=None,
+    tm_cache=None,
+):
+    """
+    Returns the TM store to use. Only initialises on first call.
 
+    If tm_index is given, the TM is loaded from the
+    :class:`~translate.search.tmindex.TMIndex` in that file, which is updated
+    first for TM files changed since the previous run. The matcher loads its
+    candidates from the index as long as the TM does not change.
 
-def memory(tmfiles, max_candidates=1, min_similarity=75, max_length=1000):
-    """Returns the TM store to use. Only initialises on first call."""
-    global tmmatcher  # ruff:ignore[global-statement]
+    The matching results are cached in :data:`tmcache`, which is persisted
+    in the file tm_cache by :func:`save_memory_cache` if given.
+    """
+    global tmmatcher, tmcache  # ruff:ignore[global-statement]
     # Only initialise first time
     if tmmatcher is None:
-        if isinstance(tmfiles, list):
-            tmstore = [factory.getobject(tmfile) for tmfile in tmfiles]
-        else:
-            tmstore = factory.getobject(tmfiles)
-        tmmatcher = match.matcher(
-            tmstore,
-            max_candidates=max_candidates,
-            min_similarity=min_similarity,
-            max_length=max_length,
-        )
+        tmcache = match.MatchCache(filename=tm_cache)
+        with contextlib.ExitStack() as stack:
+            if tm_index is not None:
+                tmstore = stack.enter_context(tmindex.TMIndex(tm_index))
+                tmstore.update(tmfiles)
+            elif isinstance(tmfiles, list):
+                tmstore = [factory.getobject(tmfile) for tmfile in tmfiles]
+            else:
+                tmstore = factory.getobject(tmfiles)
+            tmmatcher = match.matcher(
+                tmstore,
+                max_candidates=max_candidates,
+                min_similarity=min_similarity,
+                max_length=max_length,
+                ngram_size=3,
+                cache=tmcache,
+            )
     return tmmatcher
 
 
+def save_memory_cache() -> None:
+    """Saves the TM match cache, and logs its statistics."""
+    if tmcache is None:
+        return
+    logger.info(
+        "TM match cache: %(hits)d hits, %(misses)d misses, %(size)d entries",
+        tmcache.stats(),
+    )
+    tmcache.save()
+
+
 def pretranslate_file(
     input_file,
     output_file,
@@ -57,6 +99,9 @@ def pretranslate_file(
     tm=None,
     min_similarity=75,
     fuzzymatching=True,
+    tm_index=None,
+    fuzzy_jobs=1,
+    tm_cache=None,
 ) -> int:
     """
     Pretranslate any factory supported file with old translations and
@@ -68,7 +113,14 @@ def pretranslate_file(
         template_store = factory.getobject(template_file)
 
     output = pretranslate_store(
-        input_store, template_store, tm, min_similarity, fuzzymatching
+        input_store,
+        template_store,
+        tm,
+        min_similarity,
+        fuzzymatching,
+        tm_index,
+        fuzzy_jobs,
+        tm_cache,
     )
     output.serialize(output_file)
     return 1
@@ -120,8 +172,76 @@ def match_fuzzy(input_unit, matchers):
     return None
 
 
+def match_fuzzy_many(input_units, matchers, processes=1):
+    """
+    Return fuzzy matches for many units from a queue of matchers.
+
+    :return: A dictionary mapping source text of the units to the best
+        match.
+    """
+    fuzzy_matches = {}
+    sources = list(dict.fromkeys(input_unit.source for input_unit in input_units))
+    for matcher in matchers:
+        if not sources:
+            break
+        for source, fuzzycandidates in zip(
+            sources, matcher.matches_many(sources, processes), strict=True
+        ):
+            if fuzzycandidates:
+                fuzzy_matches[source] = fuzzycandidates[0]
+        sources = [source for source in sources if source not in fuzzy_matches]
+    return fuzzy_matches
+
+
+def match_template(input_unit, template_store, merge_on="id"):
+    """Returns a matching unit from a template, matching on merge_on."""
+    if not template_store:
+        return None
+    # :param:`merge_on` supports `location` and `id` for now
+    if merge_on == "location":
+        return match_template_location(input_unit, template_store)
+    return match_template_id(input_unit, template_store)
+
+
+def needs_fuzzy_match(input_unit, template_store, merge_on="id") -> bool:
+    """Whether a unit will not find a translation without fuzzy matching."""
+    matching_unit = match_template(input_unit, template_store, merge_on)
+    if matching_unit and matching_unit.gettargetlen() > 0:
+        return False
+    if template_store:
+        matching_unit = match_source(input_unit, template_store)
+        if matching_unit and matching_unit.gettargetlen() > 0:
+            return False
+    return True
+
+
+def prepare_fuzzy_matches(
+    input_units, template_store, matchers, merge_on="id", processes=1
+):
+    """
+    Do fuzzy matching in one batch for the units which will need it.
+
+    The result can be passed as fuzzy_matches to :func:`pretranslate_unit`.
+    """
+    return match_fuzzy_many(
+        [
+            input_unit
+            for input_unit in input_units
+            if input_unit.istranslatable()
+            and needs_fuzzy_match(input_unit, template_store, merge_on)
+        ],
+        matchers,
+        processes,
+    )
+
+
 def pretranslate_unit(
-    input_unit, template_store, matchers=None, mark_reused=False, merge_on="id"
+    input_unit,
+    template_store,
+    matchers=None,
+    mark_reused=False,
+    merge_on="id",
+    fuzzy_matches=None,
 ):
     """
     Pretranslate a unit or return unchanged if no translation was found.
@@ -132,16 +252,11 @@ def pretranslate_unit(
         objects.
     :param mark_reused: Whether to mark old translations as reused or not.
     :param merge_on: Where will the merge matching happen on.
+    :param fuzzy_matches: Fuzzy matches computed upfront by
+        :func:`prepare_fuzzy_matches`, used instead of querying matchers.
     """
-    matching_unit = None
-
     # Do template matching
-    if template_store:
-        # :param:`merge_on` supports `location` and `id` for now
-        if merge_on == "location":
-            matching_unit = match_template_location(input_unit, template_store)
-        else:
-            matching_unit = match_template_id(input_unit, template_store)
+    matching_unit = match_template(input_unit, template_store, merge_on)
 
     if matching_unit and matching_unit.gettargetlen() > 0:
         input_unit.merge(matching_unit, authoritative=True)
@@ -151,7 +266,10 @@ def pretranslate_unit(
 
         if not matching_unit or not matching_unit.gettargetlen():
             # do fuzzy matching
-            matching_unit = match_fuzzy(input_unit, matchers)
+            if fuzzy_matches is not None:
+                matching_unit = fuzzy_matches.get(input_unit.source)
+            else:
+                matching_unit = match_fuzzy(input_unit, matchers)
 
         if matching_unit and matching_unit.gettargetlen() > 0:
             # FIXME: should we dispatch here instead of this crude attr check
@@ -174,7 +292,14 @@ def pretranslate_unit(
 
 
 def pretranslate_store(
-    input_store, template_store, tm=None, min_similarity=75, fuzzymatching=True
+    input_store,
+    template_store,
+    tm=None,
+    min_similarity=75,
+    fuzzymatching=True,
+    tm_index=None,
+    fuzzy_jobs=1,
+    tm_cache=None,
 ):
     """Do the actual pretranslation of a whole store."""
     # preparation
@@ -205,16 +330,35 @@ def pretranslate_store(
     if tm and fuzzymatching:
         # FIXME: max_length hardcoded
         matcher = memory(
-            tm, max_candidates=1, min_similarity=min_similarity, max_length=1000
+            tm,
+            max_candidates=1,
+            min_similarity=min_similarity,
+            max_length=1000,
+            tm_index=tm_index,
+            tm_cache=tm_cache,
         )
         matcher.addpercentage = False
         matchers.append(matcher)
 
+    fuzzy_matches = None
+    if matchers:
+        fuzzy_matches = prepare_fuzzy_matches(
+            input_store.units,
+            template_store,
+            matchers,
+            merge_on=input_store.merge_on,
+            processes=fuzzy_jobs,
+        )
+
     # Main loop
     for input_unit in input_store.units:
         if input_unit.istranslatable():
             pretranslate_unit(
-                input_unit, template_store, matchers, merge_on=input_store.merge_on
+                input_unit,
+                template_store,
+                matchers,
+                merge_on=input_store.merge_on,
+                fuzzy_matches=fuzzy_matches,
             )
 
     return input_store
@@ -242,6 +386,30 @@ def main(argv=None) -> None:
         help="The file to use as translation memory when fuzzy matching",
     )
     parser.passthrough.append("tm")
+    # A changed translation memory changes the output
+    parser.manifestfiles.append("tm")
+    parser.add_option(
+        "",
+        "--tm-index",
+        dest="tm_index",
+        default=None,
+        metavar="INDEX",
+        help="Keep the translation memory in this index file, so it is only reparsed when it changes",
+    )
+    parser.passthrough.append("tm_index")
+    # Only caches the parsing of --tm
+    parser.manifestignored.append("tm_index")
+    parser.add_option(
+        "",
+        "--tm-cache",
+        dest="tm_cache",
+        default=None,
+        metavar="CACHE",
+        help="Keep the translation memory matches in this cache file for later runs",
+    )
+    parser.passthrough.append("tm_cache")
+    # Only caches the matches
+    parser.manifestignored.append("tm_cache")
     defaultsimilarity = 75
     parser.add_option(
         "-s",
@@ -260,7 +428,19 @@ def main(argv=None) -> None:
         help="Disable fuzzy matching",
     )
     parser.passthrough.append("fuzzymatching")
+    parser.add_option(
+        "",
+        "--fuzzy-jobs",
+        dest="fuzzy_jobs",
+        default=1,
+        type="int",
+        metavar="JOBS",
+        help="Number of processes to use for fuzzy matching (default: 1)",
+    )
+    parser.passthrough.append("fuzzy_jobs")
+    parser.manifestignored.append("fuzzy_jobs")
     parser.run(argv)
+    save_memory_cache()
 
 
 if __name__ == "__main__":